@@ -1,13 +1,26 @@
 # -*- coding: utf-8 -*-
+import importlib
 import socket
 import ssl
 import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ReadTimeout, SSLError
 
 from YMContent.constants import *
-from YMContent.response import *
 from YMContent.exceptions import *
+from YMContent.ratelimit import KeyPool, is_fields_all
+from YMContent.concurrency import AIMDController
+from YMContent.retry import RetryPolicy
+from YMContent.hedging import HedgingPolicy
+from YMContent.breaker import CircuitBreaker
+from YMContent.coalesce import SingleFlight, request_key
+from YMContent.decoding import get_decoder
+from YMContent.diagnostics import CurlCommand
 
 __title__ = 'YMContent'
 __version__ = constants.VERSION
@@ -16,62 +29,370 @@ __license__ = 'Apache 2.0'
 
 logger = logging.getLogger('YMContent')
 
+PAGE_SIZE = 30
+
+# классы, которые загружаются при первом обращении; остальные имена ищутся в YMContent.response,
+# куда входят и все классы YMContent.objects
+_LAZY = {
+    'AsyncYMAPI': 'YMContent.aio',
+    'CategoryTree': 'YMContent.index',
+    'RegionIndex': 'YMContent.index',
+    'VendorIndex': 'YMContent.index',
+}
+
+
+def _load(name):
+    value = globals().get(name)
+    if value is None:
+        module = importlib.import_module(_LAZY.get(name, 'YMContent.response'))
+        value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __getattr__(name):
+    """
+    Загрузка классов ответов, объектов, AsyncYMAPI и индексов при первом обращении
+
+    Модули response и objects занимают большую часть времени импорта пакета, поэтому они не загружаются,
+    пока не понадобятся: ``YMContent.YMOffer`` и ``from YMContent import Categories`` работают как прежде.
+    """
+    if name == '__all__':
+        from YMContent import response
+        names = set(k for k in globals() if not k.startswith('_'))
+        names.update(k for k in vars(response) if not k.startswith('_'))
+        names.update(_LAZY)
+        return sorted(names)
+    if name.startswith('__'):
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+    try:
+        return _load(name)
+    except AttributeError:
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+
+def _iterator(method):
+    def iterate(self, *args, **kwargs):
+        return self.iter_items(method, *args, **kwargs)
+
+    iterate.__name__ = 'iter_{}'.format(method)
+    iterate.__doc__ = """
+        Итератор по элементам всех страниц ответа :meth:`{}`
+
+        Принимает те же параметры, кроме count и page, а также prefetch.
+
+        :return: Элементы всех страниц
+        :rtype: generator
+        """.format(method)
+    return iterate
+
 
 class YMAPI(object):
     """
 
-    :param authorization_key: Авторизационный ключ
-    :type authorization_key: str
+    :param authorization_key: Авторизационный ключ, список ключей или пул ключей. Из нескольких ключей
+        для каждого запроса выбирается ключ с наибольшим запасом квоты
+    :type authorization_key: str or list[str] or YMContent.ratelimit.KeyPool
+
+    :param max_workers: Количество потоков для :meth:`map` и :meth:`batch` и размер пула соединений
+    :type max_workers: int
+
+    :param rate_limiter: Ограничитель запросов, общий для всех потоков клиента, или фабрика ограничителей
+        для нескольких ключей. По умолчанию создается новый
+    :type rate_limiter: YMContent.ratelimit.RateLimiter or callable
+
+    :param concurrency: Адаптивное ограничение одновременных запросов в :meth:`map`, :meth:`batch` и
+        :meth:`iter_pages` с parallel=True. True — :class:`~YMContent.concurrency.AIMDController` с
+        максимумом max_workers
+    :type concurrency: bool or YMContent.concurrency.AIMDController
+
+    :param retry: Политика повторных запросов при сетевых ошибках, ответах 5xx, 420 и 429.
+        По умолчанию :class:`~YMContent.retry.RetryPolicy`, False — без повторов
+    :type retry: YMContent.retry.RetryPolicy or bool
+
+    :param hedging: Дублирующие запросы для чувствительных к задержке ресурсов (suggestions, redirect,
+        model_offers_default). True — :class:`~YMContent.hedging.HedgingPolicy` по умолчанию
+    :type hedging: bool or YMContent.hedging.HedgingPolicy
+
+    :param breaker: Размыкатель цепи по ресурсам: при деградации ресурса запросы к нему сразу завершаются
+        исключением CircuitOpenError. True — :class:`~YMContent.breaker.CircuitBreaker` по умолчанию
+    :type breaker: bool or YMContent.breaker.CircuitBreaker
+
+    :param coalesce: Объединять одинаковые одновременные запросы в один HTTP-запрос
+    :type coalesce: bool
+
+    :param cache: Кэш ответов, например :class:`~YMContent.cache.MemoryCache`. Устаревшие в пределах
+        stale ответы отдаются сразу и обновляются в фоне. Устаревшие ответы с ETag или Last-Modified
+        проверяются условным запросом, и ответ 304 продлевает запись в кэше. Ответы 404 и 422 хранятся
+        отдельное время и повторно завершаются той же ошибкой без обращения к API
+    :type cache: YMContent.cache.BaseCache
+
+    :param decoder: Декодер JSON: 'json', 'orjson', 'simdjson' или функция, принимающая тело ответа в bytes.
+        По умолчанию самый быстрый из установленных
+    :type decoder: str or callable
+
+    :param recorder: Запись последних запросов и начала ответов для разбора проблем
+    :type recorder: YMContent.diagnostics.RequestRecorder
     """
 
-    def __init__(self, authorization_key=None):
-        if not authorization_key:
-            raise NotAuthorized(
-                "You must provide authorization key to access Yandex.Market API!")
+    _single_flight = SingleFlight
+
+    def __init__(self, authorization_key=None, max_workers=10, rate_limiter=None, concurrency=None, retry=None,
+                 hedging=None, breaker=None, coalesce=True, cache=None, decoder=None,
+                 recorder=None):
+        if isinstance(authorization_key, KeyPool):
+            self.key_pool = authorization_key
+        else:
+            self.key_pool = KeyPool(authorization_key, rate_limiter)
+        self.max_workers = max_workers
+        if concurrency is True:
+            concurrency = AIMDController(maximum=max_workers)
+        self.concurrency = concurrency or None
+        if retry is None:
+            retry = RetryPolicy()
+        self.retry = retry or RetryPolicy(retries=0)
+        if hedging is True:
+            hedging = HedgingPolicy()
+        self.hedging = hedging or None
+        if breaker is True:
+            breaker = CircuitBreaker()
+        self.breaker = breaker or None
+        self.coalesce = self._single_flight() if coalesce else None
+        self.cache = cache
+        self.decode = get_decoder(decoder)
+        self.recorder = recorder
+        self._init_transport()
+
+    def _init_transport(self):
+        # HTTP-сессия и пулы потоков синхронного клиента, AsyncYMAPI заменяет их своим транспортом
+        self._hedge_executor = ThreadPoolExecutor(max_workers=2 * self.max_workers) if self.hedging else None
+        self._refresh_executor = ThreadPoolExecutor(max_workers=2) if self.cache is not None else None
         self.session = requests.Session()
-        self.session.headers = {
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('{}://'.format(PROTOCOL), adapter)
+        self.session.headers = self._default_headers()
+
+    def _default_headers(self):
+        return {
             'Host': DOMAIN,
-            'Authorization': authorization_key,
+            'Authorization': next(iter(self.key_pool)),
             'User-agent': USER_AGENT,
         }
 
-    def _request(self, resource, req_id, params):
+    @staticmethod
+    def _url(resource, req_id):
         if resource not in RESOURCES:
             raise Exception('Resource "%s" unsupported' % resource)
 
         resource_path = resource.format(req_id)
-        url = '{}://{}/{}/{}'.format(PROTOCOL, DOMAIN, API_VERSION, resource_path)
+        return '{}://{}/{}/{}'.format(PROTOCOL, DOMAIN, API_VERSION, resource_path)
+
+    @staticmethod
+    def _curl(request_headers, body, uri):
+        return CurlCommand(request_headers, body, uri)
+
+    @staticmethod
+    def _process(command, headers, status_code, data):
+        # аргументы форматируются, только если включен уровень DEBUG
+        logger.debug('CURL: %s', command)
+        logger.debug('Received JSON: %s', data)
+        logger.debug('Received headers: %s', headers)
+
+        if status_code in (401, 403, 404, 422):
+            logger.error(data['errors'][0]['message'])
+            raise BaseAPIError(data['errors'][0]['message'])
+
+        return (command, headers, status_code, data)
+
+    def _send(self, resource, url, params, fields_all, validators=None):
+        key = self.key_pool.acquire(resource, fields_all)
+        started = time.monotonic()
 
         try:
-            logger.debug('Requesting resource {}'.format(url))
+            logger.debug('Requesting resource %s', url)
             r = self.session.get(
                 url=url,
-                params=params
+                params=params,
+                headers=dict(validators or {}, Authorization=key)
             )
 
         except (ConnectionError, ReadTimeout, SSLError, ssl.SSLError,
                 socket.error) as exception:
             logger.error(exception)
-            raise NetworkAPIError()
+            error = NetworkAPIError()
+            error.elapsed = time.monotonic() - started
+            raise error
         else:
-            data = r.json()
-            headers = ["'{0}: {1}'".format(k, v) for k, v in r.request.headers.items()]
-            headers = " -H ".join(sorted(headers))
-            command = "curl -H {headers} -d '{data}' '{uri}'".format(
-                data=r.request.body or "",
-                headers=headers,
-                uri=r.request.url,
-            )
+            self.key_pool.update(key, resource, r.headers, fields_all)
+            command = self._curl(r.request.headers, r.request.body, r.request.url)
+            return (command, r.headers, r.status_code, r.content, time.monotonic() - started)
+
+    def _timed_send(self, resource, url, params, fields_all, validators=None):
+        result = self._send(resource, url, params, fields_all, validators)
+        self.hedging.observe(resource, result[4])
+        return result
+
+    def _dispatch(self, resource, url, params, fields_all, validators=None):
+        if not self.hedging or resource not in self.hedging.resources:
+            return self._send(resource, url, params, fields_all, validators)
+
+        delay = self.hedging.hedge_delay(resource)
+        if delay is None:
+            return self._timed_send(resource, url, params, fields_all, validators)
+
+        primary = self._hedge_executor.submit(self._timed_send, resource, url, params, fields_all, validators)
+        if wait([primary], timeout=delay).done or \
+                not self.hedging.allowed(self.key_pool.remaining(resource, fields_all)):
+            return primary.result()
+
+        logger.debug('Hedging request %s', url)
+        hedge = self._hedge_executor.submit(self._timed_send, resource, url, params, fields_all, validators)
+        first = next(iter(wait([primary, hedge], return_when=FIRST_COMPLETED).done))
+        if first.exception() is not None:
+            other = hedge if first is primary else primary
+            if other.exception() is None:
+                first = other
+        self.hedging.record(first is hedge)
+        return first.result()
+
+    def _breaker_record(self, resource, status_code, elapsed=None):
+        if not self.breaker:
+            return
+        if status_code is None or status_code >= 500:
+            self.breaker.failure(resource)
+        else:
+            self.breaker.success(resource, elapsed)
 
-            logger.debug('CURL: {}'.format(command))
-            logger.debug('Received JSON: {}'.format(data))
-            logger.debug('Received headers: {}'.format(r.headers))
+    def _request(self, resource, req_id, params):
+        key = request_key(resource, req_id, params)
+        previous = None
+        if self.cache is not None:
+            (entry, refresh) = self.cache.lookup(key, resource)
+            if entry is not None:
+                if refresh and self.cache.begin_refresh(key):
+                    self._refresh_executor.submit(self._refresh, key, resource, req_id, params, entry)
+                return self._process(*entry.value)
+            previous = self.cache.revalidation(key, resource)
+
+        if self.coalesce:
+            value = self.coalesce.do(key, self._fetch_store, key, resource, req_id, params, previous)
+        else:
+            value = self._fetch_store(key, resource, req_id, params, previous)
+        return self._process(*value)
+
+    def _fetch_store(self, key, resource, req_id, params, previous=None):
+        # при объединении запросов выполняется только в первом из них, поэтому ответ сохраняется один раз
+        validators = previous.validators() if previous is not None else None
+        (value, body) = self._fetch(resource, req_id, params, validators)
+        if self.cache is not None:
+            value = self.cache.store(key, resource, value, previous, body)
+        return value
+
+    def _refresh(self, key, resource, req_id, params, previous):
+        try:
+            self._fetch_store(key, resource, req_id, params, previous)
+        except BaseException as e:
+            logger.warning('Background refresh of {} failed: {!r}'.format(resource, e))
+        finally:
+            self.cache.end_refresh(key)
+
+    def _fetch(self, resource, req_id, params, validators=None):
+        url = self._url(resource, req_id)
+        fields_all = is_fields_all(params)
+        policy = self.retry.for_resource(resource)
+        attempt = 0
+
+        while True:
+            if self.breaker:
+                self.breaker.before(resource)
+            try:
+                (command, headers, status_code, body, elapsed) = self._dispatch(
+                    resource, url, params, fields_all, validators)
+            except NetworkAPIError as e:
+                self._breaker_record(resource, None)
+                if self.recorder is not None:
+                    self.recorder.record(resource, url, None, None, None, getattr(e, 'elapsed', None))
+                delay = policy.delay(attempt)
+                if delay is None:
+                    raise
+            except BaseException:
+                # отмена или другая ошибка без ответа не должна занимать место пробного запроса
+                if self.breaker:
+                    self.breaker.abort(resource)
+                raise
+            else:
+                self._breaker_record(resource, status_code, elapsed)
+                if self.recorder is not None:
+                    self.recorder.record(resource, command, status_code, headers, body, elapsed)
+                delay = policy.delay(attempt, status_code, headers)
+                if delay is None:
+                    if status_code < 400:
+                        policy.success()
+                    if status_code == 304:
+                        # тело ответа пустое, ответ берется из кэша
+                        return (command, headers, status_code, None), None
+                    return (command, headers, status_code, self.decode(body)), body
+
+            attempt += 1
+            logger.warning('Retrying {} in {:.3f}s, attempt {}'.format(url, delay, attempt))
+            time.sleep(delay)
+
+    def _call(self, response_class, resource, req_id, params):
+        return _load(response_class)(self._request(resource, req_id, params))
+
+    def _batch_method(self, method):
+        method = getattr(self, method) if isinstance(method, str) else method
+        return self.concurrency.wrap(method) if self.concurrency else method
+
+    @staticmethod
+    def _batch_args(arg):
+        if isinstance(arg, tuple):
+            return arg, {}
+        elif isinstance(arg, dict):
+            return (), arg
+        else:
+            return (arg,), {}
+
+    def batch(self, calls, max_workers=None):
+        """
+        Параллельное выполнение произвольных запросов
+
+        :param calls: Запросы в виде кортежей (метод, args, kwargs), где метод — имя метода YMAPI или сам метод
+        :type calls: list[tuple]
+
+        :param max_workers: Количество потоков, по умолчанию max_workers клиента
+        :type max_workers: int
+
+        :return: Список объектов Future в порядке запросов
+        :rtype: list[concurrent.futures.Future]
+        """
+        executor = ThreadPoolExecutor(max_workers=max_workers or self.max_workers)
+        try:
+            return [executor.submit(self._batch_method(method), *args, **kwargs) for (method, args, kwargs) in calls]
+        finally:
+            executor.shutdown(wait=False)
+
+    def map(self, method, arg_iterable, max_workers=None):
+        """
+        Параллельное выполнение одного метода для набора аргументов
+
+        Ошибки отдельных запросов (например, BaseAPIError или NetworkAPIError) не прерывают выполнение,
+        а возвращаются на месте соответствующего результата.
+
+        :param method: Имя метода YMAPI или сам метод, например 'model'
+        :type method: str or callable
+
+        :param arg_iterable: Аргументы вызовов: кортеж — позиционные аргументы, dict — именованные,
+            любое другое значение — единственный позиционный аргумент
+        :type arg_iterable: list
 
-            if r.status_code in (401, 403, 404, 422):
-                logger.error(data['errors'][0]['message'])
-                raise BaseAPIError(data['errors'][0]['message'])
+        :param max_workers: Количество потоков, по умолчанию max_workers клиента
+        :type max_workers: int
 
-            return (command, r.headers, r.status_code, r.json())
+        :return: Список ответов или исключений в порядке аргументов
+        :rtype: list
+        """
+        calls = [(method,) + self._batch_args(arg) for arg in arg_iterable]
+        return [f.exception() or f.result() for f in self.batch(calls, max_workers)]
 
     @staticmethod
     def _validate_fields(fields, values):
@@ -87,6 +408,113 @@ class YMAPI(object):
             raise FieldsParamError('"fields" param is wrong')
         return fields
 
+    @staticmethod
+    def _last_page(result):
+        return result.page_last or len(result.page_items) < PAGE_SIZE
+
+    def _fan_out_workers(self, result, max_workers=None):
+        workers = max_workers or self.max_workers
+        for remaining in ('global_remaining', 'method_remaining'):
+            try:
+                workers = min(workers, getattr(result, remaining))
+            except (TypeError, ValueError):
+                pass
+        return max(workers, 1)
+
+    def iter_pages(self, method, *args, **kwargs):
+        """
+        Итератор по всем страницам постраничного ответа
+
+        Каждая страница запрашивается с count=30, обход останавливается на последней странице.
+
+        :param method: Имя метода YMAPI или сам метод, например 'model_offers'
+        :type method: str or callable
+
+        :param prefetch: Запрашивать следующую страницу, пока обрабатывается текущая
+        :type prefetch: bool
+
+        :param parallel: Запросить первую страницу, а затем все остальные страницы параллельно.
+            Количество одновременных запросов ограничено max_workers и значениями
+            X-RateLimit-Global-Remaining и X-RateLimit-Method-Remaining первой страницы
+        :type parallel: bool
+
+        :param max_workers: Количество потоков для parallel, по умолчанию max_workers клиента
+        :type max_workers: int
+
+        :return: Страницы ответа в порядке номеров
+        :rtype: generator
+        """
+        prefetch = kwargs.pop('prefetch', False)
+        parallel = kwargs.pop('parallel', False)
+        max_workers = kwargs.pop('max_workers', None)
+        method = self._batch_method(method)
+        kwargs['count'] = PAGE_SIZE
+        page = kwargs.pop('page', 1)
+
+        result = method(*args, page=page, **kwargs)
+        if parallel and not self._last_page(result) and result.page_total > page:
+            yield result
+            for result in self._fan_out(method, args, kwargs, range(page + 1, result.page_total + 1),
+                                        self._fan_out_workers(result, max_workers)):
+                yield result
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            while True:
+                last = self._last_page(result)
+                if not last and executor:
+                    future = executor.submit(method, *args, page=page + 1, **kwargs)
+                yield result
+                if last:
+                    break
+                page += 1
+                result = future.result() if executor else method(*args, page=page, **kwargs)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    @staticmethod
+    def _fan_out(method, args, kwargs, pages, workers):
+        pages = iter(pages)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = deque(executor.submit(method, *args, page=page, **kwargs) for page in islice(pages, workers))
+        try:
+            while futures:
+                result = futures.popleft().result()
+                for page in islice(pages, 1):
+                    futures.append(executor.submit(method, *args, page=page, **kwargs))
+                yield result
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def iter_items(self, method, *args, **kwargs):
+        """
+        Итератор по элементам всех страниц постраничного ответа, см. :meth:`iter_pages`
+
+        :return: Элементы всех страниц
+        :rtype: generator
+        """
+        for page in self.iter_pages(method, *args, **kwargs):
+            for item in page.page_items:
+                yield item
+
+    iter_categories = _iterator('categories')
+    iter_categories_children = _iterator('categories_children')
+    iter_categories_search = _iterator('categories_search')
+    iter_model_offers = _iterator('model_offers')
+    iter_model_opinions = _iterator('model_opinions')
+    iter_shop_opinions = _iterator('shop_opinions')
+    iter_model_outlets = _iterator('model_outlets')
+    iter_shop_outlets = _iterator('shop_outlets')
+    iter_offer_outlets = _iterator('offer_outlets')
+    iter_geo_regions = _iterator('geo_regions')
+    iter_geo_regions_children = _iterator('geo_regions_children')
+    iter_vendors = _iterator('vendors')
+    iter_search = _iterator('search')
+
     def categories(self, fields=None, sort='NONE', geo_id=None, remote_ip=None, count=30, page=1):
         """
         Список категорий
@@ -163,7 +591,7 @@ class YMAPI(object):
         else:
             params['page'] = page
 
-        return Categories(self._request('categories', None, params))
+        return self._call('Categories', 'categories', None, params)
 
     def categories_children(self, category_id, fields=None, sort='NONE', geo_id=None, remote_ip=None, count=30,
                             page=1):
@@ -243,7 +671,7 @@ class YMAPI(object):
         else:
             params['page'] = page
 
-        return Categories(self._request('categories/{}/children', category_id, params))
+        return self._call('Categories', 'categories/{}/children', category_id, params)
 
     def category(self, category_id, fields=None, geo_id=None, remote_ip=None):
         """
@@ -290,7 +718,7 @@ class YMAPI(object):
         if fields:
             params['fields'] = self._validate_fields(fields, constants.CATEGORY_FIELDS)
 
-        return Category(self._request('categories/{}', category_id, params))
+        return self._call('Category', 'categories/{}', category_id, params)
 
     def categories_filters(self, category_id, geo_id=None, remote_ip=None, fields=None, filter_set='POPULAR',
                            rs=None,
@@ -384,7 +812,7 @@ class YMAPI(object):
             for (k, v) in filters.items():
                 params[k] = v
 
-        return Filters(self._request('categories/{}/filters', category_id, params))
+        return self._call('Filters', 'categories/{}/filters', category_id, params)
 
     def categories_match(self, name, category_name=None, description=None, locale='RU_ru', price=None,
                          shop_name=None):
@@ -428,7 +856,7 @@ class YMAPI(object):
         if shop_name:
             params['shop_name'] = shop_name
 
-        return Categories(self._request('categories/match', None, params))
+        return self._call('Categories', 'categories/match', None, params)
 
     def model(self, model_id, fields='CATEGORY,PHOTO', filters=None, geo_id=None, remote_ip=None):
         """
@@ -519,7 +947,7 @@ class YMAPI(object):
             for (k, v) in filters.items():
                 params[k] = v
 
-        return Model(self._request('models/{}', model_id, params))
+        return self._call('Model', 'models/{}', model_id, params)
 
     def models_reviews(self, model_id, count=30, page=1):
         """
@@ -553,7 +981,7 @@ class YMAPI(object):
         else:
             params['page'] = page
 
-        return ModelReview(self._request('models/{}/reviews', model_id, params))
+        return self._call('ModelReview', 'models/{}/reviews', model_id, params)
 
     def models_match(self, name, category_count=1, fields='CATEGORY,PHOTO', match_types='MULTI,REPORT',
                      category_name=None, description=None, locale='RU_ru', price=None, shop_name=None, category_id=None,
@@ -686,7 +1114,7 @@ class YMAPI(object):
         if hid:
             params['hid'] = hid
 
-        return Models(self._request('models/match', None, params))
+        return self._call('Models', 'models/match', None, params)
 
     def models_lookas(self, model_id, count=30, page=1, fields='CATEGORY,PHOTO', geo_id=None, remote_ip=None):
         """
@@ -789,7 +1217,7 @@ class YMAPI(object):
         if fields:
             params['fields'] = self._validate_fields(fields, constants.MODEL_FIELDS)
 
-        return Models(self._request('models/{}/looksas', model_id, params))
+        return self._call('Models', 'models/{}/looksas', model_id, params)
 
     def categories_bestdeals(self, category_id, fields='CATEGORY,PHOTO', count=30, page=1, geo_id=None, remote_ip=None):
         """
@@ -892,7 +1320,7 @@ class YMAPI(object):
         if fields:
             params['fields'] = self._validate_fields(fields, constants.MODEL_FIELDS)
 
-        return Models(self._request('categories/{}/bestdeals', category_id, params))
+        return self._call('Models', 'categories/{}/bestdeals', category_id, params)
 
     def categories_popular(self, category_id, fields='CATEGORY,PHOTO', count=30, page=1, geo_id=None, remote_ip=None):
         """
@@ -995,7 +1423,7 @@ class YMAPI(object):
         if fields:
             params['fields'] = self._validate_fields(fields, constants.MODEL_FIELDS)
 
-        return Models(self._request('categories/{}/populars', category_id, params))
+        return self._call('Models', 'categories/{}/populars', category_id, params)
 
     def model_offers(self, model_id, delivery_included=False, fields=None, group_by=None, shop_regions=None,
                      filters=None,
@@ -1164,7 +1592,7 @@ class YMAPI(object):
                 raise GeoParamError('"longitude" param must be between -180 and 180')
             params['longitude'] = longitude
 
-        return ModelOffers(self._request('models/{}/offers', model_id, params))
+        return self._call('ModelOffers', 'models/{}/offers', model_id, params)
 
     def model_offers_default(self, model_id, fields='STANDARD', filters=None, geo_id=None, remote_ip=None):
         """
@@ -1228,7 +1656,7 @@ class YMAPI(object):
             for (k, v) in filters.items():
                 params[k] = v
 
-        return ModelOffersDefault(self._request('models/{}/offers/default', model_id, params))
+        return self._call('ModelOffersDefault', 'models/{}/offers/default', model_id, params)
 
     def model_offers_stat(self, model_id, geo_id=None, remote_ip=None):
         """
@@ -1260,7 +1688,7 @@ class YMAPI(object):
         if remote_ip:
             params['remote_ip'] = remote_ip
 
-        return ModelOffersStat(self._request('models/{}/offers/stat', model_id, params))
+        return self._call('ModelOffersStat', 'models/{}/offers/stat', model_id, params)
 
     def model_offers_filters(self, model_id, fields=None, filter_set=None, sort='NONE'):
         """
@@ -1319,7 +1747,7 @@ class YMAPI(object):
             if sort not in ('NAME', 'NONE'):
                 raise SortParamError('"sort" param is wrong')
 
-        return Filters(self._request('models/{}/offers/filters', model_id, params))
+        return self._call('Filters', 'models/{}/offers/filters', model_id, params)
 
     def offer(self, offer_id, delivery_included=0, fields='STANDARD', geo_id=None, remote_ip=None):
         """
@@ -1389,7 +1817,7 @@ class YMAPI(object):
         if fields:
             params['fields'] = self._validate_fields(fields, constants.OFFER_FIELDS)
 
-        return Offer(self._request('offers/{}', offer_id, params))
+        return self._call('Offer', 'offers/{}', offer_id, params)
 
     def model_opinions(self, model_id, grade=None, max_comments=0, count=30, page=1, how=None, sort='DATE'):
         """
@@ -1455,7 +1883,7 @@ class YMAPI(object):
             if sort not in ('DATE', 'GRADE', 'RANK'):
                 raise SortParamError('"sort" param is wrong')
             params['sort'] = sort
-        return ModelOpinions(self._request('models/{}/opinions', model_id, params))
+        return self._call('ModelOpinions', 'models/{}/opinions', model_id, params)
 
     def shop_opinions(self, shop_id, grade=None, max_comments=0, count=30, page=1, how=None, sort='DATE'):
         """
@@ -1523,7 +1951,7 @@ class YMAPI(object):
                 raise SortParamError('"sort" param is wrong')
             params['sort'] = sort
 
-        return ShopOpinions(self._request('shops/{}/opinions', shop_id, params))
+        return self._call('ShopOpinions', 'shops/{}/opinions', shop_id, params)
 
     def shop_opinions_chronological(self, shop_id, grade=None, max_comments=0, count=20, page=1):
         """
@@ -1573,7 +2001,7 @@ class YMAPI(object):
         if max_comments:
             params['max_comments'] = max_comments
 
-        return ShopOpinions(self._request('shops/{}/opinions/chronological', shop_id, params))
+        return self._call('ShopOpinions', 'shops/{}/opinions/chronological', shop_id, params)
 
     def shop(self, shop_id, fields=None):
         """
@@ -1602,7 +2030,7 @@ class YMAPI(object):
         if fields:
             params['fields'] = self._validate_fields(fields, constants.SHOP_FIELDS)
 
-        return Shop(self._request('shops/{}', shop_id, params))
+        return self._call('Shop', 'shops/{}', shop_id, params)
 
     def shops(self, host, fields=None, geo_id=None):
         """
@@ -1641,7 +2069,7 @@ class YMAPI(object):
         if fields:
             params['fields'] = self._validate_fields(fields, constants.SHOP_FIELDS)
 
-        return Shops(self._request('shops', None, params))
+        return self._call('Shops', 'shops', None, params)
 
     def geo_regions_shops_summary(self, region_id, fields='DELIVERY_COUNT,HOME_COUNT'):
         """
@@ -1673,7 +2101,7 @@ class YMAPI(object):
                                                      ('DELIVERY_COUNT', 'HOME_COUNT',
                                                       'TOTAL_COUNT', 'ALL'))
 
-        return ShopsSummary(self._request('geo/regions/{}/shops/summary', region_id, params))
+        return self._call('ShopsSummary', 'geo/regions/{}/shops/summary', region_id, params)
 
     def model_outlets(self, model_id, boundary=None, fields='STANDARD', outlet_type='PICKUP,STORE', filters=None,
                       count=30,
@@ -1836,7 +2264,7 @@ class YMAPI(object):
                 raise GeoParamError('"longitude" param must be between -180 and 180')
             params['longitude'] = longitude
 
-        return Outlets(self._request('models/{}/outlets', model_id, params))
+        return self._call('Outlets', 'models/{}/outlets', model_id, params)
 
     def shop_outlets(self, shop_id, boundary=None, fields='STANDARD', outlet_type='PICKUP,STORE', filters=None,
                      count=30,
@@ -1984,7 +2412,7 @@ class YMAPI(object):
                 raise GeoParamError('"longitude" param must be between -180 and 180')
             params['longitude'] = longitude
 
-        return Outlets(self._request('shops/{}/outlets', shop_id, params))
+        return self._call('Outlets', 'shops/{}/outlets', shop_id, params)
 
     def offer_outlets(self, offer_id, boundary=None, fields='STANDARD', outlet_type='PICKUP,STORE', filters=None,
                       count=30,
@@ -2149,7 +2577,7 @@ class YMAPI(object):
                 raise GeoParamError('"longitude" param must be between -180 and 180')
             params['longitude'] = longitude
 
-        return Outlets(self._request('offers/{}/outlets', offer_id, params))
+        return self._call('Outlets', 'offers/{}/outlets', offer_id, params)
 
     def geo_regions(self, fields=None, count=30, page=1):
         """
@@ -2193,7 +2621,7 @@ class YMAPI(object):
         else:
             params['page'] = page
 
-        return Regions(self._request('geo/regions', None, params))
+        return self._call('Regions', 'geo/regions', None, params)
 
     def geo_regions_children(self, region_id, fields=None, count=30, page=1):
         """
@@ -2240,7 +2668,7 @@ class YMAPI(object):
         else:
             params['page'] = page
 
-        return Regions(self._request('geo/regions/{}/children', region_id, params))
+        return self._call('Regions', 'geo/regions/{}/children', region_id, params)
 
     def geo_region(self, region_id, fields=None):
         """
@@ -2269,7 +2697,7 @@ class YMAPI(object):
         if fields:
             params['fields'] = self._validate_fields(fields, constants.GEO_FIELDS)
 
-        return Region(self._request('geo/regions/{}', region_id, params))
+        return self._call('Region', 'geo/regions/{}', region_id, params)
 
     def geo_suggest(self, name_part, fields=None,
                     types='CITY,CITY_DISTRICT,REGION,RURAL_SETTLEMENT,SECONDARY_DISTRICT,VILLAGE',
@@ -2349,7 +2777,7 @@ class YMAPI(object):
         else:
             params['page'] = page
 
-        return Suggests(self._request('geo/suggest', None, params))
+        return self._call('Suggests', 'geo/suggest', None, params)
 
     def vendors(self, fields=None, count=30, page=1):
         """
@@ -2397,7 +2825,7 @@ class YMAPI(object):
         else:
             params['page'] = page
 
-        return Vendors(self._request('vendors', None, params))
+        return self._call('Vendors', 'vendors', None, params)
 
     def vendor(self, vendor_id, fields=None):
         """
@@ -2430,7 +2858,7 @@ class YMAPI(object):
         if fields:
             params['fields'] = self._validate_fields(fields, constants.VENDOR_FIELDS)
 
-        return Vendor(self._request('vendors/{}', vendor_id, params))
+        return self._call('Vendor', 'vendors/{}', vendor_id, params)
 
     def vendors_match(self, name, fields=None):
         """
@@ -2464,7 +2892,7 @@ class YMAPI(object):
             # todo добавить всюду CATEGORY_ALL
             params['fields'] = self._validate_fields(fields, constants.VENDOR_FIELDS)
 
-        return Vendor(self._request('vendors/match', None, params))
+        return self._call('Vendor', 'vendors/match', None, params)
 
     def search(self, text, delivery_included=False, fields=None, onstock=0, outlet_types=None, price_max=None,
                price_min=None, result_type='ALL', shop_id=None, warranty=0, filters=None, barcode=False,
@@ -2741,7 +3169,7 @@ class YMAPI(object):
                 raise GeoParamError('"longitude" param must be between -180 and 180')
             params['longitude'] = longitude
 
-        return Search(self._request('search', None, params))
+        return self._call('Search', 'search', None, params)
 
     def categories_search(self, category_id, geo_id=None, remote_ip=None, fields=None, result_type='ALL', rs=None,
                           shop_regions=None, filters=None,
@@ -2885,7 +3313,7 @@ class YMAPI(object):
                 raise SortParamError('"sort" param is wrong')
             params['sort'] = sort
 
-        return Search(self._request('categories/{}/search', category_id, params))
+        return self._call('Search', 'categories/{}/search', category_id, params)
 
     def search_filters(self, text, fields=None, geo_id=None, remote_ip=None):
         """
@@ -2936,7 +3364,7 @@ class YMAPI(object):
         if fields:
             params['fields'] = self._validate_fields(fields, constants.SEARCH_FILTERS)
 
-        return Filters(self._request('search/filters', None, params))
+        return self._call('Filters', 'search/filters', None, params)
 
     def redirect(self, text, redirect_types='SEARCH', barcode=False, search_type=None, category_id=None, hid=None,
                  fields=None, user_agent=None, count=30, page=1, how=None, sort=None, geo_id=None, remote_ip=None):
@@ -3122,7 +3550,7 @@ class YMAPI(object):
                 raise SortParamError('"sort" param is wrong')
             params['sort'] = sort
 
-        return Redirect(self._request('redirect', None, params))
+        return self._call('Redirect', 'redirect', None, params)
 
     def suggestions(self, text, count=30, page=1, pos=None, suggest_types='DEFAULT', geo_id=None, remote_ip=None):
         """
@@ -3203,4 +3631,4 @@ class YMAPI(object):
                     raise SuggestTypesParamError('"suggest_types" param is wrong')
             params['suggest_types'] = suggest_types
 
-        return Suggestions(self._request('suggestions', None, params))
+        return self._call('Suggestions', 'suggestions', None, params)
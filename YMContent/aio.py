@@ -0,0 +1,413 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import logging
+import socket
+import ssl
+import time
+from collections import deque
+from functools import wraps
+from itertools import islice
+
+from requests.structures import CaseInsensitiveDict
+
+from YMContent import YMAPI, PAGE_SIZE, _load
+from YMContent.coalesce import AsyncSingleFlight, request_key
+from YMContent.exceptions import BaseAPIError, NetworkAPIError
+from YMContent.ratelimit import is_fields_all
+
+logger = logging.getLogger('YMContent')
+
+
+class AsyncTransport(object):
+    """
+    Транспорт для :class:`AsyncYMAPI`.
+
+    Реализация должна вернуть кортеж ``(status_code, headers, body, url)``, где ``body`` — тело ответа
+    (bytes или str), а ``url`` — итоговый адрес запроса вместе с параметрами. Сетевые ошибки передаются
+    как ConnectionError или asyncio.TimeoutError, тогда они становятся NetworkAPIError и запрос повторяется.
+    """
+
+    async def get(self, url, params, headers):
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+
+class AiohttpTransport(AsyncTransport):
+    """
+    Транспорт на основе aiohttp
+
+    :param timeout: Таймаут запроса в секундах
+    :type timeout: int or float or None
+    """
+
+    def __init__(self, timeout=None):
+        self.timeout = timeout
+        self._session = None
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            try:
+                import aiohttp
+            except ImportError:
+                raise ImportError('aiohttp is required for AsyncYMAPI, install it or pass your own transport')
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self._session
+
+    async def get(self, url, params, headers):
+        session = self._get_session()
+        import aiohttp
+
+        try:
+            async with session.get(url, params=params, headers=headers) as r:
+                body = await r.read()
+                return r.status, r.headers, body, str(r.url)
+        except aiohttp.ClientError as exception:
+            # ServerDisconnectedError, ClientPayloadError и другие ошибки aiohttp не наследуют ConnectionError
+            raise ConnectionError(repr(exception)) from exception
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class AsyncYMAPI(YMAPI):
+    """
+    Асинхронный клиент. Повторяет все методы :class:`YMAPI`, но каждый из них возвращает корутину.
+
+    Проверка параметров выполняется при вызове метода, до ``await``.
+
+    :param authorization_key: Авторизационный ключ, список ключей или пул ключей
+    :type authorization_key: str or list[str] or YMContent.ratelimit.KeyPool
+
+    :param transport: Транспорт для выполнения HTTP-запросов, по умолчанию :class:`AiohttpTransport`
+    :type transport: AsyncTransport
+
+    :param max_workers: Количество одновременных запросов для :meth:`map` и :meth:`batch`
+    :type max_workers: int
+
+    :param rate_limiter: Ограничитель запросов или фабрика ограничителей для нескольких ключей
+    :type rate_limiter: YMContent.ratelimit.RateLimiter or callable
+
+    :param concurrency: Адаптивное ограничение одновременных запросов, см. :class:`YMAPI`
+    :type concurrency: bool or YMContent.concurrency.AIMDController
+
+    :param retry: Политика повторных запросов, см. :class:`YMAPI`
+    :type retry: YMContent.retry.RetryPolicy or bool
+
+    :param hedging: Дублирующие запросы, см. :class:`YMAPI`. Проигравший запрос отменяется
+    :type hedging: bool or YMContent.hedging.HedgingPolicy
+
+    :param breaker: Размыкатель цепи по ресурсам, см. :class:`YMAPI`
+    :type breaker: bool or YMContent.breaker.CircuitBreaker
+
+    :param coalesce: Объединять одинаковые одновременные запросы в один HTTP-запрос
+    :type coalesce: bool
+
+    :param cache: Кэш ответов, см. :class:`YMAPI`
+    :type cache: YMContent.cache.BaseCache
+
+    :param decoder: Декодер JSON, см. :class:`YMAPI`
+    :type decoder: str or callable
+
+    :param recorder: Запись последних запросов, см. :class:`YMAPI`
+    :type recorder: YMContent.diagnostics.RequestRecorder
+    """
+
+    _single_flight = AsyncSingleFlight
+
+    def __init__(self, authorization_key=None, transport=None, max_workers=10, rate_limiter=None,
+                 concurrency=None, retry=None, hedging=None, breaker=None, coalesce=True, cache=None,
+                 decoder=None, recorder=None):
+        super(AsyncYMAPI, self).__init__(authorization_key, max_workers, rate_limiter, concurrency, retry, hedging,
+                                         breaker, coalesce, cache, decoder, recorder)
+        self.transport = transport or AiohttpTransport()
+        self._released = None
+        # цикл событий хранит задачи по слабым ссылкам, поэтому фоновые обновления хранятся здесь
+        self._refresh_tasks = set()
+
+    def _init_transport(self):
+        # запросы выполняет транспорт, сессия requests и пулы потоков не нужны
+        self._hedge_executor = None
+        self._refresh_executor = None
+        self.headers = self._default_headers()
+
+    async def _acquire(self, resource, fields_all):
+        while True:
+            (key, delay) = self.key_pool.reserve(resource, fields_all)
+            if delay <= 0:
+                return key
+            logger.debug('Rate limit reached, sleeping %.3fs', delay)
+            await asyncio.sleep(delay)
+
+    async def _send(self, resource, url, params, fields_all, validators=None):
+        key = await self._acquire(resource, fields_all)
+        started = time.monotonic()
+
+        try:
+            logger.debug('Requesting resource %s', url)
+            request_headers = dict(self.headers, Authorization=key, **(validators or {}))
+            (status_code, headers, body, request_url) = await self.transport.get(url, params, request_headers)
+
+        except (ConnectionError, asyncio.TimeoutError, ssl.SSLError, socket.error) as exception:
+            logger.error(exception)
+            error = NetworkAPIError()
+            error.elapsed = time.monotonic() - started
+            raise error
+        else:
+            headers = CaseInsensitiveDict(headers)
+            self.key_pool.update(key, resource, headers, fields_all)
+            command = self._curl(request_headers, None, request_url)
+            return (command, headers, status_code, body, time.monotonic() - started)
+
+    async def _timed_send(self, resource, url, params, fields_all, validators=None):
+        result = await self._send(resource, url, params, fields_all, validators)
+        self.hedging.observe(resource, result[4])
+        return result
+
+    async def _dispatch(self, resource, url, params, fields_all, validators=None):
+        if not self.hedging or resource not in self.hedging.resources:
+            return await self._send(resource, url, params, fields_all, validators)
+
+        delay = self.hedging.hedge_delay(resource)
+        if delay is None:
+            return await self._timed_send(resource, url, params, fields_all, validators)
+
+        primary = asyncio.ensure_future(self._timed_send(resource, url, params, fields_all, validators))
+        (done, pending) = await asyncio.wait([primary], timeout=delay)
+        if done or not self.hedging.allowed(self.key_pool.remaining(resource, fields_all)):
+            return await primary
+
+        logger.debug('Hedging request %s', url)
+        hedge = asyncio.ensure_future(self._timed_send(resource, url, params, fields_all, validators))
+        try:
+            (done, pending) = await asyncio.wait([primary, hedge], return_when=asyncio.FIRST_COMPLETED)
+            first = primary if primary in done else hedge
+            if first.exception() is not None:
+                other = hedge if first is primary else primary
+                await asyncio.wait([other])
+                if other.exception() is None:
+                    first = other
+            self.hedging.record(first is hedge)
+            return first.result()
+        finally:
+            for task in (primary, hedge):
+                task.cancel()
+
+    async def _fetch(self, resource, req_id, params, validators=None):
+        url = self._url(resource, req_id)
+        fields_all = is_fields_all(params)
+        policy = self.retry.for_resource(resource)
+        attempt = 0
+
+        while True:
+            if self.breaker:
+                self.breaker.before(resource)
+            try:
+                (command, headers, status_code, body, elapsed) = await self._dispatch(
+                    resource, url, params, fields_all, validators)
+            except NetworkAPIError as e:
+                self._breaker_record(resource, None)
+                if self.recorder is not None:
+                    self.recorder.record(resource, url, None, None, None, getattr(e, 'elapsed', None))
+                delay = policy.delay(attempt)
+                if delay is None:
+                    raise
+            except BaseException:
+                # отмена или другая ошибка без ответа не должна занимать место пробного запроса
+                if self.breaker:
+                    self.breaker.abort(resource)
+                raise
+            else:
+                self._breaker_record(resource, status_code, elapsed)
+                if self.recorder is not None:
+                    self.recorder.record(resource, command, status_code, headers, body, elapsed)
+                delay = policy.delay(attempt, status_code, headers)
+                if delay is None:
+                    if status_code < 400:
+                        policy.success()
+                    if status_code == 304:
+                        return (command, headers, status_code, None), None
+                    return (command, headers, status_code, self.decode(body)), body
+
+            attempt += 1
+            logger.warning('Retrying {} in {:.3f}s, attempt {}'.format(url, delay, attempt))
+            await asyncio.sleep(delay)
+
+    async def _request(self, resource, req_id, params):
+        key = request_key(resource, req_id, params)
+        previous = None
+        if self.cache is not None:
+            (entry, refresh) = self.cache.lookup(key, resource)
+            if entry is not None:
+                if refresh and self.cache.begin_refresh(key):
+                    task = asyncio.ensure_future(self._refresh(key, resource, req_id, params, entry))
+                    self._refresh_tasks.add(task)
+                    task.add_done_callback(self._refresh_tasks.discard)
+                return self._process(*entry.value)
+            previous = self.cache.revalidation(key, resource)
+
+        if self.coalesce:
+            value = await self.coalesce.do(key, self._fetch_store, key, resource, req_id, params, previous)
+        else:
+            value = await self._fetch_store(key, resource, req_id, params, previous)
+        return self._process(*value)
+
+    async def _fetch_store(self, key, resource, req_id, params, previous=None):
+        # при объединении запросов выполняется только в первом из них, поэтому ответ сохраняется один раз
+        validators = previous.validators() if previous is not None else None
+        (value, body) = await self._fetch(resource, req_id, params, validators)
+        if self.cache is not None:
+            value = self.cache.store(key, resource, value, previous, body)
+        return value
+
+    async def _refresh(self, key, resource, req_id, params, previous):
+        try:
+            await self._fetch_store(key, resource, req_id, params, previous)
+        except (asyncio.CancelledError, KeyboardInterrupt, SystemExit):
+            raise
+        except BaseException as e:
+            # исключения YMContent наследуют BaseException
+            logger.warning('Background refresh of {} failed: {!r}'.format(resource, e))
+        finally:
+            self.cache.end_refresh(key)
+
+    async def _call(self, response_class, resource, req_id, params):
+        return _load(response_class)(await self._request(resource, req_id, params))
+
+    def _condition(self):
+        loop = asyncio.get_event_loop()
+        if self._released is None or self._released[0] is not loop:
+            self._released = (loop, asyncio.Condition())
+        return self._released[1]
+
+    def _batch_method(self, method):
+        method = getattr(self, method) if isinstance(method, str) else method
+        if not self.concurrency:
+            return method
+        controller = self.concurrency
+
+        @wraps(method)
+        async def call(*args, **kwargs):
+            condition = self._condition()
+            async with condition:
+                await condition.wait_for(controller.try_acquire)
+            try:
+                result = await method(*args, **kwargs)
+            except (BaseAPIError, NetworkAPIError) as e:
+                controller.release(error=e)
+                raise
+            except BaseException:
+                controller.release()
+                raise
+            else:
+                controller.release(result)
+                return result
+            finally:
+                async with condition:
+                    condition.notify_all()
+
+        return call
+
+    def batch(self, calls, max_workers=None):
+        """
+        Параллельное выполнение произвольных запросов
+
+        :param calls: Запросы в виде кортежей (метод, args, kwargs), где метод — имя метода или сам метод
+        :type calls: list[tuple]
+
+        :param max_workers: Количество одновременных запросов, по умолчанию max_workers клиента
+        :type max_workers: int
+
+        :return: Список задач в порядке запросов
+        :rtype: list[asyncio.Task]
+        """
+        semaphore = asyncio.Semaphore(max_workers or self.max_workers)
+
+        async def run(method, args, kwargs):
+            async with semaphore:
+                return await self._batch_method(method)(*args, **kwargs)
+
+        return [asyncio.ensure_future(run(*call)) for call in calls]
+
+    async def map(self, method, arg_iterable, max_workers=None):
+        """
+        Параллельное выполнение одного метода для набора аргументов, см. :meth:`YMAPI.map`
+
+        :return: Список ответов или исключений в порядке аргументов
+        :rtype: list
+        """
+        calls = [(method,) + self._batch_args(arg) for arg in arg_iterable]
+        return await asyncio.gather(*self.batch(calls, max_workers), return_exceptions=True)
+
+    async def iter_pages(self, method, *args, **kwargs):
+        """
+        Асинхронный итератор по всем страницам постраничного ответа, см. :meth:`YMAPI.iter_pages`
+
+        :return: Страницы ответа в порядке номеров
+        :rtype: async_generator
+        """
+        prefetch = kwargs.pop('prefetch', False)
+        parallel = kwargs.pop('parallel', False)
+        max_workers = kwargs.pop('max_workers', None)
+        method = self._batch_method(method)
+        kwargs['count'] = PAGE_SIZE
+        page = kwargs.pop('page', 1)
+
+        result = await method(*args, page=page, **kwargs)
+        if parallel and not self._last_page(result) and result.page_total > page:
+            yield result
+            async for result in self._fan_out(method, args, kwargs, range(page + 1, result.page_total + 1),
+                                              self._fan_out_workers(result, max_workers)):
+                yield result
+            return
+
+        while True:
+            last = self._last_page(result)
+            if not last and prefetch:
+                task = asyncio.ensure_future(method(*args, page=page + 1, **kwargs))
+            yield result
+            if last:
+                break
+            page += 1
+            result = await task if prefetch else await method(*args, page=page, **kwargs)
+
+    @staticmethod
+    async def _fan_out(method, args, kwargs, pages, workers):
+        pages = iter(pages)
+        tasks = deque(asyncio.ensure_future(method(*args, page=page, **kwargs)) for page in islice(pages, workers))
+        try:
+            while tasks:
+                result = await tasks.popleft()
+                for page in islice(pages, 1):
+                    tasks.append(asyncio.ensure_future(method(*args, page=page, **kwargs)))
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def iter_items(self, method, *args, **kwargs):
+        """
+        Асинхронный итератор по элементам всех страниц постраничного ответа, см. :meth:`YMAPI.iter_pages`
+
+        :return: Элементы всех страниц
+        :rtype: async_generator
+        """
+        async for page in self.iter_pages(method, *args, **kwargs):
+            for item in page.page_items:
+                yield item
+
+    async def close(self):
+        tasks = list(self._refresh_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+import time
+
+from YMContent.exceptions import CircuitOpenError
+
+logger = logging.getLogger('YMContent')
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class Circuit(object):
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker(object):
+    """
+    Размыкатель цепи для каждого ресурса из RESOURCES
+
+    После failures подряд неудачных запросов к ресурсу (сетевая ошибка, ответ 5xx или ответ дольше latency
+    секунд) цепь размыкается, и запросы к этому ресурсу сразу завершаются исключением CircuitOpenError.
+    Через reset_timeout секунд пропускается probes пробных запросов: успешный замыкает цепь, неудачный
+    снова размыкает ее.
+
+    :param failures: Количество неудачных запросов подряд для размыкания
+    :type failures: int
+
+    :param latency: Время ответа в секундах, после которого запрос считается неудачным
+    :type latency: float or None
+
+    :param reset_timeout: Время в секундах до пробных запросов
+    :type reset_timeout: float
+
+    :param probes: Количество одновременных пробных запросов
+    :type probes: int
+    """
+
+    def __init__(self, failures=5, latency=None, reset_timeout=30, probes=1):
+        self.failures = failures
+        self.latency = latency
+        self.reset_timeout = reset_timeout
+        self.probes = probes
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def state(self, resource):
+        """
+
+        :return: Состояние цепи ресурса: closed, open или half-open
+        :rtype: str
+        """
+        with self._lock:
+            return self._circuits.get(resource, Circuit()).state
+
+    def before(self, resource):
+        """
+        Проверка перед отправкой запроса
+
+        :raises CircuitOpenError: цепь ресурса разомкнута
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(resource, Circuit())
+            if circuit.state == OPEN:
+                if time.monotonic() - circuit.opened_at < self.reset_timeout:
+                    raise CircuitOpenError('Circuit for "{}" is open'.format(resource))
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+            if circuit.state == HALF_OPEN:
+                if circuit.probes >= self.probes:
+                    raise CircuitOpenError('Circuit for "{}" is half-open'.format(resource))
+                circuit.probes += 1
+
+    def success(self, resource, latency=None):
+        """
+        Учет успешного запроса
+        """
+        if self.latency is not None and latency is not None and latency > self.latency:
+            return self.failure(resource)
+        with self._lock:
+            circuit = self._circuits.setdefault(resource, Circuit())
+            if circuit.state != CLOSED:
+                logger.info('Circuit for "{}" closed'.format(resource))
+            circuit.state = CLOSED
+            circuit.failures = 0
+
+    def abort(self, resource):
+        """
+        Учет запроса, прерванного без результата (например, отмененного), после :meth:`before`.
+        Освобождает место пробного запроса, не меняя состояние цепи
+        """
+        with self._lock:
+            circuit = self._circuits.get(resource)
+            if circuit is not None and circuit.state == HALF_OPEN and circuit.probes > 0:
+                circuit.probes -= 1
+
+    def failure(self, resource):
+        """
+        Учет неудачного запроса
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(resource, Circuit())
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failures:
+                if circuit.state != OPEN:
+                    logger.warning('Circuit for "{}" opened'.format(resource))
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
@@ -0,0 +1,464 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import sqlite3
+import threading
+import time
+from ast import literal_eval
+from collections import Counter, OrderedDict
+
+from requests.structures import CaseInsensitiveDict
+
+from YMContent.constants import CACHE_TTL, CACHE_STALE, CACHE_NEGATIVE_TTL
+from YMContent.diagnostics import CurlCommand
+
+NEGATIVE_STATUSES = (404, 422)
+
+
+class CacheEntry(object):
+    """
+    Ответ API в кэше
+
+    :param value: Кортеж (curl, headers, status_code, json) из YMAPI._request
+    :type value: tuple
+
+    :param expires: Время устаревания в секундах от начала эпохи
+    :type expires: float
+
+    :param size: Размер тела ответа в байтах
+    :type size: int
+    """
+
+    def __init__(self, value, expires, size=0):
+        self.value = value
+        self.expires = expires
+        self.size = size
+
+    def fresh(self, now=None):
+        return (now or time.time()) < self.expires
+
+    def validators(self):
+        """
+
+        :return: Заголовки условного запроса If-None-Match и If-Modified-Since по ETag и Last-Modified ответа
+        :rtype: dict
+        """
+        headers = self.value[1]
+        conditional = {}
+        if headers.get('ETag'):
+            conditional['If-None-Match'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            conditional['If-Modified-Since'] = headers['Last-Modified']
+        return conditional
+
+
+class BaseCache(object):
+    """
+    Кэш ответов API
+
+    Реализация должна определить :meth:`get`, :meth:`set`, :meth:`delete` и :meth:`clear`. Метод set
+    получает исходное тело ответа в bytes, если оно известно, иначе None.
+
+    :param ttl: Время хранения ответов по ресурсам в секундах. Ресурсы без времени хранения не кэшируются
+    :type ttl: dict
+
+    :param stale: Время после устаревания, в течение которого ответ ресурса отдается из кэша сразу, а
+        обновляется в фоне (stale-while-revalidate). Позже ответ запрашивается синхронно
+    :type stale: dict
+
+    :param negative: Время хранения ответов 404 и 422 по ресурсам в секундах. Пока ответ хранится,
+        повторный запрос завершается той же ошибкой без обращения к API
+    :type negative: dict
+    """
+
+    def __init__(self, ttl=None, stale=None, negative=None):
+        self.ttl = CACHE_TTL if ttl is None else ttl
+        self.stale = CACHE_STALE if stale is None else stale
+        self.negative = CACHE_NEGATIVE_TTL if negative is None else negative
+        self.hits = 0
+        self.stale_hits = 0
+        self.negative_hits = 0
+        self._negative_keys = Counter()
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self._stats_lock = threading.Lock()
+        self._refreshing = set()
+
+    def ttl_for(self, resource):
+        """
+
+        :return: Время хранения ответов ресурса в секундах или None, если ресурс не кэшируется
+        :rtype: int or None
+        """
+        return self.ttl.get(resource)
+
+    def stale_for(self, resource):
+        """
+
+        :return: Время в секундах, в течение которого устаревший ответ ресурса можно отдать из кэша
+        :rtype: int
+        """
+        return self.stale.get(resource, 0)
+
+    def negative_ttl_for(self, resource):
+        """
+
+        :return: Время хранения ответов 404 и 422 ресурса в секундах или None, если они не кэшируются
+        :rtype: int or None
+        """
+        return self.negative.get(resource)
+
+    def lookup(self, key, resource):
+        """
+        Поиск ответа с учетом статистики
+
+        :return: Кортеж (запись, нужно ли обновить запись в фоне). Запись None, если ее нет, или она
+            устарела больше чем на время stale ресурса
+        :rtype: tuple
+        """
+        if not self.ttl_for(resource) and not self.negative_ttl_for(resource):
+            return None, False
+        entry = self.get(key)
+        now = time.time()
+        with self._stats_lock:
+            if entry is not None and entry.fresh(now):
+                if entry.value[2] in NEGATIVE_STATUSES:
+                    self.negative_hits += 1
+                    self._negative_keys[key] += 1
+                else:
+                    self.hits += 1
+                return entry, False
+            elif entry is not None and entry.value[2] < 400 and now < entry.expires + self.stale_for(resource):
+                self.stale_hits += 1
+                return entry, True
+            self.misses += 1
+            return None, False
+
+    def revalidation(self, key, resource):
+        """
+        Устаревшая запись, которую можно проверить условным запросом
+
+        :return: Запись с заголовками ETag или Last-Modified или None
+        :rtype: CacheEntry or None
+        """
+        if not self.ttl_for(resource):
+            return None
+        entry = self.get(key)
+        if entry is not None and entry.value[2] < 400 and entry.validators():
+            return entry
+        return None
+
+    def begin_refresh(self, key):
+        """
+        Отметка о начале фонового обновления записи
+
+        :return: False, если запись уже обновляется
+        :rtype: bool
+        """
+        with self._stats_lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key):
+        """
+        Отметка о завершении фонового обновления записи
+        """
+        with self._stats_lock:
+            self._refreshing.discard(key)
+
+    def store(self, key, resource, value, previous=None, body=None):
+        """
+        Сохранение ответа на время хранения ресурса
+
+        Ответ 304 на условный запрос продлевает запись previous, которая была проверена этим запросом.
+        Ответы 404 и 422 хранятся отдельное, обычно более короткое время.
+
+        :param previous: Запись, по которой был сделан условный запрос
+        :type previous: CacheEntry or None
+
+        :param body: Исходное тело ответа
+        :type body: bytes or None
+
+        :return: Ответ API для вызывающего кода: при 304 — ответ из записи previous
+        :rtype: tuple
+        """
+        ttl = self.ttl_for(resource)
+        size = len(body) if body is not None else 0
+        if value[2] == 304 and previous is not None:
+            with self._stats_lock:
+                self.revalidations += 1
+            if ttl:
+                self.set(key, CacheEntry(previous.value, time.time() + ttl, previous.size))
+            return previous.value
+        if value[2] in NEGATIVE_STATUSES:
+            negative_ttl = self.negative_ttl_for(resource)
+            if negative_ttl:
+                self.set(key, CacheEntry(value, time.time() + negative_ttl, size), body)
+        elif ttl and value[2] < 400:
+            self.set(key, CacheEntry(value, time.time() + ttl, size), body)
+        return value
+
+    def get(self, key):
+        raise NotImplementedError
+
+    def set(self, key, entry, body=None):
+        raise NotImplementedError
+
+    def delete(self, key):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def stats(self):
+        """
+
+        :return: Количество попаданий, попаданий в устаревшие записи и в ответы 404 и 422, промахов,
+            ответов 304 и вытеснений
+        :rtype: dict
+        """
+        with self._stats_lock:
+            return {'hits': self.hits, 'stale_hits': self.stale_hits, 'negative_hits': self.negative_hits,
+                    'misses': self.misses, 'revalidations': self.revalidations, 'evictions': self.evictions}
+
+    def negative_stats(self, resource=None):
+        """
+        Количество повторных запросов к несуществующим объектам, например для очистки фидов от них
+
+        :param resource: Ресурс из RESOURCES, по умолчанию все
+        :type resource: str or None
+
+        :return: Количество попаданий в ответы 404 и 422 по ключам запросов, начиная с самого частого
+        :rtype: list[tuple]
+        """
+        with self._stats_lock:
+            return [(key, hits) for (key, hits) in self._negative_keys.most_common()
+                    if resource is None or (isinstance(key, tuple) and key[0] == resource)]
+
+
+class MemoryCache(BaseCache):
+    """
+    Кэш ответов в памяти с вытеснением давно не использованных записей (LRU)
+
+    :param ttl: Время хранения ответов по ресурсам в секундах, по умолчанию constants.CACHE_TTL
+    :type ttl: dict
+
+    :param stale: Время stale-while-revalidate по ресурсам в секундах, по умолчанию constants.CACHE_STALE
+    :type stale: dict
+
+    :param negative: Время хранения ответов 404 и 422 по ресурсам в секундах, по умолчанию
+        constants.CACHE_NEGATIVE_TTL
+    :type negative: dict
+
+    :param max_entries: Максимальное количество записей
+    :type max_entries: int
+
+    :param max_bytes: Максимальный суммарный размер тел ответов в байтах
+    :type max_bytes: int or None
+    """
+
+    def __init__(self, ttl=None, max_entries=10000, max_bytes=64 * 1024 * 1024, stale=None, negative=None):
+        super(MemoryCache, self).__init__(ttl, stale, negative)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry, body=None):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old.size
+            self._entries[key] = entry
+            self.bytes += entry.size
+            while self._entries and (len(self._entries) > self.max_entries or
+                                     (self.max_bytes is not None and self.bytes > self.max_bytes)):
+                (evicted_key, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted.size
+                with self._stats_lock:
+                    self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.bytes -= entry.size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+
+class SQLiteCache(BaseCache):
+    """
+    Кэш ответов в файле SQLite, который сохраняется между перезапусками
+
+    Хранит исходное тело ответа в формате JSON, заголовки и время устаревания. Команда curl сохраняется без ключа
+    авторизации. База открывается в режиме WAL, поэтому
+    ее одновременно читают несколько процессов. При превышении max_bytes удаляются устаревшие, а затем
+    давно не использованные записи (проверка выполняется каждые vacuum_interval записей).
+
+    :param path: Путь к файлу базы
+    :type path: str
+
+    :param ttl: Время хранения ответов по ресурсам в секундах, по умолчанию constants.CACHE_TTL
+    :type ttl: dict
+
+    :param max_bytes: Максимальный суммарный размер тел ответов в байтах
+    :type max_bytes: int or None
+
+    :param stale: Время stale-while-revalidate по ресурсам в секундах, по умолчанию constants.CACHE_STALE
+    :type stale: dict
+
+    :param negative: Время хранения ответов 404 и 422 по ресурсам в секундах, по умолчанию
+        constants.CACHE_NEGATIVE_TTL
+    :type negative: dict
+
+    :param memory: Кэш в памяти перед базой, в него загружает записи :meth:`warm`
+    :type memory: MemoryCache or None
+    """
+
+    touch_interval = 60
+
+    vacuum_interval = 100
+
+    def __init__(self, path, ttl=None, max_bytes=256 * 1024 * 1024, memory=None, stale=None, negative=None):
+        super(SQLiteCache, self).__init__(ttl, stale, negative)
+        self._writes = 0
+        self.path = path
+        self.max_bytes = max_bytes
+        self.memory = memory
+        self._local = threading.local()
+        with self._connection() as db:
+            db.execute('CREATE TABLE IF NOT EXISTS responses ('
+                       'key TEXT PRIMARY KEY, resource TEXT, command TEXT, headers TEXT, status_code INTEGER, '
+                       'body TEXT, expires REAL, size INTEGER, accessed REAL)')
+            db.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+
+    def _connection(self):
+        db = getattr(self._local, 'db', None)
+        if db is None or self._local.pid != os.getpid():
+            # соединение родительского процесса после fork использовать нельзя, открывается новое
+            db = self._local.db = sqlite3.connect(self.path, timeout=30)
+            self._local.pid = os.getpid()
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+        return db
+
+    @staticmethod
+    def _entry(row):
+        (command, headers, status_code, body, expires, size) = row
+        value = (command, CaseInsensitiveDict(json.loads(headers)), status_code, json.loads(body))
+        return CacheEntry(value, expires, size)
+
+    def get(self, key):
+        if self.memory is not None:
+            entry = self.memory.get(key)
+            if entry is not None and entry.fresh():
+                return entry
+        db = self._connection()
+        row = db.execute('SELECT command, headers, status_code, body, expires, size, accessed FROM responses '
+                         'WHERE key = ?', (repr(key),)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if now - row[6] > self.touch_interval:
+            # время использования обновляется редко, чтобы чтение не блокировало другие процессы
+            with db:
+                db.execute('UPDATE responses SET accessed = ? WHERE key = ?', (now, repr(key)))
+        entry = self._entry(row[:6])
+        if self.memory is not None:
+            self.memory.set(key, entry)
+        return entry
+
+    def set(self, key, entry, body=None):
+        if self.memory is not None:
+            self.memory.set(key, entry)
+        (command, headers, status_code, data) = entry.value
+        if body is None:
+            # исходного тела нет у записей, продленных ответом 304, и у записей, созданных вручную
+            body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        command = command.redacted() if isinstance(command, CurlCommand) else str(command)
+        with self._connection() as db:
+            db.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                       (repr(key), key[0] if isinstance(key, tuple) else None, command,
+                        json.dumps(dict(headers)), status_code, body, entry.expires, len(body), time.time()))
+        self._writes += 1
+        if self.max_bytes is not None and self._writes % self.vacuum_interval == 0 and self.size() > self.max_bytes:
+            self.vacuum()
+
+    def delete(self, key):
+        if self.memory is not None:
+            self.memory.delete(key)
+        with self._connection() as db:
+            db.execute('DELETE FROM responses WHERE key = ?', (repr(key),))
+
+    def clear(self):
+        if self.memory is not None:
+            self.memory.clear()
+        with self._connection() as db:
+            db.execute('DELETE FROM responses')
+
+    def size(self):
+        """
+
+        :return: Суммарный размер тел ответов в базе в байтах
+        :rtype: int
+        """
+        return self._connection().execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def vacuum(self):
+        """
+        Удаление устаревших записей, которые уже нельзя отдать как stale, и, при превышении max_bytes,
+        давно не использованных
+        """
+        with self._connection() as db:
+            max_stale = max(self.stale.values()) if self.stale else 0
+            db.execute('DELETE FROM responses WHERE expires < ?', (time.time() - max_stale,))
+            if self.max_bytes is not None:
+                total = db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+                rows = db.execute('SELECT key, size FROM responses ORDER BY accessed').fetchall()
+                for (key, size) in rows:
+                    if total <= self.max_bytes:
+                        break
+                    db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                    total -= size
+                    with self._stats_lock:
+                        self.evictions += 1
+
+    def warm(self, resources=None):
+        """
+        Загрузка свежих записей из базы в кэш в памяти
+
+        :param resources: Ресурсы из RESOURCES, по умолчанию все
+        :type resources: list[str] or None
+
+        :return: Количество загруженных записей
+        :rtype: int
+        """
+        if self.memory is None:
+            self.memory = MemoryCache(ttl=self.ttl, stale=self.stale, negative=self.negative)
+        rows = self._connection().execute(
+            'SELECT key, resource, command, headers, status_code, body, expires, size FROM responses '
+            'WHERE expires >= ? ORDER BY accessed', (time.time(),)).fetchall()
+        count = 0
+        for row in rows:
+            if resources is None or row[1] in resources:
+                self.memory.set(literal_eval(row[0]), self._entry(row[2:]))
+                count += 1
+        return count
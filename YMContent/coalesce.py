@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import threading
+from concurrent.futures import Future
+
+
+def _canonical(value):
+    if isinstance(value, (list, tuple)):
+        return ','.join(str(v).strip() for v in value)
+    return str(value)
+
+
+def request_key(resource, req_id, params):
+    """
+    Канонический ключ запроса: ресурс, идентификатор и параметры без учета их порядка
+
+    :rtype: tuple
+    """
+    return (resource, None if req_id is None else str(req_id),
+            tuple(sorted((k, _canonical(v)) for (k, v) in (params or {}).items() if v is not None)))
+
+
+class SingleFlight(object):
+    """
+    Объединение одинаковых одновременных запросов из разных потоков: запрос выполняется один раз,
+    а все ожидающие потоки получают его результат или исключение
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.shared = 0
+
+    def do(self, key, fn, *args):
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight(object):
+    """
+    Объединение одинаковых одновременных запросов в цикле событий, см. :class:`SingleFlight`
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self.shared = 0
+
+    async def do(self, key, fn, *args):
+        import asyncio
+
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn(*args))
+            task.add_done_callback(lambda t: self._calls.pop(key, None))
+        else:
+            self.shared += 1
+        # отмена одного из ожидающих не должна отменять общий запрос
+        return await asyncio.shield(task)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+from functools import wraps
+
+from YMContent.exceptions import BaseAPIError, NetworkAPIError
+
+logger = logging.getLogger('YMContent')
+
+
+class AIMDController(object):
+    """
+    Адаптивное ограничение количества одновременных запросов (AIMD)
+
+    Пока в заголовках X-RateLimit-Global-Remaining и X-RateLimit-Method-Remaining остается больше
+    threshold от лимита, допустимое количество запросов растет на increase за каждое окно. При
+    приближении остатка к нулю или при ошибке запроса оно уменьшается в decrease раз.
+
+    :param maximum: Максимальное количество одновременных запросов
+    :type maximum: int
+
+    :param minimum: Минимальное количество одновременных запросов
+    :type minimum: int
+
+    :param initial: Начальное количество одновременных запросов, по умолчанию minimum
+    :type initial: int
+
+    :param increase: Аддитивный прирост за окно
+    :type increase: float
+
+    :param decrease: Мультипликативный коэффициент уменьшения
+    :type decrease: float
+
+    :param threshold: Доля остатка квоты, ниже которой количество запросов уменьшается
+    :type threshold: float
+    """
+
+    def __init__(self, maximum=10, minimum=1, initial=None, increase=1.0, decrease=0.5, threshold=0.2):
+        self.maximum = maximum
+        self.minimum = minimum
+        self.increase = increase
+        self.decrease = decrease
+        self.threshold = threshold
+        self.limit = float(initial or minimum)
+        self.in_flight = 0
+        self.successes = 0
+        self.errors = 0
+        self.increases = 0
+        self.decreases = 0
+        self._cond = threading.Condition()
+
+    def try_acquire(self):
+        """
+        Попытка начать запрос без ожидания
+
+        :rtype: bool
+        """
+        with self._cond:
+            if self.in_flight < int(self.limit):
+                self.in_flight += 1
+                return True
+            return False
+
+    def acquire(self):
+        """
+        Ожидание возможности начать запрос
+        """
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, result=None, error=None):
+        """
+        Завершение запроса с учетом его результата
+
+        :param result: Ответ API. Если не передан вместе с error, ограничение не меняется
+        :type result: YMContent.response.Base
+
+        :param error: Исключение, если запрос завершился ошибкой
+        :type error: BaseException
+        """
+        with self._cond:
+            self.in_flight -= 1
+            if error is None and result is None:
+                pass
+            elif error is not None or not self._healthy(result):
+                if error is not None:
+                    self.errors += 1
+                self.limit = max(float(self.minimum), self.limit * self.decrease)
+                self.decreases += 1
+            else:
+                self.successes += 1
+                if self.limit < self.maximum:
+                    self.limit = min(float(self.maximum), self.limit + self.increase / self.limit)
+                    self.increases += 1
+            self._cond.notify_all()
+
+    def _healthy(self, result):
+        for kind in ('global', 'method'):
+            try:
+                remaining = getattr(result, kind + '_remaining')
+                limit = getattr(result, kind + '_limit')
+            except (AttributeError, TypeError, ValueError):
+                continue
+            if limit and remaining < limit * self.threshold:
+                return False
+        return True
+
+    def wrap(self, method):
+        """
+        Обертка метода API, которая выполняет его в пределах текущего ограничения
+
+        :rtype: callable
+        """
+
+        @wraps(method)
+        def call(*args, **kwargs):
+            self.acquire()
+            try:
+                result = method(*args, **kwargs)
+            except (BaseAPIError, NetworkAPIError) as e:
+                self.release(error=e)
+                raise
+            except BaseException:
+                self.release()
+                raise
+            self.release(result)
+            return result
+
+        return call
+
+    def metrics(self):
+        """
+
+        :return: Текущие значения контроллера
+        :rtype: dict
+        """
+        with self._cond:
+            return {
+                'limit': self.limit,
+                'in_flight': self.in_flight,
+                'successes': self.successes,
+                'errors': self.errors,
+                'increases': self.increases,
+                'decreases': self.decreases,
+            }
@@ -125,3 +125,72 @@ SHOP = [
     'SHOP_ORGANIZATION',
     'SHOP_RATING',
     'SHOP_ALL']
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+
+# Время хранения ответов в кэше по ресурсам, в секундах
+CACHE_TTL = {
+    'categories': 6 * HOUR,
+    'categories/{}/children': 6 * HOUR,
+    'categories/{}': 6 * HOUR,
+    'categories/{}/filters': HOUR,
+    'categories/match': HOUR,
+
+    'models/{}': 10 * MINUTE,
+    'models/{}/reviews': HOUR,
+    'models/{}/offers': MINUTE,
+    'models/{}/offers/default': MINUTE,
+    'models/{}/offers/stat': 5 * MINUTE,
+    'models/{}/offers/filters': 10 * MINUTE,
+    'models/{}/opinions': HOUR,
+
+    'offers/{}': MINUTE,
+
+    'shops/{}': HOUR,
+    'shops/{}/opinions': HOUR,
+    'shops/{}/opinions/chronological': HOUR,
+
+    'geo/regions/{}/shops/summary': HOUR,
+    'geo/regions': 24 * HOUR,
+    'geo/regions/{}/children': 24 * HOUR,
+    'geo/regions/{}': 24 * HOUR,
+    'geo/suggest': 24 * HOUR,
+
+    'vendors': 24 * HOUR,
+    'vendors/{}': 24 * HOUR,
+    'vendors/match': 24 * HOUR,
+}
+
+# Время, в течение которого устаревший ответ из кэша отдается сразу, а обновляется в фоне, в секундах
+CACHE_STALE = {
+    'models/{}/offers/default': 10 * MINUTE,
+    'models/{}/offers/stat': 30 * MINUTE,
+}
+
+# Время хранения в кэше ответов 404 и 422 (несуществующие модели, предложения и т. д.), в секундах.
+# Всегда меньше CACHE_TTL ресурса: объект может появиться раньше, чем изменится существующий
+CACHE_NEGATIVE_TTL = {resource: CACHE_TTL[resource] // 6 for resource in (
+    'categories/{}',
+    'categories/{}/children',
+    'categories/{}/filters',
+
+    'models/{}',
+    'models/{}/reviews',
+    'models/{}/offers',
+    'models/{}/offers/default',
+    'models/{}/offers/stat',
+    'models/{}/offers/filters',
+    'models/{}/opinions',
+
+    'offers/{}',
+
+    'shops/{}',
+    'shops/{}/opinions',
+    'shops/{}/opinions/chronological',
+
+    'geo/regions/{}',
+    'geo/regions/{}/children',
+
+    'vendors/{}',
+)}
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import json
+
+DECODERS = ('orjson', 'simdjson', 'json')
+
+
+def _json():
+    return json.loads
+
+
+def _orjson():
+    import orjson
+    return orjson.loads
+
+
+def _simdjson():
+    import simdjson
+    return simdjson.loads
+
+
+_FACTORIES = {'json': _json, 'orjson': _orjson, 'simdjson': _simdjson}
+
+
+def available():
+    """
+
+    :return: Установленные декодеры JSON в порядке предпочтения
+    :rtype: list[str]
+    """
+    names = []
+    for name in DECODERS:
+        try:
+            _FACTORIES[name]()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_decoder(decoder=None):
+    """
+    Функция разбора тела ответа
+
+    :param decoder: Имя декодера ('json', 'orjson', 'simdjson'), функция, принимающая bytes, или None —
+        самый быстрый из установленных
+    :type decoder: str or callable or None
+
+    :return: Функция, которая принимает тело ответа в bytes и возвращает JSON
+    :rtype: callable
+
+    :raises ValueError: неизвестное имя декодера
+    :raises ImportError: декодер не установлен
+    """
+    if callable(decoder):
+        return decoder
+    if decoder is None:
+        return _FACTORIES[available()[0]]()
+    if decoder not in _FACTORIES:
+        raise ValueError('Unknown JSON decoder "{}"'.format(decoder))
+    return _FACTORIES[decoder]()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+import time
+from collections import deque
+
+
+class CurlCommand(object):
+    """
+    Эквивалент запроса в виде команды curl
+
+    Команда формируется только при первом преобразовании в строку, например при выводе в журнал
+    с уровнем DEBUG или при вызове :meth:`YMContent.response.Base.curl`.
+    """
+
+    __slots__ = ('request_headers', 'body', 'uri', '_text')
+
+    def __init__(self, request_headers, body, uri):
+        self.request_headers = request_headers
+        self.body = body
+        self.uri = uri
+        self._text = None
+
+    def __str__(self):
+        if self._text is None:
+            headers = ["'{0}: {1}'".format(k, v) for k, v in self.request_headers.items()]
+            headers = " -H ".join(sorted(headers))
+            self._text = "curl -H {headers} -d '{data}' '{uri}'".format(
+                data=self.body or "",
+                headers=headers,
+                uri=self.uri,
+            )
+        return self._text
+
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.uri)
+
+    def redacted(self):
+        """
+
+        :return: Команда curl со скрытым ключом авторизации
+        :rtype: str
+        """
+        if 'Authorization' not in self.request_headers:
+            return str(self)
+        return str(CurlCommand(dict(self.request_headers, Authorization='***'), self.body, self.uri))
+
+    def __eq__(self, other):
+        return str(self) == str(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(str(self))
+
+
+class RequestRecorder(object):
+    """
+    Запись последних запросов для разбора проблем
+
+    Хранит max_entries последних попыток запросов: ресурс, команду curl, HTTP код, заголовки ответа, время
+    ответа и не больше max_payload байт тела ответа.
+
+    :param max_entries: Количество хранимых запросов
+    :type max_entries: int
+
+    :param max_payload: Максимальный размер сохраняемой части тела ответа в байтах, 0 — без тела
+    :type max_payload: int
+    """
+
+    def __init__(self, max_entries=1000, max_payload=4096):
+        self.max_payload = max_payload
+        self._entries = deque(maxlen=max_entries)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def record(self, resource, command, status_code, headers, body, elapsed):
+        """
+        Запись попытки запроса
+
+        :param status_code: HTTP код ответа или None при сетевой ошибке
+        :type status_code: int or None
+
+        :param body: Тело ответа
+        :type body: bytes or None
+
+        :param elapsed: Время ответа в секундах без ожидания ограничителя запросов или None, если оно неизвестно
+        :type elapsed: float or None
+        """
+        payload = body[:self.max_payload] if body and self.max_payload else b''
+        if isinstance(payload, bytes):
+            payload = payload.decode('utf-8', 'replace')
+        entry = {
+            'time': time.time(),
+            'resource': resource,
+            'command': command,
+            'status_code': status_code,
+            'headers': dict(headers) if headers is not None else None,
+            'elapsed': elapsed,
+            'size': len(body) if body is not None else None,
+            'payload': payload,
+            'truncated': body is not None and len(body) > self.max_payload,
+        }
+        with self._lock:
+            self._entries.append(entry)
+
+    def entries(self, resource=None, authorization=False):
+        """
+
+        :param resource: Ресурс из RESOURCES, по умолчанию все
+        :type resource: str or None
+
+        :param authorization: Оставить в команде curl ключ авторизации, по умолчанию он скрыт
+        :type authorization: bool
+
+        :return: Записанные запросы, начиная с самого старого. Команда curl приведена к строке
+        :rtype: list[dict]
+        """
+        with self._lock:
+            entries = list(self._entries)
+        return [dict(entry, command=self._command(entry['command'], authorization)) for entry in entries
+                if resource is None or entry['resource'] == resource]
+
+    @staticmethod
+    def _command(command, authorization):
+        if not authorization and isinstance(command, CurlCommand):
+            return command.redacted()
+        return str(command)
+
+    def dump(self, path, authorization=False):
+        """
+        Сохранение записанных запросов в файл, по одному JSON на строку
+
+        :param path: Путь к файлу
+        :type path: str
+
+        :param authorization: Сохранить ключ авторизации в командах curl, по умолчанию он скрыт
+        :type authorization: bool
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            for entry in self.entries(authorization=authorization):
+                f.write(json.dumps(entry, ensure_ascii=False))
+                f.write('\n')
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -92,3 +92,7 @@ class WarrantyParamError(BaseException):
 
 class NoGeoIdOrIP(BaseException):
     pass
+
+
+class CircuitOpenError(NetworkAPIError):
+    pass
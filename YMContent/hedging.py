@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import threading
+from collections import deque
+
+HEDGED_RESOURCES = ('suggestions', 'redirect', 'models/{}/offers/default')
+
+
+class HedgingPolicy(object):
+    """
+    Политика дублирующих запросов для чувствительных к задержке ресурсов
+
+    Если ответ не получен за delay секунд (или за наблюдаемый percentile задержки ресурса), отправляется
+    второй такой же запрос, и используется ответ, пришедший первым. Дублирующий запрос не отправляется,
+    если оставшихся запросов к ресурсу меньше min_remaining.
+
+    :param resources: Ресурсы из RESOURCES, для которых отправляются дублирующие запросы
+    :type resources: tuple[str]
+
+    :param delay: Фиксированная задержка перед дублирующим запросом в секундах. По умолчанию используется
+        percentile наблюдаемых задержек
+    :type delay: float or None
+
+    :param percentile: Перцентиль задержки ресурса
+    :type percentile: int
+
+    :param window: Количество последних задержек, по которым считается перцентиль
+    :type window: int
+
+    :param min_samples: Минимальное количество наблюдений, без которого дублирующие запросы не отправляются
+    :type min_samples: int
+
+    :param min_remaining: Минимальный остаток запросов к ресурсу (X-RateLimit-Method-Remaining)
+    :type min_remaining: int
+    """
+
+    def __init__(self, resources=HEDGED_RESOURCES, delay=None, percentile=95, window=100, min_samples=20,
+                 min_remaining=5):
+        self.resources = resources
+        self.delay = delay
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self.min_remaining = min_remaining
+        self.sent = 0
+        self.won = 0
+        self._latencies = {}
+        self._lock = threading.Lock()
+
+    def hedge_delay(self, resource):
+        """
+
+        :return: Задержка перед дублирующим запросом или None, если дублировать запрос не нужно
+        :rtype: float or None
+        """
+        if resource not in self.resources:
+            return None
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            latencies = sorted(self._latencies.get(resource, ()))
+        if len(latencies) < self.min_samples:
+            return None
+        return latencies[min(len(latencies) - 1, len(latencies) * self.percentile // 100)]
+
+    def allowed(self, remaining):
+        """
+
+        :param remaining: Остаток запросов к ресурсу или None, если он неизвестен
+        :type remaining: int or float or None
+
+        :return: Можно ли отправить дублирующий запрос
+        :rtype: bool
+        """
+        return remaining is None or remaining >= self.min_remaining
+
+    def observe(self, resource, latency):
+        """
+        Учет задержки ответа ресурса
+        """
+        if resource in self.resources:
+            with self._lock:
+                self._latencies.setdefault(resource, deque(maxlen=self.window)).append(latency)
+
+    def record(self, hedge_won):
+        """
+        Учет отправленного дублирующего запроса
+        """
+        with self._lock:
+            self.sent += 1
+            if hedge_won:
+                self.won += 1
+
+    def metrics(self):
+        """
+
+        :return: Количество отправленных дублирующих запросов и запросов, на которые первым ответил дубль
+        :rtype: dict
+        """
+        with self._lock:
+            return {'sent': self.sent, 'won': self.won}
@@ -0,0 +1,661 @@
+# -*- coding: utf-8 -*-
+import gzip
+import heapq
+import json
+import os
+import re
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+
+from YMContent.exceptions import BaseAPIError
+from YMContent.objects import YMCategory, YMRegion, YMVendor
+
+# Порядок типов регионов в подсказках: сначала города, затем крупные регионы, затем районы и станции
+SUGGEST_TYPE_ORDER = ('CITY', 'COUNTRY', 'SUBJECT_FEDERATION', 'VILLAGE', 'RURAL_SETTLEMENT', 'CONTINENT',
+                      'COUNTRY_DISTRICT', 'REGION', 'OVERSEAS_TERRITORY', 'SUBJECT_FEDERATION_DISTRICT',
+                      'CITY_DISTRICT', 'SECONDARY_DISTRICT', 'METRO_STATION', 'MONORAIL_STATION', 'AIRPORT')
+
+_TYPE_RANK = dict((region_type, rank) for (rank, region_type) in enumerate(SUGGEST_TYPE_ORDER))
+
+_WORD_START = re.compile(r'(?<=[\s\-(])\w')
+
+
+def normalize(text):
+    """
+    Приведение названия к виду для поиска: нижний регистр, ё заменяется на е, лишние пробелы удаляются
+
+    :rtype: str
+    """
+    return ' '.join(text.lower().replace('ё', 'е').split())
+
+
+class TreeIndex(object):
+    """
+    Локальный снимок дерева объектов API
+
+    Реализация должна определить item_class, :meth:`_fetch_children` и :meth:`_signature`.
+
+    :param api: Клиент API
+    :type api: YMContent.YMAPI
+
+    :param path: Файл, в котором сохраняется снимок. Если файл существует, снимок загружается из него
+    :type path: str or None
+    """
+
+    item_class = None
+
+    def __init__(self, api, path=None):
+        self.api = api
+        self.path = path
+        self._clear()
+        self._loaded = False
+
+    def __len__(self):
+        self._ensure()
+        return len(self._nodes)
+
+    def __contains__(self, node_id):
+        self._ensure()
+        return int(node_id) in self._nodes
+
+    def _clear(self):
+        self._nodes = {}
+        self._parent = {}
+        self._children = {None: []}
+        self._depth = {}
+
+    def _ensure(self):
+        if not self._loaded:
+            if self.path and os.path.exists(self.path):
+                self.load()
+            else:
+                self.build()
+
+    def _fetch_children(self, node_id):
+        """
+        Дочерние объекты; для node_id None — объекты первого уровня
+
+        :rtype: list[dict]
+        """
+        raise NotImplementedError
+
+    def _signature(self, data):
+        """
+        Значения, при изменении которых поддерево объекта запрашивается заново в :meth:`refresh`
+
+        :rtype: tuple
+        """
+        raise NotImplementedError
+
+    def _fetch_level(self, parents):
+        # не через YMAPI.map: при адаптивном ограничении вложенные запросы страниц ждали бы внешний вызов
+        with ThreadPoolExecutor(max_workers=self.api.max_workers) as executor:
+            return list(zip(parents, executor.map(self._fetch_children, parents)))
+
+    def _add(self, data, parent):
+        node_id = data['id']
+        self._nodes[node_id] = data
+        self._parent[node_id] = parent
+        self._depth[node_id] = 0 if parent is None else self._depth[parent] + 1
+        self._children[node_id] = []
+        self._children[parent].append(node_id)
+
+    def _remove(self, node_id):
+        for child in self._children.pop(node_id, ()):
+            self._remove(child)
+        del self._nodes[node_id]
+        del self._parent[node_id]
+        del self._depth[node_id]
+
+    def _changed(self):
+        """
+        Вызывается после изменения снимка
+        """
+
+    @staticmethod
+    def _expandable(data):
+        return bool(data.get('childCount'))
+
+    def build(self):
+        """
+        Полный обход дерева
+
+        Объекты одного уровня запрашиваются параллельно в max_workers потоков клиента.
+        """
+        self._clear()
+        level = [None]
+        while level:
+            next_level = []
+            for (parent, children) in self._fetch_level(level):
+                for data in children:
+                    self._add(data, parent)
+                    if self._expandable(data):
+                        next_level.append(data['id'])
+            level = next_level
+        self._loaded = True
+        self._changed()
+        if self.path:
+            self.save()
+
+    def refresh(self):
+        """
+        Обновление снимка: заново запрашиваются только дочерние объекты тех объектов, у которых
+        изменились значения :meth:`_signature`
+
+        :return: Идентификаторы добавленных и измененных объектов
+        :rtype: set[int]
+        """
+        self._ensure()
+        changed = set()
+        level = [None]
+        while level:
+            next_level = []
+            for (parent, children) in self._fetch_level(level):
+                fresh = set(data['id'] for data in children)
+                for node_id in [c for c in self._children[parent] if c not in fresh]:
+                    self._remove(node_id)
+                self._children[parent] = [c for c in self._children[parent] if c in fresh]
+                for data in children:
+                    old = self._nodes.get(data['id'])
+                    if old is not None and self._parent[data['id']] != parent:
+                        # объект перенесен к другому родителю
+                        self._children[self._parent[data['id']]].remove(data['id'])
+                        self._remove(data['id'])
+                        old = None
+                    if old is None:
+                        self._add(data, parent)
+                    elif self._signature(old) == self._signature(data):
+                        self._replace(data)
+                        continue
+                    else:
+                        self._replace(data)
+                    changed.add(data['id'])
+                    if self._expandable(data):
+                        next_level.append(data['id'])
+                    else:
+                        for child in self._children[data['id']]:
+                            self._remove(child)
+                        self._children[data['id']] = []
+            level = next_level
+        self._changed()
+        if self.path:
+            self.save()
+        return changed
+
+    def _replace(self, data):
+        self._nodes[data['id']] = data
+
+    def _snapshot(self):
+        return {}
+
+    @staticmethod
+    def _stored(data):
+        return data
+
+    def save(self, path=None):
+        """
+        Сохранение снимка в файл
+
+        :param path: Путь к файлу, по умолчанию path снимка
+        :type path: str
+        """
+        path = path or self.path
+        snapshot = self._snapshot()
+        snapshot['nodes'] = [[self._stored(self._nodes[node_id]), parent] for (node_id, parent) in self._walk(None)]
+        tmp = '{}.tmp'.format(path)
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def load(self, path=None):
+        """
+        Загрузка снимка из файла
+
+        :param path: Путь к файлу, по умолчанию path снимка
+        :type path: str
+        """
+        with open(path or self.path, encoding='utf-8') as f:
+            snapshot = json.load(f)
+        self._clear()
+        for (data, parent) in snapshot['nodes']:
+            self._add(data, parent)
+        self._loaded = True
+        self._changed()
+
+    def _walk(self, node_id):
+        # родитель всегда идет раньше дочерних объектов
+        stack = [(child, node_id) for child in reversed(self._children.get(node_id, ()))]
+        while stack:
+            (child, parent) = stack.pop()
+            yield child, parent
+            stack.extend((c, child) for c in reversed(self._children[child]))
+
+    def _get(self, node_id):
+        self._ensure()
+        data = self._nodes.get(int(node_id))
+        return self.item_class(data) if data is not None else None
+
+    def parent(self, node_id):
+        """
+
+        :return: Родитель или None для объекта первого уровня
+        """
+        self._ensure()
+        parent = self._parent.get(int(node_id))
+        return self.item_class(self._nodes[parent]) if parent is not None else None
+
+    def depth(self, node_id):
+        """
+
+        :return: Уровень вложенности, у объектов первого уровня 0
+        :rtype: int
+        """
+        self._ensure()
+        return self._depth[int(node_id)]
+
+    def roots(self):
+        """
+
+        :return: Объекты первого уровня
+        :rtype: list
+        """
+        self._ensure()
+        return [self.item_class(self._nodes[c]) for c in self._children[None]]
+
+    def children(self, node_id):
+        """
+
+        :return: Дочерние объекты
+        :rtype: list
+        """
+        self._ensure()
+        return [self.item_class(self._nodes[c]) for c in self._children.get(int(node_id), ())]
+
+    def ancestors(self, node_id):
+        """
+
+        :return: Родители, начиная с ближайшего и заканчивая объектом первого уровня
+        :rtype: list
+        """
+        self._ensure()
+        result = []
+        parent = self._parent.get(int(node_id))
+        while parent is not None:
+            result.append(self.item_class(self._nodes[parent]))
+            parent = self._parent[parent]
+        return result
+
+    def descendants(self, node_id):
+        """
+
+        :return: Все вложенные объекты в порядке обхода в глубину
+        :rtype: list
+        """
+        self._ensure()
+        return [self.item_class(self._nodes[c]) for (c, parent) in self._walk(int(node_id))]
+
+
+class CategoryTree(TreeIndex):
+    """
+    Локальный снимок дерева категорий
+
+    Дерево один раз обходится запросами :meth:`YMAPI.categories` и :meth:`YMAPI.categories_children`,
+    после чего категория, ее родители, дочерние категории и поддеревья находятся без обращения к API.
+    :meth:`refresh` запрашивает заново только поддеревья категорий, у которых изменились childCount
+    или modelCount.
+
+    :param api: Клиент API
+    :type api: YMContent.YMAPI
+
+    :param geo_id: Идентификатор региона
+    :type geo_id: int or str
+
+    :param remote_ip: IP-адрес пользователя
+    :type remote_ip: str
+
+    :param path: Файл, в котором сохраняется снимок. Если файл существует, снимок загружается из него
+    :type path: str or None
+    """
+
+    item_class = YMCategory
+
+    fields = 'STATISTICS'
+
+    def __init__(self, api, geo_id=225, remote_ip=None, path=None):
+        super(CategoryTree, self).__init__(api, path)
+        self.geo_id = geo_id
+        self.remote_ip = remote_ip
+
+    def _params(self):
+        return {'geo_id': self.geo_id, 'remote_ip': self.remote_ip, 'fields': self.fields}
+
+    def _fetch_children(self, category_id):
+        if category_id is None:
+            items = self.api.iter_categories(**self._params())
+        else:
+            items = self.api.iter_categories_children(category_id, **self._params())
+        return [item.json() for item in items]
+
+    def _signature(self, data):
+        return data.get('childCount'), data.get('modelCount')
+
+    def _snapshot(self):
+        return {'geo_id': self.geo_id, 'remote_ip': self.remote_ip}
+
+    def category(self, category_id):
+        """
+
+        :return: Категория или None, если ее нет в дереве
+        :rtype: YMCategory or None
+        """
+        return self._get(category_id)
+
+
+class RegionIndex(TreeIndex):
+    """
+    Локальный индекс дерева регионов для подсказок без обращения к API
+
+    Дерево один раз обходится запросами :meth:`YMAPI.geo_regions` и :meth:`YMAPI.geo_regions_children`
+    с названиями в разных падежах. :meth:`suggest` ищет регионы по началу названия или любого его слова
+    двоичным поиском в отсортированном массиве названий. У возвращаемых регионов заполнены parent и country,
+    как при запросе с fields=PARENT.
+
+    :param api: Клиент API
+    :type api: YMContent.YMAPI
+
+    :param path: Файл, в котором сохраняется снимок. Если файл существует, снимок загружается из него
+    :type path: str or None
+    """
+
+    item_class = YMRegion
+
+    fields = 'DECLENSIONS'
+
+    def __init__(self, api, path=None):
+        super(RegionIndex, self).__init__(api, path)
+        self._keys = []
+        self._ids = []
+        self._names = {}
+
+    def _fetch_children(self, region_id):
+        if region_id is None:
+            items = self.api.iter_geo_regions(fields=self.fields)
+        else:
+            items = self.api.iter_geo_regions_children(region_id, fields=self.fields)
+        return [item.json() for item in items]
+
+    def _signature(self, data):
+        return data.get('childCount'),
+
+    def _link(self, data, parent):
+        # родитель и страна — ссылки на словари других узлов, поэтому цепочка parent строится без копирования
+        parent_data = self._nodes[parent] if parent is not None else None
+        data['parent'] = parent_data
+        if parent_data is None:
+            data['country'] = None
+        elif parent_data.get('type') == 'COUNTRY':
+            data['country'] = parent_data
+        else:
+            data['country'] = parent_data.get('country')
+
+    def _add(self, data, parent):
+        super(RegionIndex, self)._add(data, parent)
+        self._link(data, parent)
+
+    def _replace(self, data):
+        # словарь обновляется на месте, чтобы ссылки parent и country вложенных регионов остались верными
+        node = self._nodes[data['id']]
+        node.clear()
+        node.update(data)
+        self._link(node, self._parent[data['id']])
+
+    @staticmethod
+    def _stored(data):
+        return dict((k, v) for (k, v) in data.items() if k not in ('parent', 'country'))
+
+    def _changed(self):
+        names = []
+        self._names = {}
+        for (region_id, data) in self._nodes.items():
+            self._names[region_id] = normalize(data.get('name') or '')
+            variants = set(normalize(data.get(field) or '') for field in ('name', 'nameGenitive', 'nameAccusative'))
+            for variant in variants:
+                if variant:
+                    names.append((variant, region_id))
+                    names.extend((variant[m.start():], region_id) for m in _WORD_START.finditer(variant))
+        names.sort()
+        self._keys = [name for (name, region_id) in names]
+        self._ids = [region_id for (name, region_id) in names]
+
+    def region(self, region_id):
+        """
+
+        :return: Регион или None, если его нет в индексе
+        :rtype: YMRegion or None
+        """
+        return self._get(region_id)
+
+    def _rank(self, region_id, prefix):
+        name = self._names[region_id]
+        return (name != prefix,
+                not name.startswith(prefix),
+                _TYPE_RANK.get(self._nodes[region_id].get('type'), len(_TYPE_RANK)),
+                self._depth[region_id],
+                name,
+                region_id)
+
+    def suggest(self, name_part, types=None, count=30):
+        """
+        Поиск регионов по частичному или полному наименованию, аналог :meth:`YMAPI.geo_suggest`
+
+        Сначала идут регионы с точно совпадающим названием, затем с названием, которое начинается с
+        name_part, затем регионы по порядку типов SUGGEST_TYPE_ORDER и уровню вложенности.
+
+        :param name_part: Полное или частичное название региона
+        :type name_part: str
+
+        :param types: Типы регионов, см. :meth:`YMAPI.geo_suggest`
+        :type types: str or list[str]
+
+        :param count: Максимальное количество регионов
+        :type count: int
+
+        :return: Регионы
+        :rtype: list[YMRegion]
+        """
+        self._ensure()
+        prefix = normalize(name_part)
+        if not prefix:
+            return []
+        if isinstance(types, str):
+            types = [t.strip() for t in types.split(',')]
+        if types and 'ALL' in types:
+            types = None
+
+        start = bisect_left(self._keys, prefix)
+        end = bisect_left(self._keys, prefix + '\uffff', start)
+        found = set(self._ids[start:end])
+        if types:
+            found = [region_id for region_id in found if self._nodes[region_id].get('type') in types]
+        best = heapq.nsmallest(count, found, key=lambda region_id: self._rank(region_id, prefix))
+        return [YMRegion(self._nodes[region_id]) for region_id in best]
+
+
+_TOKEN = re.compile(r'\w+')
+
+
+def _vendor_keys(name):
+    tokens = _TOKEN.findall(normalize(name or ''))
+    return ''.join(tokens), ''.join(sorted(tokens))
+
+
+def _trigrams(key):
+    padded = '^{}$'.format(key)
+    return set(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class VendorIndex(object):
+    """
+    Локальный словарь производителей для подбора производителя по названию без обращения к API
+
+    Словарь один раз заполняется постраничным обходом :meth:`YMAPI.vendors` и хранится по столбцам
+    (идентификаторы, названия, сайты), в файле — в виде сжатого JSON. Название сравнивается по словам
+    без учета регистра и знаков препинания, а при неточном совпадении — по индексу триграмм (коэффициент
+    Дайса). Если лучшая оценка ниже threshold, производитель подбирается запросом
+    :meth:`YMAPI.vendors_match`.
+
+    :param api: Клиент API
+    :type api: YMContent.YMAPI
+
+    :param path: Файл, в котором сохраняется словарь. Если файл существует, словарь загружается из него
+    :type path: str or None
+
+    :param threshold: Минимальная оценка совпадения от 0 до 1, при которой не нужен запрос к API
+    :type threshold: float
+
+    :param fallback: Подбирать производителя запросом к API при низкой оценке
+    :type fallback: bool
+    """
+
+    def __init__(self, api, path=None, threshold=0.7, fallback=True):
+        self.api = api
+        self.path = path
+        self.threshold = threshold
+        self.fallback = fallback
+        self.local = 0
+        self.remote = 0
+        self._ids = []
+        self._names = []
+        self._sites = []
+        self._exact = {}
+        self._postings = {}
+        self._sizes = []
+        self._loaded = False
+
+    def __len__(self):
+        self._ensure()
+        return len(self._ids)
+
+    def _ensure(self):
+        if not self._loaded:
+            if self.path and os.path.exists(self.path):
+                self.load()
+            else:
+                self.build()
+
+    def build(self):
+        """
+        Заполнение словаря постраничным обходом :meth:`YMAPI.vendors`
+        """
+        vendors = [vendor.json() for vendor in self.api.iter_vendors(parallel=True)]
+        self._columns([v.get('id') for v in vendors], [v.get('name') for v in vendors],
+                      [v.get('site') for v in vendors])
+        if self.path:
+            self.save()
+
+    def _columns(self, ids, names, sites):
+        self._ids = ids
+        self._names = names
+        self._sites = sites
+        self._exact = {}
+        self._postings = {}
+        self._sizes = []
+        for (position, name) in enumerate(names):
+            (joined, ordered) = _vendor_keys(name)
+            self._exact.setdefault(joined, position)
+            self._exact.setdefault(ordered, position)
+            grams = _trigrams(joined)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+        self._loaded = True
+
+    def save(self, path=None):
+        """
+        Сохранение словаря в файл
+
+        :param path: Путь к файлу, по умолчанию path словаря
+        :type path: str
+        """
+        path = path or self.path
+        tmp = '{}.tmp'.format(path)
+        with gzip.open(tmp, 'wt', encoding='utf-8') as f:
+            json.dump({'ids': self._ids, 'names': self._names, 'sites': self._sites}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def load(self, path=None):
+        """
+        Загрузка словаря из файла
+
+        :param path: Путь к файлу, по умолчанию path словаря
+        :type path: str
+        """
+        with gzip.open(path or self.path, 'rt', encoding='utf-8') as f:
+            columns = json.load(f)
+        self._columns(columns['ids'], columns['names'], columns['sites'])
+
+    def _vendor(self, position):
+        return YMVendor({'id': self._ids[position], 'name': self._names[position], 'site': self._sites[position]})
+
+    def candidates(self, name, count=5):
+        """
+        Наиболее похожие производители из словаря
+
+        :param name: Название производителя
+        :type name: str
+
+        :param count: Максимальное количество производителей
+        :type count: int
+
+        :return: Кортежи (производитель, оценка от 0 до 1), начиная с лучшего
+        :rtype: list[tuple]
+        """
+        self._ensure()
+        (joined, ordered) = _vendor_keys(name)
+        if not joined:
+            return []
+        position = self._exact.get(joined, self._exact.get(ordered))
+        if position is not None:
+            return [(self._vendor(position), 1.0)]
+
+        grams = _trigrams(joined)
+        common = {}
+        for gram in grams:
+            for position in self._postings.get(gram, ()):
+                common[position] = common.get(position, 0) + 1
+        scores = ((2.0 * shared / (len(grams) + self._sizes[position]), position)
+                  for (position, shared) in common.items())
+        return [(self._vendor(position), score) for (score, position) in heapq.nlargest(count, scores)]
+
+    def match(self, name, fields=None):
+        """
+        Подбор производителя по названию, аналог :meth:`YMAPI.vendors_match`
+
+        :param name: Название производителя
+        :type name: str
+
+        :param fields: Свойства производителя для запроса к API, см. :meth:`YMAPI.vendors_match`
+        :type fields: str or list[str]
+
+        :return: Производитель или None, если подходящий производитель не найден
+        :rtype: YMVendor or None
+        """
+        best = self.candidates(name, count=1)
+        if best and best[0][1] >= self.threshold:
+            self.local += 1
+            return best[0][0]
+        if not self.fallback:
+            return None
+        self.remote += 1
+        try:
+            return self.api.vendors_match(name, fields=fields).vendor
+        except BaseAPIError:
+            return None
+
+    def stats(self):
+        """
+
+        :return: Количество подборов по словарю и запросом к API
+        :rtype: dict
+        """
+        return {'local': self.local, 'remote': self.remote}
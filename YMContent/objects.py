@@ -1,3773 +1,1383 @@
 # -*- coding: utf-8 -*-
-class YMBase(object):
-    def __init__(self, data):
-        self.data = data
-
-    def json(self):
-        """
-
-        :return: Объект в виде JSON
-        :rtype: dict
-        """
-        return self.data
-
-
-class YMRegion(YMBase):
-    """Регион"""
+from collections import OrderedDict
+
+_MISSING = object()
+
+# типы из :rtype: для проверки данных; float в API может прийти целым числом
+_TYPES = {
+    'None': (type(None),),
+    'bool': (bool,),
+    'int': (int,),
+    'float': (int, float),
+    'str': (str,),
+    'dict': (dict,),
+}
+
+
+class cached_property(property):
+    """
+    Свойство, значение которого вычисляется при первом обращении и сохраняется в объекте
+
+    Используется для вложенных объектов, чтобы при каждом обращении не создавать новые обертки.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        cache = obj._cache
+        if cache is None:
+            value = self.fget(obj)
+            obj._cache = {self.name: value}
+            return value
+        value = cache.get(self.name, _MISSING)
+        if value is _MISSING:
+            value = cache[self.name] = self.fget(obj)
+        return value
+
+
+def _lookup(keys, default=None, attr=False):
+    """
+    Функция чтения значения из JSON, собранная под конкретный путь
+
+    Путь из одного ключа без значения по умолчанию читается замыканием, в остальных случаях функция
+    компилируется. Например, для
+    пути ('geoPoint', 'coordinates', 'latitude') и attr=True получается функция без циклов и промежуточных
+    словарей::
+
+        def get(obj):
+            value = obj.data
+            value = value.get('geoPoint')
+            if value is None:
+                return default
+            value = value.get('coordinates')
+            if value is None:
+                return default
+            return value.get('latitude', default)
+
+    :param keys: Ключи от корня JSON
+    :type keys: tuple[str]
+
+    :param default: Значение, если по пути ничего нет
+
+    :param attr: Функция принимает объект и читает его атрибут data, иначе принимает сам JSON
+    :type attr: bool
+
+    :rtype: callable
+    """
+    root = 'obj.data' if attr else 'obj'
+    if len(keys) == 1 and default is None:
+        key = keys[0]
+        if attr:
+            def get(obj):
+                return obj.data.get(key)
+        else:
+            def get(obj):
+                return obj.get(key)
+        return get
+    lines = ['def get(obj):', '    value = ' + root]
+    for key in keys[:-1]:
+        lines += ['    value = value.get({!r})'.format(key), '    if value is None:', '        return default']
+    lines.append('    return value.get({!r}, default)'.format(keys[-1]))
+    namespace = {'default': default}
+    exec('\n'.join(lines), namespace)
+    return namespace['get']
+
+
+class Field(object):
+    """
+    Поле в схеме объекта
+
+    По схеме при создании класса генерируются свойства с документацией, а также работают
+    :meth:`YMBase.validate` и :meth:`YMBase.columns`.
+
+    :param name: Имя свойства
+    :type name: str
+
+    :param rtype: Тип значения в нотации документации: ``int``, ``str or None``, ``YMRegion``, ``list[YMPhoto]``.
+        По нему определяются вложенный класс и признак списка
+    :type rtype: str
+
+    :param doc: Описание поля
+    :type doc: str
+
+    :param path: Путь к значению в JSON через точку, по умолчанию совпадает с именем свойства
+    :type path: str or None
+
+    :param example: Пример значения для документации
+    :type example: str or None
+
+    :param values: Возможные значения и их описания
+    :type values: tuple[tuple[str, str]] or None
+
+    :param note: Примечание для документации
+    :type note: str or None
+
+    :param default: Значение при отсутствии поля в JSON
+    """
+
+    __slots__ = ('name', 'rtype', 'doc', 'path', 'example', 'values', 'note', 'default', 'types', 'nested', 'many',
+                 '_get')
+
+    def __init__(self, name, rtype, doc, path=None, example=None, values=None, note=None, default=None):
+        self.name = name
+        self.rtype = rtype
+        self.doc = doc
+        self.path = tuple((path or name).split('.'))
+        self.example = example
+        self.values = values
+        self.note = note
+        self.default = default
+        self._get = None
+        self.types = ()
+        self.nested = None
+        self.many = False
+        for t in rtype.split(' or '):
+            if t.startswith('list['):
+                self.many = True
+                t = t[len('list['):-1]
+            if t.startswith('YM'):
+                self.nested = t
+            else:
+                self.types += _TYPES[t]
 
     def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
+        return '<{}: {} ({})>'.format(self.__class__.__name__, self.name, self.rtype)
 
-    @property
-    def id(self):
+    def value(self, data):
         """
 
-        :return: Идентификатор региона
-        :rtype: int
+        :param data: JSON объекта
+        :type data: dict
 
-        225
+        :return: Значение поля в JSON без преобразования во вложенный объект
         """
-        return self.data.get('id')
+        if self._get is None:
+            self._get = _lookup(self.path, self.default)
+        return self._get(data)
 
-    @property
-    def name(self):
+    def docstring(self):
         """
 
-        :return: Наименование региона
+        :return: Документация свойства
         :rtype: str
+        """
+        doc = ':return: {}\n:rtype: {}'.format(self.doc, self.rtype)
+        if self.note:
+            doc = '.. note:: {}\n\n{}'.format(self.note, doc)
+        if self.example:
+            doc += '\n\n' + self.example
+        if self.values:
+            doc += '\n\n' + '\n'.join('* **{}** — {}'.format(value, text).rstrip() for (value, text) in self.values)
+        return doc
 
-        Россия
+    def accessor(self):
         """
-        return self.data.get('name')
 
-    @property
-    def type(self):
+        :return: Свойство для класса объекта
+        :rtype: property
         """
+        get = _lookup(self.path, self.default, attr=True)
+        if self.nested is None:
+            fget = get
+        elif self.many:
+            name = self.nested
 
-        :return: Тип региона
-        :rtype: str
+            def fget(obj):
+                cls = globals()[name]
+                return [cls(item) for item in get(obj) or ()]
+        else:
+            name = self.nested
 
-        * **CONTINENT** — континент
-        * **REGION** — регион
-        * **COUNTRY** — страна
-        * **COUNTRY_DISTRICT** — федеральный округ
-        * **SUBJECT_FEDERATION** — субъект федерации
-        * **CITY** — город
-        * **VILLAGE** — село
-        * **CITY_DISTRICT** — район города
-        * **METRO_STATION** — станиция метро
-        * **SUBJECT_FEDERATION_DISTRICT** — район субъекта федерации
-        * **AIRPORT** — аэропорт
-        * **OVERSEAS_TERRITORY** — отдельная территория какого-либо государства, расположенная в другой части света (например, Ангилья, Гренландия, Бермудские острова и т. д.)
-        * **SECONDARY_DISTRICT** — район города второго уровня (например, для ВАО Москвы районами второго уровня являются Измайлово, Новокосино, Перово и т. д.)
-        * **MONORAIL_STATION** — станция монорельса
-        * **RURAL_SETTLEMENT** — сельское поселение
-        * **OTHER** — другой тип населенного пункта
-        * **HIDDEN** —
-        """
-        return self.data.get('type')
+            def fget(obj):
+                return globals()[name](get(obj))
+        fget.__name__ = self.name
+        fget.__doc__ = self.docstring()
+        if self.nested is None:
+            return property(fget)
+        accessor = cached_property(fget)
+        accessor.name = self.name
+        return accessor
 
-    @property
-    def childCount(self):
-        """
 
-        :return: Количество дочерних регионов
-        :rtype: int
+class YMBase(object):
+    """
+    Базовый класс объектов
 
-        14
-        """
-        return self.data.get('childCount')
+    Поля объекта описываются в FIELDS списком :class:`Field`. Свойства для них создаются один раз при
+    создании класса, поля родительских классов наследуются.
+    """
 
-    @property
-    def nameAccusative(self):
-        """
+    __slots__ = ('data', '_cache')
 
-        :return: Наименование региона в винительном падеже
-        :rtype: str or None
-        """
-        return self.data.get('nameAccusative')
+    FIELDS = ()
+    _schema = OrderedDict()
 
-    @property
-    def nameGenitive(self):
-        """
+    def __init__(self, data):
+        self.data = data
+        self._cache = None
 
-        :return: Наименование региона в родительном падеже
-        :rtype: str or None
-        """
-        return self.data.get('nameGenitive')
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        schema = OrderedDict(cls._schema)
+        for field in cls.__dict__.get('FIELDS', ()):
+            schema[field.name] = field
+            setattr(cls, field.name, field.accessor())
+        cls._schema = schema
 
-    @property
-    def country(self):
+    def json(self):
         """
 
-        :return: Страна, к которой относится регион
-        :rtype: YMRegion or None
+        :return: Объект в виде JSON
+        :rtype: dict
         """
-        return YMRegion(self.data.get('country'))
+        return self.data
 
-    @property
-    def parent(self):
+    @classmethod
+    def schema(cls):
+        """
+
+        :return: Поля объекта вместе с унаследованными
+        :rtype: list[Field]
+        """
+        return list(cls._schema.values())
+
+    @classmethod
+    def _problems(cls, data, prefix):
+        if not isinstance(data, dict):
+            yield '{}: expected object, got {}'.format(prefix, type(data).__name__)
+            return
+        for field in cls._schema.values():
+            name = '{}.{}'.format(prefix, field.name)
+            value = field.value(data)
+            if field.nested:
+                nested = globals()[field.nested]
+                if field.many:
+                    if value is not None and not isinstance(value, list):
+                        yield '{}: expected list, got {}'.format(name, type(value).__name__)
+                        continue
+                    for (i, item) in enumerate(value or ()):
+                        for problem in nested._problems(item, '{}[{}]'.format(name, i)):
+                            yield problem
+                elif value is not None:
+                    for problem in nested._problems(value, name):
+                        yield problem
+                elif type(None) not in field.types:
+                    yield '{}: missing'.format(name)
+            elif field.many:
+                if not isinstance(value, list) or not all(isinstance(v, field.types) for v in value):
+                    yield '{}: expected {}, got {!r}'.format(name, field.rtype, value)
+            elif value is None:
+                if type(None) not in field.types:
+                    yield '{}: missing'.format(name)
+            elif not isinstance(value, field.types) or (isinstance(value, bool) and bool not in field.types):
+                yield '{}: expected {}, got {}'.format(name, field.rtype, type(value).__name__)
+            elif field.values and value not in dict(field.values):
+                yield '{}: unexpected value {!r}'.format(name, value)
+
+    def validate(self):
+        """
+        Проверка JSON объекта по схеме: наличие полей, их типы и значения из документированных списков.
+        Вложенные объекты проверяются рекурсивно
+
+        :return: Описания найденных несоответствий, пустой список, если их нет
+        :rtype: list[str]
         """
+        return list(self._problems(self.data, self.__class__.__name__))
+
+    @classmethod
+    def _column(cls, name):
+        keys = ()
+        schema = cls._schema
+        parts = name.split('.')
+        for (i, part) in enumerate(parts):
+            field = schema.get(part)
+            if field is None or field.many or (i < len(parts) - 1) != bool(field.nested):
+                raise ValueError('Unknown column "{}" for {}'.format(name, cls.__name__))
+            keys += field.path
+            if field.nested:
+                schema = globals()[field.nested]._schema
+        return _lookup(keys, field.default)
 
-        :return: Родительский регион
-        :rtype: YMRegion or None
+    @classmethod
+    def columns(cls, items, fields=None):
         """
-        return YMRegion(self.data.get('parent'))
+        Выгрузка полей объектов по столбцам, например для pandas.DataFrame
 
+        Значения читаются из JSON по схеме без создания объектов. Поля вложенных объектов указываются
+        через точку: ``YMOffer.columns(offers, ['id', 'shop.name', 'price.value'])``
 
-class YMWarning(YMBase):
-    """Предупреждение"""
+        :param items: Объекты этого класса или их JSON
+        :type items: list
 
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('shortText'))
+        :param fields: Имена полей, по умолчанию все поля без вложенных объектов
+        :type fields: list[str] or None
 
-    @property
-    def text(self):
-        """
+        :return: Словарь имя поля — список значений
+        :rtype: OrderedDict
 
-        :return: Текст предупреждения
-        :rtype: str
+        :raises ValueError: неизвестное поле или список вложенных объектов
         """
-        return self.data.get('text')
+        if fields is None:
+            fields = [name for (name, field) in cls._schema.items() if not field.nested]
+        getters = [(name, cls._column(name)) for name in fields]
+        rows = [item.data if isinstance(item, YMBase) else item for item in items]
+        return OrderedDict((name, [None if data is None else get(data) for data in rows]) for (name, get) in getters)
 
-    @property
-    def shortText(self):
-        """
 
-        :return: Краткий текст предупреждения
-        :rtype: str
-        """
-        return self.data.get('shortText')
+class YMRegion(YMBase):
+    """Регион"""
 
-    @property
-    def age(self):
-        """
+    __slots__ = ()
+
+    FIELDS = (
+        Field('id', 'int', 'Идентификатор региона', example='225'),
+        Field('name', 'str', 'Наименование региона', example='Россия'),
+        Field('type', 'str', 'Тип региона', values=(
+            ('CONTINENT', 'континент'),
+            ('REGION', 'регион'),
+            ('COUNTRY', 'страна'),
+            ('COUNTRY_DISTRICT', 'федеральный округ'),
+            ('SUBJECT_FEDERATION', 'субъект федерации'),
+            ('CITY', 'город'),
+            ('VILLAGE', 'село'),
+            ('CITY_DISTRICT', 'район города'),
+            ('METRO_STATION', 'станиция метро'),
+            ('SUBJECT_FEDERATION_DISTRICT', 'район субъекта федерации'),
+            ('AIRPORT', 'аэропорт'),
+            ('OVERSEAS_TERRITORY', 'отдельная территория какого-либо государства, расположенная в другой части света (например, Ангилья, Гренландия, Бермудские острова и т. д.)'),
+            ('SECONDARY_DISTRICT', 'район города второго уровня (например, для ВАО Москвы районами второго уровня являются Измайлово, Новокосино, Перово и т. д.)'),
+            ('MONORAIL_STATION', 'станция монорельса'),
+            ('RURAL_SETTLEMENT', 'сельское поселение'),
+            ('OTHER', 'другой тип населенного пункта'),
+            ('HIDDEN', ''),
+        )),
+        Field('childCount', 'int', 'Количество дочерних регионов', example='14'),
+        Field('nameAccusative', 'str or None', 'Наименование региона в винительном падеже'),
+        Field('nameGenitive', 'str or None', 'Наименование региона в родительном падеже'),
+        Field('country', 'YMRegion or None', 'Страна, к которой относится регион'),
+        Field('parent', 'YMRegion or None', 'Родительский регион'),
+    )
 
-        :return: Возрастное ограничение для категории
-        :rtype: int
-        """
-        return self.data.get('age')
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
+
+
+class YMWarning(YMBase):
+    """Предупреждение"""
+
+    __slots__ = ()
+
+    FIELDS = (
+        Field('text', 'str', 'Текст предупреждения'),
+        Field('shortText', 'str', 'Краткий текст предупреждения'),
+        Field('age', 'int', 'Возрастное ограничение для категории'),
+    )
+
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('shortText'))
 
 
 class YMCategory(YMBase):
     """Категория"""
 
+    __slots__ = ()
+
+    FIELDS = (
+        Field('id', 'int', 'Идентификатор категории', example='90402'),
+        Field('name', 'str', 'Наименование категории', example='Авто'),
+        Field('fullName', 'str or None', 'Полное наименование категории', example='Товары для авто- и мототехники'),
+        Field('parent', 'int or None', 'Идентификатор родительской категории', example='90401'),
+        Field('adult', 'bool', 'Признак категории, имеющей возрастное ограничение (18+)', example='False', default=False),
+        Field('link', 'str or None', 'Ссылка на карточку категории на Яндекс.Маркете', example='https://market.yandex.ru/catalog/90402/list?hid=90402&onstock=1&pp=1001'),
+        Field('childCount', 'int', 'Количество дочерних категорий', example='12'),
+        Field('modelCount', 'int or None', 'Количество моделей в категории', example='181170'),
+        Field('offerCount', 'int or None', 'Количество товарных предложений в категории', example='3531718'),
+        Field('advertisingModel', 'str or None', 'Тип размещения товарных предложений в категории', values=(
+            ('CPA', 'плата за заказы, оформленные прямо на Яндекс.Маркете'),
+            ('CPC', 'плата только за клики по предложению магазина'),
+            ('HYBRID', 'возможны оба варианта размещения товарных предложений в категории'),
+        )),
+        Field('viewType', 'str or None', 'Тип отображения товаров в категории', values=(
+            ('LIST', 'список'),
+            ('GRID', 'сетка'),
+        )),
+        Field('warnings', 'list[YMWarning]', 'Предупреждения, связанные с категорией'),
+    )
+
     def __repr__(self):
         return '<{}: {} ({})>'.format(self.__class__.__name__, self.data.get('name'), self.data.get('id'))
 
-    @property
-    def id(self):
-        """
 
-        :return: Идентификатор категории
-        :rtype: int
+class YMSearchCategory(YMCategory):
+    __slots__ = ()
 
-        90402
-        """
-        return self.data.get('id')
+    FIELDS = (
+        Field('findCount', 'int', 'Количество категорий в результатах поиска', example='12'),
+    )
 
-    @property
-    def name(self):
-        """
 
-        :return: Наименование категории
-        :rtype: str
+class YMSortOption(YMBase):
+    """Опции сортировки"""
 
-        Авто
-        """
-        return self.data.get('name')
+    __slots__ = ()
 
-    @property
-    def fullName(self):
-        """
+    FIELDS = (
+        Field('id', 'str', 'Идентификатор варианта сортировки', example='aprice'),
+        Field('how', 'str', 'Направление сортировки', values=(
+            ('ASC', 'по возрастанию'),
+            ('DESC', 'по убыванию'),
+        )),
+        Field('text', 'str', 'Наименование данного варианта сортировки', example='Сначала дешёвые'),
+    )
 
-        :return: Полное наименование категории
-        :rtype: str or None
+    def __repr__(self):
+        return '<{}: {} ({})>'.format(self.__class__.__name__, self.data.get('id'), self.data.get('how'))
 
-        Товары для авто- и мототехники
-        """
-        return self.data.get('fullName')
 
-    @property
-    def parent(self):
-        """
+class YMSort(YMBase):
+    __slots__ = ()
+
+    FIELDS = (
+        Field('text', 'str', 'Наименование типа сортировки', example='по цене'),
+        Field('field', 'str or None', 'Тип сортировки', note='Для sort=DISCOUNT возможна только сортировка по убыванию (how=DESC).', values=(
+            ('RELEVANCY', 'сортировка по релевантности.'),
+            ('PRICE', 'сортировка по цене.'),
+            ('RATING', 'сортировка по рейтингу.'),
+            ('DISTANCE', 'сортировка по расстоянию до ближайшей точки продаж (значение доступно только при указании местоположения пользователя).'),
+            ('POPULARITY', 'сортировка по популярности.'),
+            ('DISCOUNT', 'сортировка по размеру скидки.'),
+            ('QUALITY', 'сортировка по рейтингу.'),
+            ('OPINIONS', 'сортировка по количеству отзывов.'),
+            ('DATE', 'сортировка по дате.'),
+            ('DELIVERY_TIME', 'сортировка по времени доставки.'),
+            ('NOFFERS', 'сортировка по количеству предложений'),
+        )),
+        Field('options', 'list[YMSortOption]', 'Доступные варианты для данного типа сортировки'),
+    )
 
-        :return: Идентификатор родительской категории
-        :rtype: int or None
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('text'))
 
-        90401
-        """
-        return self.data.get('parent')
 
-    @property
-    def adult(self):
-        """
+class YMFilterValue(YMBase):
+    __slots__ = ()
+
+    FIELDS = (
+        Field('id', 'str', 'Идентификатор значения фильтра, используется для установки значения фильтра', example='12612583'),
+        Field('name', 'str', 'Текстовое описание значение фильтра', example='AGV'),
+        Field('initialFound', 'int or None', 'Количество моделей/офферов в выдаче, попадающих под значение фильтра, при отсутствии других фильтров', example='56'),
+        Field('found', 'int or None', 'Количество моделей/офферов в выдаче, попадающих под значение фильтра, при текущих условиях фильтрации', example='56'),
+        Field('sku', 'str or None', 'id sku на который переключимся, если проставим это значение в фильтр (карта фильтров)'),
+        Field('checked', 'bool or None', 'Признак того, что значение выбрано в соответствии с текущими условиями фильтрации'),
+        Field('color', 'str or None', 'Значение цвета', note='Только для фильтров типов COLOR и Filters.FilterType#PHOTO_PICKER'),
+        Field('unitId', 'str or None', 'Код единицы измерения размера значения фильтра', note='Только для фильтра типа SIZE'),
+        Field('photo', 'str or None', 'Ссылку на картинку для выбора цвета', note='Только для фильтра типа Filters.FilterType#PHOTO_PICKER'),
+    )
 
-        :return: Признак категории, имеющей возрастное ограничение (18+)
-        :rtype: bool
+    def __repr__(self):
+        return '<{}: {} ({})>'.format(self.__class__.__name__, self.data.get('id'), self.data.get('name'))
 
-        False
-        """
-        return self.data.get('adult', False)
 
-    @property
-    def link(self):
-        """
+class YMDatasourceCriteria(YMBase):
+    __slots__ = ()
 
-        :return: Ссылка на карточку категории на Яндекс.Маркете
-        :rtype: str or None
+    FIELDS = (
+        Field('id', 'str', 'Идентификатор фильтра'),
+        Field('value', 'str', 'Значение фильтра'),
+        Field('text', 'str', 'Текст поисковой фразы'),
+    )
 
-        https://market.yandex.ru/catalog/90402/list?hid=90402&onstock=1&pp=1001
-        """
-        return self.data.get('link')
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
 
-    @property
-    def childCount(self):
-        """
 
-        :return: Количество дочерних категорий
-        :rtype: int
+class YMIcon(YMBase):
+    __slots__ = ()
 
-        12
-        """
-        return self.data.get('childCount')
+    FIELDS = (
+        Field('url', 'str', 'Ссылка на изображение'),
+    )
 
-    @property
-    def modelCount(self):
-        """
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('url'))
 
-        :return: Количество моделей в категории
-        :rtype: int or None
 
-        181170
-        """
-        return self.data.get('modelCount')
+class YMDatasource(YMBase):
+    __slots__ = ()
 
-    @property
-    def offerCount(self):
-        """
+    FIELDS = (
+        # todo Нет примера
+        Field('type', 'str', 'Тип источника данных'),
+        Field('hid', 'int', 'Идентификатор категории', example='91491'),
+        Field('nid', 'int', 'Идентификатор узла навигационного дерева', example='54726'),
+        Field('sort', 'str or None', 'Вариант/параметр, по которому осуществляется сортировка', path='order.sort', values=(
+            ('POPULARITY', 'По популярности'),
+            ('PRICE', 'По цене'),
+            ('DATE', 'Сначала новые'),
+            ('RELEVANCE', 'По релевантности'),
+            ('RATING', 'По рейтингу и цене'),
+            ('DISTANCE', 'По удаленности'),
+            ('DISCOUNT', 'По скидке (сортировка работает только по убыванию)'),
+            ('QUALITY', 'По рейтингу'),
+            ('OPINIONS', 'По отзывам'),
+            ('DELIVERY_TIME', 'По времени доставки'),
+        )),
+        Field('how', 'str or None', 'Направление сортировки', path='order.how', values=(
+            ('ASC', 'по возрастанию;'),
+            ('DESC', 'по убыванию.'),
+        )),
+        Field('criteria', 'list[YMDatasourceCriteria]', 'Список условий фильтрации моделей и товарных предложений источника'),
+    )
 
-        :return: Количество товарных предложений в категории
-        :rtype: int or None
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-        3531718
-        """
-        return self.data.get('offerCount')
 
-    @property
-    def advertisingModel(self):
-        """
+class YMNavigationNode(YMBase):
+    __slots__ = ()
 
-        :return: Тип размещения товарных предложений в категории
-        :rtype: str or None
+    FIELDS = (
+        Field('id', 'int', 'Идентификатор навигационного узла (nid)', example='54726'),
+        Field('hid', 'int', 'Идентификатор товарной категории (hid)', example='91491'),
+        Field('shortName', 'str', 'Краткое наименование навигационного узла', example='Мобильные телефоны'),
+        # todo бывает нескольких видов, предположительно category, virtual, link
+        Field('type', 'str', 'Тип узла навигационного дерева'),
+        Field('offerCount', 'int or None', 'Количество товарных предложений в категории узла', example='55595'),
+        Field('modelCount', 'int or None', 'Количество моделей в категории узла', example='3002'),
+        # todo нет примера
+        Field('visual', 'bool or None', 'Признак визуальной категории'),
+        # todo нет примера
+        Field('maxDiscount', 'str or None', 'Максимальная скидка в категории'),
+        Field('name', 'str', 'Полное наименование навигационного узла', example='Мобильные телефоны'),
+        Field('datasource', 'YMDatasource', 'Информация о источнике данных для узла навигационного дерева'),
+        # todo нет примера
+        Field('icons', 'list[YMIcon]', 'Список изображений, относящихся к данному узлу навигационного дерева'),
+        # todo нет примера
+        Field('parents', 'list[YMNavigationNode]', 'Иерархический список всех родителей узла, начиная с корня'),
+        # todo нет примера
+        Field('categories', 'list[YMNavigationNode]', 'Список дочерних узлов'),
+    )
 
-        * **CPA** — плата за заказы, оформленные прямо на Яндекс.Маркете
-        * **CPC** — плата только за клики по предложению магазина
-        * **HYBRID** — возможны оба варианта размещения товарных предложений в категории
-        """
-        return self.data.get('advertisingModel')
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
 
-    @property
-    def viewType(self):
-        """
 
-        :return: Тип отображения товаров в категории
-        :rtype: str or None
+class YMFilter(YMBase):
+    """Фильтр"""
 
-        * **LIST** — список
-        * **GRID** — сетка
-        """
-        return self.data.get('viewType')
+    __slots__ = ()
+
+    FIELDS = (
+        Field('id', 'str', 'Идентификатор фильтра', example='-2'),
+        Field('name', 'str', 'Наименование фильтра', example='Гарантия производителя'),
+        Field('type', 'str', 'Тип фильтра', values=(
+            ('BOOLEAN', 'логический тип'),
+            ('NUMBER', 'числовой тип, задает диапазон допустимых значений'),
+            ('ENUM', 'тип перечисление, задает список допустимых значений, множественный выбор'),
+            ('COLOR', 'фильтр по цвету, аналогичен ENUM, значения фильтра дополнительно содержат HEX-код соответствующего цвета'),
+            ('SIZE', 'фильтр по размеру, аналогичен ENUM, значения фильтра дополнительно содержат код единиц измерения'),
+            ('RADIO', 'аналогичен ENUM, но допускает выбор только одного значения'),
+            ('TEXT', 'тип фильтра для фильтрации по поисковой фразе'),
+            ('PHOTO_PICKER', ''),
+        )),
+        # todo нет примера
+        Field('description', 'str or None', 'Описание фильтра'),
+        # todo нет примера
+        Field('unit', 'str or None', 'Единицы измерения значений фильтра'),
+        # todo нет примера
+        Field('defaultUnit', 'str or None', 'Код единиц измерения значений фильтра, используемых по умолчанию'),
+        # todo нет примера
+        Field('values', 'list[YMFilterValue]', 'Список значений фильтра'),
+        # todo никогда не возвращается
+        Field('max', 'str or None', 'Максимальное значение числового фильтра'),
+        # todo никогда не возвращается
+        Field('min', 'str or None', 'Минимальное значение числового фильтра'),
+        # todo никогда не возвращается
+        Field('value', 'str or None', 'Выбранное значение числового фильтра'),
+        # todo никогда не возвращается
+        Field('precision', 'int or None', 'Количество знаков поле запятой у значений фильтра'),
+    )
 
-    @property
-    def warnings(self):
-        """
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
 
-        :return: Предупреждения, связанные с категорией
-        :rtype: list[YMWarning]
-        """
-        return [YMWarning(warning) for warning in self.data.get('warnings', [])]
 
+class YMThumbnail(YMBase):
+    __slots__ = ()
 
-class YMSearchCategory(YMCategory):
-    @property
-    def findCount(self):
-        """
+    FIELDS = (
+        Field('width', 'int', 'Ширина изображения', example='321'),
+        Field('height', 'int', 'Высота изображения', example='620'),
+        Field('url', 'str', 'Ссылка на изображение', example='https://avatars.mds.yandex.net/get-mpic/397397/img_id7051974271832358544.png/orig'),
+        # todo нет примера
+        Field('container', 'str', 'container', values=(
+            ('W50xH50', '50x50'),
+            ('W100xH100', '100x100'),
+            ('W150xH150', '150x150'),
+            ('W200xH200', '200x200'),
+            ('W300xH300', '300x300'),
+        )),
+    )
 
-        :return: Количество категорий в результатах поиска
-        :rtype: int
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('url'))
 
-        12
-        """
-        return self.data.get('findCount')
 
+class YMCriteria(YMBase):
+    __slots__ = ()
 
-class YMSortOption(YMBase):
-    """Опции сортировки"""
+    FIELDS = (
+        # todo нет примера
+        Field('id', 'str', 'Идентификатор фильтра'),
+        # todo нет примера
+        Field('value', 'str', 'Значение фильтра'),
+        # todo нет примера
+        Field('text', 'str or None', 'Текст поисковой фразы'),
+    )
 
     def __repr__(self):
-        return '<{}: {} ({})>'.format(self.__class__.__name__, self.data.get('id'), self.data.get('how'))
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('url'))
 
-    @property
-    def id(self):
-        """
 
-        :return: Идентификатор варианта сортировки
-        :rtype: str
+class YMModelPhoto(YMBase):
+    __slots__ = ()
 
-        aprice
-        """
-        return self.data.get('id')
+    FIELDS = (
+        Field('width', 'int', 'Ширина изображения', example='321'),
+        Field('height', 'int', 'Высота изображения', example='620'),
+        Field('url', 'str', 'Ссылка на изображение', example='https://avatars.mds.yandex.net/get-mpic/397397/img_id7051974271832358544.png/orig'),
+        # todo нет примера
+        Field('colorId', 'str or None', 'Код значения фильтра по цвету'),
+        # todo нет примера
+        Field('thumbnails', 'list[YMThumbnail]', 'Уменьшенные копии изображения'),
+        # todo нет примера
+        Field('criteria', 'list[YMCriteria]', 'Критерий фильтрации копии изображения'),
+    )
 
-    @property
-    def how(self):
-        """
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('url'))
 
-        :return: Направление сортировки
-        :rtype: str
 
-        * **ASC** — по возрастанию
-        * **DESC** — по убыванию
-        """
-        return self.data.get('how')
+class YMPrice(YMBase):
+    __slots__ = ()
 
-    @property
-    def text(self):
-        """
+    FIELDS = (
+        Field('max', 'str or None', 'Максимальная цена'),
+        Field('min', 'str or None', 'Минимальная цена'),
+        Field('avg', 'str or None', 'Среднее значение цены'),
+        Field('discount', 'str or None', 'Скидка'),
+        Field('base', 'str or None', 'Базовое значение цены'),
+    )
 
-        :return: Наименование данного варианта сортировки
-        :rtype: str
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-        Сначала дешёвые
-        """
-        return self.data.get('text')
 
+class YMShopPrice(YMBase):
+    __slots__ = ()
 
-class YMSort(YMBase):
+    FIELDS = (
+        Field('value', 'str', 'Значение цены'),
+        Field('discount', 'str or None', 'Скидка'),
+        Field('base', 'str or None', 'Базовая цена'),
+        Field('shopMin', 'str or None', 'Минимальная цена из всех склеенных офферов в данном магазине'),
+        Field('shopMax', 'str or None', 'Максимальная цена из всех склеенных офферов в данном магазине'),
+    )
 
     def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('text'))
+        return '<{}'.format(self.__class__.__name__)
 
-    @property
-    def text(self):
-        """
 
-        :return: Наименование типа сортировки
-        :rtype: str
+class YMVendorCategory(YMCategory):
+    __slots__ = ()
 
-        по цене
-        """
-        return self.data.get('text')
+    FIELDS = (
+        Field('popularity', 'float', 'Оценка популярности'),
+        Field('children', 'list[YMVendorCategory]', 'Список дочерних категорий'),
+    )
 
-    @property
-    def field(self):
-        """
 
-        :return: Тип сортировки
-        :rtype: str or None
+class YMVendor(YMBase):
+    __slots__ = ()
+
+    FIELDS = (
+        Field('id', 'int', 'Идентификатор производителя'),
+        Field('name', 'str or None', 'Наименование производителя'),
+        Field('site', 'str or None', 'Ссылка на веб-сайт производителя'),
+        Field('picture', 'str or None', 'Ссылка на изображение логотипа производителя'),
+        Field('recommendedShops', 'str or None', 'Ссылка на страницу производителя с рекомендованными магазинами'),
+        Field('link', 'str or None', 'Ссылка на карточку производителя на большом маркете'),
+        Field('categories', 'list[YMVendorCategory]', 'Список категорий, в которых представлен данный производитель'),
+        Field('topCategories', 'list[YMVendorCategory]', 'Список наиболее популярных категорий товаров производителя'),
+    )
 
-        * **RELEVANCY** — сортировка по релевантности.
-        * **PRICE** — сортировка по цене.
-        * **RATING** — сортировка по рейтингу.
-        * **DISTANCE** — сортировка по расстоянию до ближайшей точки продаж (значение доступно только при указании местоположения пользователя).
-        * **POPULARITY** — сортировка по популярности.
-        * **DISCOUNT** — сортировка по размеру скидки.
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
 
-        .. note:: Для sort=DISCOUNT возможна только сортировка по убыванию (how=DESC).
 
-        * **QUALITY** — сортировка по рейтингу.
-        * **OPINIONS** — сортировка по количеству отзывов.
-        * **DATE** — сортировка по дате.
-        * **DELIVERY_TIME** — сортировка по времени доставки.
-        * **NOFFERS** — сортировка по количеству предложений
-        """
-        return self.data.get('field')
+class YMRatingDistribution(YMBase):
+    __slots__ = ()
 
-    @property
-    def options(self):
-        """
+    FIELDS = (
+        Field('value', 'float', 'Значение оценки'),
+        Field('count', 'int', 'Количество оценок с указанным значением'),
+        Field('percent', 'int', 'Доля оценок с указанным значением среди всех оценок'),
+    )
 
-        :return: Доступные варианты для данного типа сортировки
-        :rtype: list[YMSortOption]
-        """
-        return [YMSortOption(option) for option in self.data.get('options', [])]
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
 
-class YMFilterValue(YMBase):
+class YMRatingStatus(YMBase):
+    __slots__ = ()
 
-    def __repr__(self):
-        return '<{}: {} ({})>'.format(self.__class__.__name__, self.data.get('id'), self.data.get('name'))
+    FIELDS = (
+        Field('id', 'str', 'Код статуса рейтинга'),
+        Field('name', 'str', 'Наименование статуса рейтинга'),
+    )
 
-    @property
-    def id(self):
-        """
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-        :return: Идентификатор значения фильтра, используется для установки значения фильтра
-        :rtype: str
 
-        12612583
-        """
-        return self.data.get('id')
+class YMRating(YMBase):
+    __slots__ = ()
 
-    @property
-    def name(self):
-        """
+    FIELDS = (
+        Field('value', 'float or int', 'Средняя оценка рейтинга'),
+        Field('count', 'int', 'Количество оценок'),
+        Field('distribution', 'list[YMRatingDistribution]', 'Информация о распределении оценок'),
+        Field('status', 'list[YMRatingStatus]', 'Статус рейтинга', path='distribution'),
+    )
 
-        :return: Текстовое описание значение фильтра
-        :rtype: str
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-        AGV
-        """
-        return self.data.get('name')
 
-    @property
-    def initialFound(self):
-        """
+class YMFacts(YMBase):
+    __slots__ = ()
 
-        :return: Количество моделей/офферов в выдаче, попадающих под значение фильтра, при отсутствии других фильтров
-        :rtype: int or None
+    FIELDS = (
+        Field('pro', 'list[str]', 'Достоинства'),
+        Field('contra', 'list[str]', 'Недостатки'),
+    )
 
-        56
-        """
-        return self.data.get('initialFound')
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-    @property
-    def found(self):
-        """
 
-        :return: Количество моделей/офферов в выдаче, попадающих под значение фильтра, при текущих условиях фильтрации
-        :rtype: int or None
+class YMModelWarning(YMBase):
+    __slots__ = ()
 
-        56
-        """
-        return self.data.get('found')
+    FIELDS = (
+        Field('code', 'str', 'Строковый код дисклеймера'),
+        Field('message', 'str', 'Текст дисклеймера'),
+    )
 
-    @property
-    def sku(self):
-        """
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('code'))
 
-        :return: id sku на который переключимся, если проставим это значение в фильтр (карта фильтров)
-        :rtype: str or None
-        """
-        return self.data.get('sku')
 
-    @property
-    def checked(self):
-        """
+class YMModification(YMBase):
+    __slots__ = ()
+
+    FIELDS = (
+        Field('id', 'int', 'Идентификатор модели-модификации'),
+        Field('name', 'str', 'Наименование модели-модификации'),
+        Field('description', 'str', 'Описание модели-модификации'),
+        Field('popularity', 'str', 'Оценка популярности модели-модификации'),
+        Field('offerCount', 'int', 'Кол-во товарных предложений для данной модификации'),
+        Field('shopCount', 'int', 'Кол-во магазинов, имеющих товарные предложения данной модификации'),
+        Field('price', 'YMPrice', 'Информация о цене модификации'),
+        Field('alternatePrices', 'YMPrice', 'Информация о ценах на модификацию в альтернативной валюте запроса'),
+    )
 
-        :return: Признак того, что значение выбрано в соответствии с текущими условиями фильтрации
-        :rtype: bool or None
-        """
-        return self.data.get('checked')
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
 
-    @property
-    def color(self):
-        """
 
-        .. note:: Только для фильтров типов COLOR и Filters.FilterType#PHOTO_PICKER
+class YMSpecificationFeature(YMBase):
+    __slots__ = ()
 
-        :return: Значение цвета
-        :rtype: str or None
-        """
-        return self.data.get('color')
+    FIELDS = (
+        Field('name', 'str', 'Наименование характеристики'),
+        Field('value', 'str', 'Значение характеристики'),
+    )
 
-    @property
-    def unitId(self):
-        """
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('name'))
 
-        .. note:: Только для фильтра типа SIZE
 
-        :return: Код единицы измерения размера значения фильтра
-        :rtype: str or None
-        """
-        return self.data.get('unitId')
+class YMSpecification(YMBase):
+    __slots__ = ()
 
-    @property
-    def photo(self):
-        """
+    FIELDS = (
+        Field('name', 'str', 'Название группы характеристик'),
+        Field('features', 'list[YMSpecificationFeature]', '-'),
+    )
 
-        .. note:: Только для фильтра типа Filters.FilterType#PHOTO_PICKER
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('name'))
 
-        :return: Ссылку на картинку для выбора цвета
-        :rtype: str or None
-        """
-        return self.data.get('photo')
 
+class YMParameterOption(YMBase):
+    __slots__ = ()
 
-class YMDatasourceCriteria(YMBase):
+    FIELDS = (
+        Field('id', 'int', 'Идентификатор значения параметра'),
+        Field('name', 'str', 'Название значения параметра'),
+    )
 
     def __repr__(self):
         return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
 
-    @property
-    def id(self):
-        """
 
-        :return: Идентификатор фильтра
-        :rtype: str
-        """
-        return self.data.get('id')
+class YMParameter(YMBase):
+    __slots__ = ()
+
+    FIELDS = (
+        Field('type', 'str', 'Тип параметра категории'),
+        Field('parameterId', 'int', 'Идентификатор параметра'),
+        Field('multivalue', 'bool', 'Признак, что параметр имеет несколько значений'),
+        Field('name', 'str', 'Название параметра'),
+        Field('unit', 'str', 'Единица измерения параметра'),
+        Field('mandatory', 'bool', 'Является ли атрибут обязательным'),
+        Field('values', 'list[bool]', 'Список значений параметра'),
+        Field('options', 'list[YMParameterOption]', 'Список возможных значений параметра'),
+    )
 
-    @property
-    def value(self):
-        """
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('type'))
 
-        :return: Значение фильтра
-        :rtype: str
-        """
-        return self.data.get('value')
 
-    @property
-    def text(self):
-        """
+class YMUserRelated(YMBase):
+    __slots__ = ()
 
-        :return: Текст поисковой фразы
-        :rtype: str
-        """
-        return self.data.get('text')
+    FIELDS = (
+        Field('inComparisonList', 'bool', 'Модель находится в списках сравнений'),
+        Field('inWishlist', 'bool', 'Модель находится в отложеннных'),
+    )
 
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-class YMIcon(YMBase):
 
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('url'))
+class YMModel(YMBase):
+    __slots__ = ()
+
+    FIELDS = (
+        Field('id', 'int', 'Идентификатор модели', example='1732210983'),
+        Field('name', 'str', 'Наименование модели', example='Смартфон Apple iPhone X 256GB'),
+        Field('kind', 'str or None', 'Тип товара', example='автомагнитола'),
+        Field('type', 'str', 'Тип модели', values=(
+            ('MODEL', 'Обычная модель'),
+            ('GROUP', 'Групповая модель'),
+            ('MODIFICATION', 'Модификация'),
+            ('BOOK', 'Книга'),
+            ('CLUSTER', 'Визуальная модель'),
+        )),
+        Field('isNew', 'bool', 'Признак "новизны" товара', example='False'),
+        Field('link', 'str', 'Ссылка на карточку модели', example='https://market.yandex.ru/product/1732210983?hid=91491&pp=1001'),
+        Field('vendorLink', 'str or None', 'Ссылка на страницу производителя', example='https://market.yandex.ru/brands/267101?pp=1001'),
+        # todo пустое описание
+        # todo нет примера
+        Field('barcode', 'str or None', 'Штрих-код модели'),
+        # todo пустое описание
+        # todo нет примера
+        Field('vendorCode', 'str or None', 'Общий идентификатор модели'),
+        Field('offerCount', 'int', 'Количество товарных предложений модели в регионе запроса', example='248'),
+        Field('opinionCount', 'int', 'Количество отзывов на модель', example='33'),
+        Field('reviewCount', 'int', 'Количество статей/обзоров на модель', example='6'),
+        # todo нет примера
+        Field('modificationCount', 'int or None', 'Количество модификаций групповой модели. Поле отсутствует в выдаче, если модель не групповая'),
+        # todo нет примера
+        Field('lastUpdate', 'int or None', 'Дата-время последнего обновления модели в спсике стравнения'),
+        # todo пустое описание
+        # todo нет примера
+        Field('aliases', 'str or None', '---'),
+        # todo нет примера
+        Field('parent', 'int or None', 'Идентификатор модели', path='parent.id'),
+        Field('description', 'str', 'Описание модели', example='GSM, LTE-A, смартфон, iOS 11, вес 174 г, ШхВхТ 70.9x143.6x7.7 мм, экран 5.8", 2436x1125, Bluetooth, NFC, Wi-Fi, GPS, ГЛОНАСС, фотокамера 12 МП, память 256 Гб'),
+        Field('photo', 'YMModelPhoto', 'Основное изображение модели'),
+        Field('photos', 'list[YMModelPhoto]', 'Остальные изображения модели'),
+        Field('category', 'YMCategory', 'Информация о категории, к которой относится модель'),
+        Field('navigationNode', 'YMNavigationNode', 'Информация об узле навигационного дерева, к которому относится модель'),
+        Field('price', 'YMPrice', 'Информация о цене модели в основной валюте запроса'),
+        Field('alternatePrice', 'YMPrice', 'Информация о цене модели в альтернативной валюте запроса', path='price'),
+        Field('vendor', 'YMVendor', 'Информация о производителе модели'),
+        Field('rating', 'YMRating', 'Информация о рейтинге модели'),
+        Field('facts', 'YMFacts', 'Факты о модели'),
+        Field('warning', 'str or None', 'Дисклеймер, связанный с моделью'),
+        Field('warnings', 'list[YMModelWarning]', 'Строковый код дисклеймера'),
+        Field('filters', 'list[YMFilter]', 'Список фильтров, предназначенных для фильтрации моделей/модификаций'),
+        Field('modifications', 'list[YMModification]', 'Список модификаций групповой модели'),
+        Field('specification', 'list[YMSpecification]', 'Основные характеристики модели'),
+        Field('parameters', 'list[YMParameter]', 'Параметры модели'),
+        Field('userRelated', 'list[YMUserRelated]', 'Информация, касающаяся текущего пользователя'),
+    )
 
-    @property
-    def url(self):
-        """
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
 
-        :return: Ссылка на изображение
-        :rtype: str
-        """
-        return self.data.get('url')
 
+class YMModelReview(YMBase):
+    __slots__ = ()
 
-class YMDatasource(YMBase):
+    FIELDS = (
+        Field('url', 'str', 'URL обзорной статьи на модель'),
+        Field('title', 'str', 'Заголовок обзора на модель'),
+        Field('favIcon', 'str', 'URL значка веб-сайта с обзором на модель'),
+    )
 
     def __repr__(self):
         return '<{}>'.format(self.__class__.__name__)
 
-    @property
-    def type(self):
-        """
 
-        :return: Тип источника данных
-        :rtype: str
-        """
-        # todo Нет примера
-        return self.data.get('type')
-
-    @property
-    def hid(self):
-        """
-
-        :return: Идентификатор категории
-        :rtype: int
-
-        91491
-        """
-        return self.data.get('hid')
-
-    @property
-    def nid(self):
-        """
-
-        :return: Идентификатор узла навигационного дерева
-        :rtype: int
-
-        54726
-        """
-        return self.data.get('nid')
-
-    @property
-    def sort(self):
-        """
-
-        :return: Вариант/параметр, по которому осуществляется сортировка
-        :rtype: str or None
-
-        * **POPULARITY** — По популярности
-        * **PRICE** — По цене
-        * **DATE** — Сначала новые
-        * **RELEVANCE** — По релевантности
-        * **RATING** — По рейтингу и цене
-        * **DISTANCE** — По удаленности
-        * **DISCOUNT** — По скидке (сортировка работает только по убыванию)
-        * **QUALITY** — По рейтингу
-        * **OPINIONS** — По отзывам
-        * **DELIVERY_TIME** — По времени доставки
-        """
-        return self.data.get('order',{}).get('sort')
-
-    @property
-    def how(self):
-        """
-
-        :return: Направление сортировки
-        :rtype: str or None
-
-        * **ASC** — по возрастанию;
-        * **DESC** — по убыванию.
-        """
-        return self.data.get('order', {}).get('how')
-
-    @property
-    def criteria(self):
-        """
-
-        :return: Список условий фильтрации моделей и товарных предложений источника
-        :rtype: list[YMDatasourceCriteria]
-        """
-        return [YMDatasourceCriteria(criteria) for criteria in self.data.get('criteria', [])]
-
-
-class YMNavigationNode(YMBase):
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
-
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор навигационного узла (nid)
-        :rtype: int
-
-        54726
-        """
-        return self.data.get('id')
-
-    @property
-    def hid(self):
-        """
-
-        :return: Идентификатор товарной категории (hid)
-        :rtype: int
-
-        91491
-        """
-        return self.data.get('hid')
-
-    @property
-    def shortName(self):
-        """
-
-        :return: Краткое наименование навигационного узла
-        :rtype: str
-
-        Мобильные телефоны
-        """
-        return self.data.get('shortName')
-
-    @property
-    def type(self):
-        """
-
-        :return: Тип узла навигационного дерева
-        :rtype: str
-        """
-        # todo бывает нескольких видов, предположительно category, virtual, link
-        return self.data.get('type')
-
-    @property
-    def offerCount(self):
-        """
-
-        :return: Количество товарных предложений в категории узла
-        :rtype: int or None
-
-        55595
-        """
-        return self.data.get('offerCount')
-
-    @property
-    def modelCount(self):
-        """
-
-        :return: Количество моделей в категории узла
-        :rtype: int or None
-
-        3002
-        """
-        return self.data.get('modelCount')
-
-    @property
-    def visual(self):
-        """
-
-        :return: Признак визуальной категории
-        :rtype: bool or None
-        """
-        # todo нет примера
-        return self.data.get('visual')
-
-    @property
-    def maxDiscount(self):
-        """
-
-        :return: Максимальная скидка в категории
-        :rtype: str or None
-        """
-        # todo нет примера
-        return self.data.get('maxDiscount')
-
-    @property
-    def name(self):
-        """
-
-        :return: Полное наименование навигационного узла
-        :rtype: str
-
-        Мобильные телефоны
-        """
-        return self.data.get('name')
-
-    @property
-    def datasource(self):
-        """
-
-        :return: Информация о источнике данных для узла навигационного дерева
-        :rtype: YMDatasource
-        """
-        return YMDatasource(self.data.get('datasource'))
-
-    @property
-    def icons(self):
-        """
-
-        :return: Список изображений, относящихся к данному узлу навигационного дерева
-        :rtype: list[YMIcon]
-        """
-        # todo нет примера
-        return [YMIcon(icon) for icon in self.data.get('icons', [])]
-
-    @property
-    def parents(self):
-        """
-
-        :return: Иерархический список всех родителей узла, начиная с корня
-        :rtype: list[YMNavigationNode]
-        """
-        # todo нет примера
-        return [YMNavigationNode(node) for node in self.data.get('parents', [])]
-
-    @property
-    def categories(self):
-        """
-
-        :return: Список дочерних узлов
-        :rtype: list[YMNavigationNode]
-        """
-        # todo нет примера
-        return [YMNavigationNode(node) for node in self.data.get('categories', [])]
-
-
-class YMFilter(YMBase):
-    """Фильтр"""
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
-
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор фильтра
-        :rtype: str
-
-        -2
-        """
-        return self.data.get('id')
-
-    @property
-    def name(self):
-        """
-
-        :return: Наименование фильтра
-        :rtype: str
-
-        Гарантия производителя
-        """
-        return self.data.get('name')
-
-    @property
-    def type(self):
-        """
-
-        :return: Тип фильтра
-        :rtype: str
-
-        * **BOOLEAN** — логический тип
-        * **NUMBER** — числовой тип, задает диапазон допустимых значений
-        * **ENUM** — тип перечисление, задает список допустимых значений, множественный выбор
-        * **COLOR** — фильтр по цвету, аналогичен ENUM, значения фильтра дополнительно содержат HEX-код соответствующего цвета
-        * **SIZE** — фильтр по размеру, аналогичен ENUM, значения фильтра дополнительно содержат код единиц измерения
-        * **RADIO** — аналогичен ENUM, но допускает выбор только одного значения
-        * **TEXT** — тип фильтра для фильтрации по поисковой фразе
-        * **PHOTO_PICKER** —
-        """
-        return self.data.get('type')
-
-    @property
-    def description(self):
-        """
-
-        :return: Описание фильтра
-        :rtype: str or None
-        """
-        # todo нет примера
-        return self.data.get('description')
-
-    @property
-    def unit(self):
-        """
-
-        :return: Единицы измерения значений фильтра
-        :rtype: str or None
-        """
-        # todo нет примера
-        return self.data.get('unit')
-
-    @property
-    def defaultUnit(self):
-        """
-
-        :return: Код единиц измерения значений фильтра, используемых по умолчанию
-        :rtype: str or None
-        """
-        # todo нет примера
-        return self.data.get('defaultUnit')
-
-    @property
-    def values(self):
-        """
-
-        :return: Список значений фильтра
-        :rtype: list[YMFilterValue]
-        """
-        # todo нет примера
-        return [YMFilterValue(value) for value in self.data.get('values', [])]
-
-    @property
-    def max(self):
-        """
-
-        :return: Максимальное значение числового фильтра
-        :rtype: str or None
-        """
-        # todo никогда не возвращается
-        return self.data.get('max')
-
-    @property
-    def min(self):
-        """
-
-        :return: Минимальное значение числового фильтра
-        :rtype: str or None
-        """
-        # todo никогда не возвращается
-        return self.data.get('min')
-
-    @property
-    def value(self):
-        """
-
-        :return: Выбранное значение числового фильтра
-        :rtype: str or None
-        """
-        # todo никогда не возвращается
-        return self.data.get('value')
-
-    @property
-    def precision(self):
-        """
-
-        :return: Количество знаков поле запятой у значений фильтра
-        :rtype: int or None
-        """
-        # todo никогда не возвращается
-        return self.data.get('precision')
-
-
-class YMThumbnail(YMBase):
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('url'))
-
-    @property
-    def width(self):
-        """
-
-        :return: Ширина изображения
-        :rtype: int
-
-        321
-        """
-        return self.data.get('width')
-
-    @property
-    def height(self):
-        """
-
-        :return: Высота изображения
-        :rtype: int
-
-        620
-        """
-        return self.data.get('height')
-
-    @property
-    def url(self):
-        """
-
-        :return: Ссылка на изображение
-        :rtype: str
-
-        https://avatars.mds.yandex.net/get-mpic/397397/img_id7051974271832358544.png/orig
-        """
-        return self.data.get('url')
-
-    @property
-    def container(self):
-        """
-
-        :return: container
-        :rtype: str
-
-        * **W50xH50** — 50x50
-        * **W100xH100** — 100x100
-        * **W150xH150** — 150x150
-        * **W200xH200** — 200x200
-        * **W300xH300** — 300x300
-        """
-        # todo нет примера
-        return self.data.get('container')
-
-
-class YMCriteria(YMBase):
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('url'))
-
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор фильтра
-        :rtype: str
-        """
-        # todo нет примера
-        return self.data.get('id')
-
-    @property
-    def value(self):
-        """
-
-        :return: Значение фильтра
-        :rtype: str
-        """
-        # todo нет примера
-        return self.data.get('value')
-
-    @property
-    def text(self):
-        """
-
-        :return: Текст поисковой фразы
-        :rtype: str or None
-        """
-        # todo нет примера
-        return self.data.get('text')
-
-
-class YMModelPhoto(YMBase):
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('url'))
-
-    @property
-    def width(self):
-        """
-
-        :return: Ширина изображения
-        :rtype: int
-
-        321
-        """
-        return self.data.get('width')
-
-    @property
-    def height(self):
-        """
-
-        :return: Высота изображения
-        :rtype: int
-
-        620
-        """
-        return self.data.get('height')
-
-    @property
-    def url(self):
-        """
-
-        :return: Ссылка на изображение
-        :rtype: str
-
-        https://avatars.mds.yandex.net/get-mpic/397397/img_id7051974271832358544.png/orig
-        """
-        return self.data.get('url')
-
-    @property
-    def colorId(self):
-        """
-
-        :return: Код значения фильтра по цвету
-        :rtype: str or None
-        """
-        # todo нет примера
-        return self.data.get('colorId')
-
-    @property
-    def thumbnails(self):
-        """
-
-        :return: Уменьшенные копии изображения
-        :rtype: list[YMThumbnail]
-        """
-        # todo нет примера
-        return [YMThumbnail(thumbnail) for thumbnail in self.data.get('thumbnails', [])]
-
-    @property
-    def criteria(self):
-        """
-
-        :return: Критерий фильтрации копии изображения
-        :rtype: list[YMCriteria]
-        """
-        # todo нет примера
-        return [YMCriteria(criteria) for criteria in self.data.get('criteria', [])]
-
-
-class YMPrice(YMBase):
-
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def max(self):
-        """
-
-        :return: Максимальная цена
-        :rtype: str or None
-        """
-        return self.data.get('max')
-
-    @property
-    def min(self):
-        """
-
-        :return: Минимальная цена
-        :rtype: str or None
-        """
-        return self.data.get('min')
-
-    @property
-    def avg(self):
-        """
-
-        :return: Среднее значение цены
-        :rtype: str or None
-        """
-        return self.data.get('avg')
-
-    @property
-    def discount(self):
-        """
-
-        :return: Скидка
-        :rtype: str or None
-        """
-        return self.data.get('discount')
-
-    @property
-    def base(self):
-        """
-
-        :return: Базовое значение цены
-        :rtype: str or None
-        """
-        return self.data.get('base')
-
-
-class YMShopPrice(YMBase):
-
-    def __repr__(self):
-        return '<{}'.format(self.__class__.__name__)
-
-    @property
-    def value(self):
-        """
-
-        :return: Значение цены
-        :rtype: str
-        """
-        return self.data.get('value')
-
-    @property
-    def discount(self):
-        """
-
-        :return: Скидка
-        :rtype: str or None
-        """
-        return self.data.get('discount')
-
-    @property
-    def base(self):
-        """
-
-        :return: Базовая цена
-        :rtype: str or None
-        """
-        return self.data.get('base')
-
-    @property
-    def shopMin(self):
-        """
-
-        :return: Минимальная цена из всех склеенных офферов в данном магазине
-        :rtype: str or None
-        """
-        return self.data.get('shopMin')
-
-    @property
-    def shopMax(self):
-        """
-
-        :return: Максимальная цена из всех склеенных офферов в данном магазине
-        :rtype: str or None
-        """
-        return self.data.get('shopMax')
-
-
-class YMVendorCategory(YMCategory):
-
-    @property
-    def popularity(self):
-        """
-
-        :return: Оценка популярности
-        :rtype: float
-        """
-        return self.data.get('popularity')
-
-    @property
-    def children(self):
-        """
-
-        :return: Список дочерних категорий
-        :rtype: list[YMVendorCategory]
-        """
-        return [YMVendorCategory(category) for category in self.data.get('children', [])]
-
-
-class YMVendor(YMBase):
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
-
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор производителя
-        :rtype: int
-        """
-        return self.data.get('id')
-
-    @property
-    def name(self):
-        """
-
-        :return: Наименование производителя
-        :rtype: str or None
-        """
-        return self.data.get('name')
-
-    @property
-    def site(self):
-        """
-
-        :return: Ссылка на веб-сайт производителя
-        :rtype: str or None
-        """
-        return self.data.get('site')
-
-    @property
-    def picture(self):
-        """
-
-        :return: Ссылка на изображение логотипа производителя
-        :rtype: str or None
-        """
-        return self.data.get('picture')
-
-    @property
-    def recommendedShops(self):
-        """
-
-        :return: Ссылка на страницу производителя с рекомендованными магазинами
-        :rtype: str or None
-        """
-        return self.data.get('recommendedShops')
-
-    @property
-    def link(self):
-        """
-
-        :return: Ссылка на карточку производителя на большом маркете
-        :rtype: str or None
-        """
-        return self.data.get('link')
-
-    @property
-    def categories(self):
-        """
-
-        :return: Список категорий, в которых представлен данный производитель
-        :rtype: list[YMVendorCategory]
-        """
-        return [YMVendorCategory(category) for category in self.data.get('categories', [])]
-
-    @property
-    def topCategories(self):
-        """
-
-        :return: Список наиболее популярных категорий товаров производителя
-        :rtype: list[YMVendorCategory]
-        """
-        return [YMVendorCategory(category) for category in self.data.get('topCategories', [])]
-
-
-class YMRatingDistribution(YMBase):
-
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def value(self):
-        """
-
-        :return: Значение оценки
-        :rtype: float
-        """
-        return self.data.get('value')
-
-    @property
-    def count(self):
-        """
-
-        :return: Количество оценок с указанным значением
-        :rtype: int
-        """
-        return self.data.get('count')
-
-    @property
-    def percent(self):
-        """
-
-        :return: Доля оценок с указанным значением среди всех оценок
-        :rtype: int
-        """
-        return self.data.get('percent')
-
-
-class YMRatingStatus(YMBase):
-
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def id(self):
-        """
-
-        :return: Код статуса рейтинга
-        :rtype: str
-        """
-        return self.data.get('id')
-
-    @property
-    def name(self):
-        """
-
-        :return: Наименование статуса рейтинга
-        :rtype: str
-        """
-        return self.data.get('name')
-
-
-class YMRating(YMBase):
-
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def value(self):
-        """
-
-        :return: Средняя оценка рейтинга
-        :rtype: float or int
-        """
-        return self.data.get('value')
-
-    @property
-    def count(self):
-        """
-
-        :return: Количество оценок
-        :rtype: int
-        """
-        return self.data.get('count')
-
-    @property
-    def distribution(self):
-        """
-
-        :return: Информация о распределении оценок
-        :rtype: list[YMRatingDistribution]
-        """
-        return [YMRatingDistribution(d) for d in self.data.get('distribution')]
-
-    @property
-    def status(self):
-        """
-
-        :return: Статус рейтинга
-        :rtype: list[YMRatingStatus]
-        """
-        return [YMRatingStatus(d) for d in self.data.get('distribution')]
-
-
-class YMFacts(YMBase):
-
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def pro(self):
-        """
-
-        :return: Достоинства
-        :rtype: list[str]
-        """
-        return self.data.get('pro')
-
-    @property
-    def contra(self):
-        """
-
-        :return: Недостатки
-        :rtype: list[str]
-        """
-        return self.data.get('contra')
-
-
-class YMModelWarning(YMBase):
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('code'))
-
-    @property
-    def code(self):
-        """
-
-        :return: Строковый код дисклеймера
-        :rtype: str
-        """
-        return self.data.get('code')
-
-    @property
-    def message(self):
-        """
-
-        :return: Текст дисклеймера
-        :rtype: str
-        """
-        return self.data.get('message')
-
-
-class YMModification(YMBase):
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
-
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор модели-модификации
-        :rtype: int
-        """
-        return self.data.get('id')
-
-    @property
-    def name(self):
-        """
-
-        :return: Наименование модели-модификации
-        :rtype: str
-        """
-        return self.data.get('name')
-
-    @property
-    def description(self):
-        """
-
-        :return: Описание модели-модификации
-        :rtype: str
-        """
-        return self.data.get('description')
-
-    @property
-    def popularity(self):
-        """
-
-        :return: Оценка популярности модели-модификации
-        :rtype: str
-        """
-        return self.data.get('popularity')
-
-    @property
-    def offerCount(self):
-        """
-
-        :return: Кол-во товарных предложений для данной модификации
-        :rtype: int
-        """
-        return self.data.get('offerCount')
-
-    @property
-    def shopCount(self):
-        """
-
-        :return: Кол-во магазинов, имеющих товарные предложения данной модификации
-        :rtype: int
-        """
-        return self.data.get('shopCount')
-
-    @property
-    def price(self):
-        """
-
-        :return: Информация о цене модификации
-        :rtype: YMPrice
-        """
-        return YMPrice(self.data.get('price'))
-
-    @property
-    def alternatePrices(self):
-        """
-
-        :return: Информация о ценах на модификацию в альтернативной валюте запроса
-        :rtype: YMPrice
-        """
-        return YMPrice(self.data.get('alternatePrices'))
-
-
-class YMSpecificationFeature(YMBase):
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('name'))
-
-    @property
-    def name(self):
-        """
-
-        :return: Наименование характеристики
-        :rtype: str
-        """
-        return self.data.get('name')
-
-    @property
-    def value(self):
-        """
-
-        :return: Значение характеристики
-        :rtype: str
-        """
-        return self.data.get('value')
-
-
-class YMSpecification(YMBase):
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('name'))
-
-    @property
-    def name(self):
-        """
-
-        :return: Название группы характеристик
-        :rtype: str
-        """
-        return self.data.get('name')
-
-    @property
-    def features(self):
-        """
-
-        :return: -
-        :rtype: list[YMSpecificationFeature]
-        """
-        return [YMSpecificationFeature(feature) for feature in self.data.get('features', [])]
-
-
-class YMParameterOption(YMBase):
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
-
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор значения параметра
-        :rtype: int
-        """
-        return self.data.get('id')
-
-    @property
-    def name(self):
-        """
-
-        :return: Название значения параметра
-        :rtype: str
-        """
-        return self.data.get('name')
-
-
-class YMParameter(YMBase):
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('type'))
-
-    @property
-    def type(self):
-        """
-
-        :return: Тип параметра категории
-        :rtype: str
-        """
-        return self.data.get('type')
-
-    @property
-    def parameterId(self):
-        """
-
-        :return: Идентификатор параметра
-        :rtype: int
-        """
-        return self.data.get('parameterId')
-
-    @property
-    def multivalue(self):
-        """
-
-        :return: Признак, что параметр имеет несколько значений
-        :rtype: bool
-        """
-        return self.data.get('multivalue')
-
-    @property
-    def name(self):
-        """
-
-        :return: Название параметра
-        :rtype: str
-        """
-        return self.data.get('name')
-
-    @property
-    def unit(self):
-        """
-
-        :return: Единица измерения параметра
-        :rtype: str
-        """
-        return self.data.get('unit')
-
-    @property
-    def mandatory(self):
-        """
-
-        :return: Является ли атрибут обязательным
-        :rtype: bool
-        """
-        return self.data.get('mandatory')
-
-    @property
-    def values(self):
-        """
-
-        :return: Список значений параметра
-        :rtype: list[bool]
-        """
-        return self.data.get('values')
-
-    @property
-    def options(self):
-        """
-
-        :return: Список возможных значений параметра
-        :rtype: list[YMParameterOption]
-        """
-        return [YMParameterOption(parameter) for parameter in self.data.get('options', [])]
-
-
-class YMUserRelated(YMBase):
-
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def inComparisonList(self):
-        """
-
-        :return: Модель находится в списках сравнений
-        :rtype: bool
-        """
-        return self.data.get('inComparisonList')
-
-    @property
-    def inWishlist(self):
-        """
-
-        :return: Модель находится в отложеннных
-        :rtype: bool
-        """
-        return self.data.get('inWishlist')
-
-
-class YMModel(YMBase):
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
-
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор модели
-        :rtype: int
-
-        1732210983
-        """
-        return self.data.get('id')
-
-    @property
-    def name(self):
-        """
-
-        :return: Наименование модели
-        :rtype: str
-
-        Смартфон Apple iPhone X 256GB
-        """
-        return self.data.get('name')
-
-    @property
-    def kind(self):
-        """
-
-        :return: Тип товара
-        :rtype: str or None
-
-        автомагнитола
-        """
-        return self.data.get('kind')
-
-    @property
-    def type(self):
-        """
-
-        :return: Тип модели
-        :rtype: str
-
-        * **MODEL** — Обычная модель
-        * **GROUP** — Групповая модель
-        * **MODIFICATION** — Модификация
-        * **BOOK** — Книга
-        * **CLUSTER** — Визуальная модель
-        """
-        return self.data.get('type')
-
-    @property
-    def isNew(self):
-        """
-
-        :return: Признак "новизны" товара
-        :rtype: bool
-
-        False
-        """
-        return self.data.get('isNew')
-
-    @property
-    def link(self):
-        """
-
-        :return: Ссылка на карточку модели
-        :rtype: str
-
-        https://market.yandex.ru/product/1732210983?hid=91491&pp=1001
-        """
-        return self.data.get('link')
-
-    @property
-    def vendorLink(self):
-        """
-
-        :return: Ссылка на страницу производителя
-        :rtype: str or None
-
-        https://market.yandex.ru/brands/267101?pp=1001
-        """
-        return self.data.get('vendorLink')
-
-    # todo пустое описание
-    @property
-    def barcode(self):
-        """
-
-        :return: Штрих-код модели
-        :rtype: str or None
-        """
-        # todo нет примера
-        return self.data.get('barcode')
-
-    # todo пустое описание
-    @property
-    def vendorCode(self):
-        """
-
-        :return: Общий идентификатор модели
-        :rtype: str or None
-        """
-        # todo нет примера
-        return self.data.get('vendorCode')
-
-    @property
-    def offerCount(self):
-        """
-
-        :return: Количество товарных предложений модели в регионе запроса
-        :rtype: int
-
-        248
-        """
-        return self.data.get('offerCount')
-
-    @property
-    def opinionCount(self):
-        """
-
-        :return: Количество отзывов на модель
-        :rtype: int
-
-        33
-        """
-        return self.data.get('opinionCount')
-
-    @property
-    def reviewCount(self):
-        """
-
-        :return: Количество статей/обзоров на модель
-        :rtype: int
-
-        6
-        """
-        return self.data.get('reviewCount')
-
-    @property
-    def modificationCount(self):
-        """
-
-        :return: Количество модификаций групповой модели. Поле отсутствует в выдаче, если модель не групповая
-        :rtype: int or None
-        """
-        # todo нет примера
-        return self.data.get('modificationCount')
-
-    @property
-    def lastUpdate(self):
-        """
-
-        :return: Дата-время последнего обновления модели в спсике стравнения
-        :rtype: int or None
-        """
-        # todo нет примера
-        return self.data.get('lastUpdate')
-
-    # todo пустое описание
-    # todo нет примера
-    @property
-    def aliases(self):
-        """
-
-        :return: ---
-        :rtype: str or None
-        """
-        return self.data.get('aliases')
-
-    # todo нет примера
-    @property
-    def parent(self):
-        """
-
-        :return: Идентификатор модели
-        :rtype: int or None
-        """
-        return self.data.get('parent', {}).get('id')
-
-    @property
-    def description(self):
-        """
-
-        :return: Описание модели
-        :rtype: str
-
-        GSM, LTE-A, смартфон, iOS 11, вес 174 г, ШхВхТ 70.9x143.6x7.7 мм, экран 5.8", 2436x1125, Bluetooth, NFC, Wi-Fi, GPS, ГЛОНАСС, фотокамера 12 МП, память 256 Гб
-        """
-        return self.data.get('description')
-
-    @property
-    def photo(self):
-        """
-
-        :return: Основное изображение модели
-        :rtype: YMModelPhoto
-        """
-        return YMModelPhoto(self.data.get('photo'))
-
-    @property
-    def photos(self):
-        """
-
-        :return: Остальные изображения модели
-        :rtype: list[YMModelPhoto]
-        """
-        return [YMModelPhoto(photo) for photo in self.data.get('photos', [])]
-
-    @property
-    def category(self):
-        """
-
-        :return: Информация о категории, к которой относится модель
-        :rtype: YMCategory
-        """
-        return YMCategory(self.data.get('category'))
-
-    @property
-    def navigationNode(self):
-        """
-
-        :return: Информация об узле навигационного дерева, к которому относится модель
-        :rtype: YMNavigationNode
-        """
-        return YMNavigationNode(self.data.get('navigationNode'))
-
-    @property
-    def price(self):
-        """
-
-        :return: Информация о цене модели в основной валюте запроса
-        :rtype: YMPrice
-        """
-        return YMPrice(self.data.get('price'))
-
-    @property
-    def alternatePrice(self):
-        """
-
-        :return: Информация о цене модели в альтернативной валюте запроса
-        :rtype: YMPrice
-        """
-        return YMPrice(self.data.get('price'))
-
-    @property
-    def vendor(self):
-        """
-
-        :return: Информация о производителе модели
-        :rtype: YMVendor
-        """
-        return YMVendor(self.data.get('vendor'))
-
-    @property
-    def rating(self):
-        """
-
-        :return: Информация о рейтинге модели
-        :rtype: YMRating
-        """
-        return YMRating(self.data.get('rating'))
-
-    @property
-    def facts(self):
-        """
-
-        :return: Факты о модели
-        :rtype: YMFacts
-        """
-        return YMFacts(self.data.get('facts'))
-
-    @property
-    def warning(self):
-        """
-
-        :return: Дисклеймер, связанный с моделью
-        :rtype: str or None
-        """
-        return self.data.get('warning')
-
-    @property
-    def warnings(self):
-        """
-
-        :return: Строковый код дисклеймера
-        :rtype: list[YMModelWarning]
-        """
-        return [YMModelWarning(warning) for warning in self.data.get('warnings', [])]
-
-    @property
-    def filters(self):
-        """
-
-        :return: Список фильтров, предназначенных для фильтрации моделей/модификаций
-        :rtype: list[YMFilter]
-        """
-        return [YMFilter(f) for f in self.data.get('filters', [])]
-
-    @property
-    def modifications(self):
-        """
-
-        :return: Список модификаций групповой модели
-        :rtype: list[YMModification]
-        """
-        return [YMModification(modification) for modification in self.data.get('modifications', [])]
-
-    @property
-    def specification(self):
-        """
-
-        :return: Основные характеристики модели
-        :rtype: list[YMSpecification]
-        """
-        return [YMSpecification(specification) for specification in self.data.get('specification', [])]
-
-    @property
-    def parameters(self):
-        """
-
-        :return: Параметры модели
-        :rtype: list[YMParameter]
-        """
-        return [YMParameter(parameter) for parameter in self.data.get('parameters', [])]
-
-    @property
-    def userRelated(self):
-        """
-
-        :return: Информация, касающаяся текущего пользователя
-        :rtype: list[YMUserRelated]
-        """
-        return [YMUserRelated(userrelated) for userrelated in self.data.get('userRelated', [])]
-
-
-class YMModelReview(YMBase):
-
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def url(self):
-        """
-
-        :return: URL обзорной статьи на модель
-        :rtype: str
-        """
-        return self.data.get('url')
-
-    @property
-    def title(self):
-        """
-
-        :return: Заголовок обзора на модель
-        :rtype: str
-        """
-        return self.data.get('title')
-
-    @property
-    def favIcon(self):
-        """
-
-        :return: URL значка веб-сайта с обзором на модель
-        :rtype: str
-        """
-        return self.data.get('favIcon')
-
-
-class YMOrganization(YMBase):
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('name'))
-
-    @property
-    def name(self):
-        """
-
-        :return: Юридическое название
-        :rtype: str
-        """
-        return self.data.get('name')
-
-    @property
-    def ogrn(self):
-        """
-
-        :return: Основной государственный номер регистрации
-        :rtype: str
-        """
-        return self.data.get('ogrn')
-
-    @property
-    def address(self):
-        """
-
-        :return: Юридический адрес
-        :rtype: str
-        """
-        return self.data.get('address')
-
-    @property
-    def postalAddress(self):
-        """
-
-        :return: Фактический адрес
-        :rtype: str
-        """
-        return self.data.get('postalAddress')
-
-    @property
-    def type(self):
-        """
-
-        :return: Тип организации
-        :rtype: str
-        """
-        return self.data.get('type')
-
-    @property
-    def contactUrl(self):
-        """
-
-        :return: Ссылка на страницу с контактной информацией
-        :rtype: str
-        """
-        return self.data.get('contactUrl')
-
-
-class YMShop(YMBase):
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
-
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор магазина
-        :rtype: int
-        """
-        return self.data.get('id')
-
-    @property
-    def name(self):
-        """
-
-        :return: Наименование магазина
-        :rtype: str
-        """
-        return self.data.get('name')
-
-    @property
-    def domain(self):
-        """
-
-        :return: URL, содержащий контактную информацию магазина
-        :rtype: str
-        """
-        return self.data.get('domain')
-
-    @property
-    def registered(self):
-        """
-
-        :return: Дата регистрации на Маркете
-        :rtype: str
-        """
-        return self.data.get('registered')
-
-    @property
-    def opinionUrl(self):
-        """
-
-        :return: Ссылка на отзывы о магазине
-        :rtype: str
-        """
-        return self.data.get('opinionUrl')
-
-    @property
-    def region(self):
-        """
-
-        :return: Домашний регион
-        :rtype: YMRegion
-        """
-        return YMRegion(self.data.get('region'))
-
-    @property
-    def rating(self):
-        """
-
-        :return: Информация о рейтинге магазина
-        :rtype: YMRating
-        """
-        return YMRating(self.data.get('rating'))
-
-    @property
-    def organizations(self):
-        """
-
-        :return: Информация об организации
-        :rtype: list[YMOrganization]
-        """
-        return [YMOrganization(organization) for organization in self.data.get('organizations', [])]
-
-
-class YMPhone(YMBase):
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('number'))
-
-    @property
-    def number(self):
-        """
-
-        :return: Значение номера телефона в произвольном формате
-        :rtype: str
-        """
-        return self.data.get('number')
-
-    @property
-    def sanitized(self):
-        """
-
-        :return: Значение номера телефона в числовом формате
-        :rtype: str
-        """
-        return self.data.get('sanitized')
-
-    @property
-    def call(self):
-        """
-
-        :return: Ссылка для получения номера телефона
-        :rtype: str or None
-        """
-        return self.data.get('call')
-
-
-class YMDeliveryOptionService(YMBase):
-
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор службы доставки
-        :rtype: int
-        """
-        return self.data.get('id')
-
-    @property
-    def name(self):
-        """
-
-        :return: Наименование службы доставки
-        :rtype: str
-        """
-        return self.data.get('name')
-
-
-class YMDeliveryOptionConditions(YMBase):
-
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def price(self):
-        """
-
-        :return: Стоимость доставки в основной валюте
-        :rtype: YMShopPrice
-        """
-        return YMShopPrice(self.data.get('price'))
-
-    @property
-    def alternatePrice(self):
-        """
-
-        :return: Стоимость доставки в альтернативной валюте
-        :rtype: YMShopPrice
-        """
-        return YMShopPrice(self.data.get('alternatePrice'))
-
-    @property
-    def daysFrom(self):
-        """
-
-        :return: Определяет начало периода (день недели), в котором возможна доставка
-        :rtype: int
-        """
-        return self.data.get('daysFrom')
-
-    @property
-    def daysTo(self):
-        """
-
-        :return: Определяет окончание периода (день недели), в котором возможна доставка
-        :rtype: int
-        """
-        return self.data.get('daysTo')
-
-    @property
-    def orderBefore(self):
-        """
-
-        :return: Время, до которого нужно сделать заказ в часовом поясе пользователя. Возможные значения - от 0 до 23. Отсутствие параметра - заказ можно делать в любое время
-        :rtype: int
-        """
-        return self.data.get('orderBefore')
-
-    @property
-    def deliveryIncluded(self):
-        """
-
-        :return: Признак, что стоимость доставки включена в стоимость товарного предложения. Отсутствие свойства в ввыдаче равнозначно значению false.
-        :rtype: bool
-        """
-        return self.data.get('deliveryIncluded')
-
-
-class YMDeliveryOption(YMBase):
-
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def brief(self):
-        """
-
-        :return: Краткое описание условий доставки
-        :rtype: str
-        """
-        return self.data.get('brief')
-
-    @property
-    def service(self):
-        """
-
-        :return: Информация о службе доставки
-        :rtype: YMDeliveryOptionService
-        """
-        return YMDeliveryOptionService(self.data.get('service'))
-
-    @property
-    def conditions(self):
-        """
-
-        :return: Информация об условиях доставки
-        :rtype: YMDeliveryOptionConditions
-        """
-        return YMDeliveryOptionConditions(self.data.get('conditions'))
-
-
-class YMDeliveryPickupOption(YMBase):
-
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def brief(self):
-        """
-
-        :return: Краткое описание условий доставки
-        :rtype: str
-        """
-        return self.data.get('brief')
-
-    @property
-    def outletCount(self):
-        """
-
-        :return: Количество пунктов выдачи и торговых залов, в которых можно забрать заказ
-        :rtype: int
-        """
-        return self.data.get('outletCount')
-
-    @property
-    def service(self):
-        """
-
-        :return: Информация о службе доставки
-        :rtype: YMDeliveryOptionService
-        """
-        return YMDeliveryOptionService(self.data.get('service'))
-
-    @property
-    def conditions(self):
-        """
-
-        :return: Информация об условиях доставки
-        :rtype: YMDeliveryOptionConditions
-        """
-        return YMDeliveryOptionConditions(self.data.get('conditions'))
-
-
-class YMDelivery(YMBase):
-
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def free(self):
-        """
-
-        :return: Признак бесплатной доставки
-        :rtype: bool
-        """
-        return self.data.get('free')
-
-    @property
-    def deliveryIncluded(self):
-        """
-
-        :return: Признак, что цена доставки включена в стоимость товара
-        :rtype: bool
-        """
-        return self.data.get('deliveryIncluded')
-
-    @property
-    def carried(self):
-        """
-
-        :return: Признак наличия доставки
-        :rtype: bool
-        """
-        return self.data.get('carried')
-
-    @property
-    def pickup(self):
-        """
-
-        :return: Признак возможности самовывоза заказа
-        :rtype: bool
-        """
-        return self.data.get('pickup')
-
-    @property
-    def downloadable(self):
-        """
-
-        :return: Признак, что товар можно скачать
-        :rtype: bool
-        """
-        return self.data.get('downloadable')
-
-    @property
-    def localStore(self):
-        """
-
-        :return: Признак наличия торгового зала в регионе пользователя
-        :rtype: bool
-        """
-        return self.data.get('localStore')
-
-    @property
-    def localDelivery(self):
-        """
-
-        :return: Признак локальной доставки
-        :rtype: bool
-        """
-        return self.data.get('localDelivery')
-
-    @property
-    def brief(self):
-        """
-
-        :return: Краткое описание условий доставки
-        :rtype: str
-        """
-        return self.data.get('brief')
-
-    @property
-    def inStock(self):
-        """
-
-        :return: Признак наличия товара
-        :rtype: bool
-        """
-        return self.data.get('inStock')
-
-    @property
-    def is_global(self):
-        """
-
-        :return: Признак трансграничной доставки
-        :rtype: bool
-        """
-        return self.data.get('global')
-
-    @property
-    def price(self):
-        """
-
-        :return: Стоимость доставки в валюте заказа
-        :rtype: YMShopPrice
-        """
-        return YMShopPrice(self.data.get('price'))
-
-    @property
-    def alternatePrice(self):
-        """
-
-        :return: Стоимость доставки в альтернативной или неденоминированной валюте
-        :rtype: YMShopPrice
-        """
-        return YMShopPrice(self.data.get('alternatePrice'))
-
-    @property
-    def shopRegion(self):
-        """
-
-        :return: Свой регион магазина
-        :rtype: YMRegion
-        """
-        return YMRegion(self.data.get('shopRegion'))
-
-    @property
-    def userRegion(self):
-        """
-
-        :return: Регион пользователя
-        :rtype: YMRegion
-        """
-        return YMRegion(self.data.get('userRegion'))
-
-    @property
-    def description(self):
-        """
-
-        :return: Описание условий доставки
-        :rtype: str or None
-        """
-        return self.data.get('description')
-
-    @property
-    def options(self):
-        """
-
-        :return: Информация о службах доставки, с которыми сотрудничает магазин
-        :rtype: list[YMDeliveryOption]
-        """
-        return [YMDeliveryOption(option) for option in self.data.get('options', [])]
-
-    @property
-    def pickupOptions(self):
-        """
-
-        :return: Информация об условиях самовывоза
-        :rtype: list[YMDeliveryPickupOption]
-        """
-        return [YMDeliveryPickupOption(option) for option in self.data.get('pickupOptions', [])]
-
-
-class YMPaymentOption(YMBase):
-
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def canPayByCard(self):
-        """
-
-        :return: Оплата картой на Маркете
-        :rtype: bool
-        """
-        return self.data.get('canPayByCard')
-
-
-class YMOffer(YMBase):
-
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
-
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор предложения
-        :rtype: str
-        """
-        return self.data.get('id')
-
-    @property
-    def wareMd5(self):
-        """
-
-        :return: MD5 хеш-код предложения
-        :rtype: str
-        """
-        return self.data.get('wareMd5')
-
-    @property
-    def name(self):
-        """
-
-        :return: Название предложения
-        :rtype: str
-        """
-        return self.data.get('name')
-
-    @property
-    def promocode(self):
-        """
-
-        :return: Признак, что товар можно купить с промокодом
-        :rtype: bool or None
-        """
-        return self.data.get('promocode')
-
-    @property
-    def cpa(self):
-        """
-
-        :return: Признак, что товар можно заказать на Яндекс.Маркете (в рамках программы «Заказ на Маркете»)
-        :rtype: bool or None
-        """
-        return self.data.get('cpa')
-
-    @property
-    def url(self):
-        """
-
-        :return: URL товара на сайте магазина
-        :rtype: str
-        """
-        return self.data.get('url')
-
-    @property
-    def cpaUrl(self):
-        """
-
-        :return: URL карточки модели на Яндекс.Маркете
-        :rtype: str or None
-        """
-        return self.data.get('cpaUrl')
-
-    @property
-    def outletUrl(self):
-        """
-
-        :return: URL карты со списком точек выдачи товара
-        :rtype: str or None
-        """
-        return self.data.get('outletUrl')
-
-    @property
-    def adult(self):
-        """
-
-        :return: Признак, что предложение относится к интим-категории (18+)
-        :rtype: bool or None
-        """
-        return self.data.get('adult')
-
-    @property
-    def age(self):
-        """
-
-        :return: Возрастные ограничения для предложения
-        :rtype: str or None
-        """
-        return self.data.get('age')
-
-    @property
-    def onStock(self):
-        """
-
-        :return: Признак наличия товара
-        :rtype: bool or None
-        """
-        return self.data.get('onStock')
-
-    @property
-    def outletCount(self):
-        """
-
-        :return: Количество точек выдачи
-        :rtype: int
-        """
-        return self.data.get('outletCount')
-
-    @property
-    def pickupCount(self):
-        """
-
-        :return: Количество точек самовывоза
-        :rtype: int
-        """
-        return self.data.get('pickupCount')
-
-    @property
-    def localStoreCount(self):
-        """
-
-        :return: Количество торговых залов в регионе пользователя
-        :rtype: int
-        """
-        return self.data.get('localStoreCount')
-
-    @property
-    def warranty(self):
-        """
-
-        :return: Признак наличия гарантии производителя
-        :rtype: bool
-        """
-        return self.data.get('warranty')
-
-    @property
-    def recommended(self):
-        """
-
-        :return: Признак наличия рекомендации производителя
-        :rtype: bool
-        """
-        return self.data.get('recommended')
-
-    @property
-    def link(self):
-        """
-
-        :return: URL предложения на Яндекс.Маркете
-        :rtype: str or None
-        """
-        return self.data.get('link')
-
-    @property
-    def cartLink(self):
-        """
-
-        :return: URL для добавления предложения в корзину на Яндекс.Маркете
-        :rtype: str or None
-        """
-        return self.data.get('cartLink')
-
-    @property
-    def offersLink(self):
-        """
-
-        :return: URL предложений на модификации модели в указанном магазине
-        :rtype: str or None
-        """
-        return self.data.get('offersLink')
-
-    @property
-    def variationCount(self):
-        """
-
-        :return: Количество других предложений на указанный товар в магазине
-        :rtype: int or None
-        """
-        return self.data.get('variationCount')
-
-    @property
-    def description(self):
-        """
-
-        :return: Описание предложения
-        :rtype: str
-        """
-        return self.data.get('description')
-
-    @property
-    def price(self):
-        """
-
-        :return: Информация о цене
-        :rtype: YMShopPrice
-        """
-        return YMShopPrice(self.data.get('price'))
-
-    @property
-    def alternatePrice(self):
-        """
-
-        :return: Информация о цене в альтернативной валюте
-        :rtype: YMShopPrice
-        """
-        return YMShopPrice(self.data.get('alternatePrice'))
-
-    @property
-    def shop(self):
-        """
-
-        :return: Информация о магазине, который разместил предложение
-        :rtype: YMShop
-        """
-        return YMShop(self.data.get('shop'))
-
-    @property
-    def model(self):
-        """
-
-        :return: Идентификатор модели
-        :rtype: int or None
-        """
-        return self.data.get('model', {}).get('id')
-
-    @property
-    def phone(self):
-        """
-
-        :return: Номер телефона магазина
-        :rtype: YMPhone
-        """
-        return YMPhone(self.data.get('phone'))
-
-    @property
-    def photos(self):
-        """
-
-        :return: Изображения товара
-        :rtype: list[YMModelPhoto]
-        """
-        return [YMModelPhoto(photo) for photo in self.data.get('photos', [])]
-
-    @property
-    def photo(self):
-        """
-
-        :return: Основное изображение товара
-        :rtype: YMModelPhoto
-        """
-        return YMModelPhoto(self.data.get('photo'))
-
-    @property
-    def previewPhotos(self):
-        """
-
-        :return: Уменьшенные изображения товара
-        :rtype: list[YMModelPhoto]
-        """
-        return [YMModelPhoto(photo) for photo in self.data.get('previewPhotos', [])]
-
-    @property
-    def activeFilters(self):
-        """
-
-        :return: Параметры модели, по которым можно отфильтровать предложения на нее в поиске Яндекс.Маркета
-        :rtype: list[YMFilter]
-        """
-        return [YMFilter(f) for f in self.data.get('activeFilters', [])]
-
-    @property
-    def delivery(self):
-        """
-
-        :return: Информация о доставке
-        :rtype: YMDelivery
-        """
-        return YMDelivery(self.data.get('delivery'))
-
-    @property
-    def category(self):
-        """
-
-        :return: Информация о категории предложения
-        :rtype: YMCategory
-        """
-        return YMCategory(self.data.get('category'))
-
-    @property
-    def vendor(self):
-        """
-
-        :return: Информация о производителе
-        :rtype: YMVendor
-        """
-        return YMVendor(self.data.get('vendor'))
-
-    @property
-    def warning(self):
-        """
-
-        :return: Предупреждение, связанное с предложением
-        :rtype: str or None
-        """
-        return self.data.get('warning')
-
-    @property
-    def warnings(self):
-        """
-
-        :return: Код предупреждения, связанного с предложением
-        :rtype: list[YMModelWarning]
-        """
-        return [YMModelWarning(warn) for warn in self.data.get('warnings', [])]
-
-    @property
-    def paymentOptions(self):
-        """
-
-        :return: Способы оплаты товара
-        :rtype: YMPaymentOption
-        """
-        return YMPaymentOption(self.data.get('paymentOptions'))
-
-
-class YMStatisticsRegion(YMBase):
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор региона
-        :rtype: int
-        """
-        return self.data.get('id')
-
-    @property
-    def offerCount(self):
-        """
-
-        :return: Количество товарных предложений модели в регионе
-        :rtype: int
-        """
-        return self.data.get('offerCount')
-
-    @property
-    def price_max(self):
-        """
-
-        :return: Максимальная цена
-        :rtype: str
-        """
-        return self.data.get('price', {}).get('price_max')
-
-    @property
-    def price_min(self):
-        """
-
-        :return: Минимальная цена
-        :rtype: str
-        """
-        return self.data.get('price', {}).get('price_min')
-
-    @property
-    def price_median(self):
-        """
-
-        :return: Медиана по ценам
-        :rtype: str
-        """
-        return self.data.get('price', {}).get('price_median')
-
-
-class YMStatistics(YMBase):
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def regions(self):
-        """
-
-        :return: Список статистик по регионам
-        :rtype: list[YMStatisticsRegion]
-        """
-        return [YMStatisticsRegion(region) for region in self.data.get('regions', [])]
-
-
-class YMOpinionAuthorSocial(YMBase):
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def type(self):
-        """
-
-        :return: Тип профиля
-        :rtype: str
-        """
-        return self.data.get('type')
-
-    @property
-    def url(self):
-        """
-
-        :return: Ссылка на профиль
-        :rtype: str
-        """
-        return self.data.get('url')
-
-
-class YMOpinionAuthor(YMBase):
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def name(self):
-        """
-
-        :return: Имя автора
-        :rtype: str or None
-        """
-        return self.data.get('name')
-
-    @property
-    def avatarUrl(self):
-        """
-
-        :return: Ссылка на аватар
-        :rtype: str or None
-        """
-        return self.data.get('avatarUrl')
-
-    @property
-    def grades(self):
-        """
-
-        :return: Количество оценок
-        :rtype: int or None
-        """
-        return self.data.get('grades')
-
-    @property
-    def visibility(self):
-        """
-
-        :return: Вариант отображения отзыва
-        :rtype: str
-        """
-        return self.data.get('visibility')
-
-    @property
-    def social(self):
-        """
-
-        :return: Оиформация о профилях автора в социальных сетях
-        :rtype: list[YMOpinionAuthorSocial]
-        """
-        return [YMOpinionAuthorSocial(social) for social in self.data.get('social', [])]
-
-
-class YMModelOpinionUser(YMBase):
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
-
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор автора комментария
-        :rtype: int
-        """
-        return self.data.get('id')
-
-    @property
-    def name(self):
-        """
-
-        :return: Имя автора комментария
-        :rtype: str
-        """
-        return self.data.get('name')
-
-
-class YMOpinionComment(YMBase):
-    def __repr__(self):
-        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
-
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор комментария
-        :rtype: str
-        """
-        return self.data.get('id')
-
-    @property
-    def rootId(self):
-        """
-
-        :return: Идентификатор корневого объекта, к которому относится комментарий
-        :rtype: str
-        """
-        return self.data.get('rootId')
-
-    @property
-    def parentId(self):
-        """
-
-        :return: Идентификатор родительского комментария или корневого объекта в дереве комментариев
-        :rtype: str
-        """
-        return self.data.get('parentId')
-
-    @property
-    def title(self):
-        """
-
-        :return: Заголовок комментария
-        :rtype: str
-        """
-        return self.data.get('title')
-
-    @property
-    def updateTimestamp(self):
-        """
-
-        :return: Timestamp времени последнего обновления комментария
-        :rtype: int
-        """
-        return self.data.get('updateTimestamp')
-
-    @property
-    def valid(self):
-        """
-
-        :return: Комментарий действителен
-        :rtype: bool
-        """
-        return self.data.get('valid')
-
-    @property
-    def deleted(self):
-        """
-
-        :return: Признак удаленного комментария
-        :rtype: bool
-        """
-        return self.data.get('deleted')
-
-    @property
-    def blocked(self):
-        """
-
-        :return: Комментарий заблокирован
-        :rtype: bool
-        """
-        return self.data.get('blocked')
-
-    @property
-    def sticky(self):
-        """
-
-        :return: Признак прикрепленного комментария
-        :rtype: bool
-        """
-        return self.data.get('sticky')
-
-    @property
-    def body(self):
-        """
-
-        :return: Текст комментария
-        :rtype: str
-        """
-        return self.data.get('body')
-
-    @property
-    def user(self):
-        """
-
-        :return: Информация об авторе комментария
-        :rtype: YMModelOpinionUser
-        """
-        return YMModelOpinionUser(self.data.get('user'))
-
-    @property
-    def children(self):
-        """
-
-        :return: Список дочерних комментариев к данному в дереве комментариев
-        :rtype: list[YMOpinionComment]
-        """
-        return [YMOpinionComment(comment) for comment in self.data.get('children', [])]
-
-
-class YMModelOpinionModel(YMBase):
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор модели
-        :rtype: int
-        """
-        return self.data.get('id')
-
-    @property
-    def name(self):
-        """
-
-        :return: Наименование модели
-        :rtype: str or None
-        """
-        return self.data.get('name')
-
-
-class YMModelOpinionShop(YMBase):
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор магазина
-        :rtype: int
-        """
-        return self.data.get('id')
-
-    @property
-    def name(self):
-        """
-
-        :return: Наименование магазина
-        :rtype: str
-        """
-        return self.data.get('name')
-
-
-class YMOpinion(YMBase):
-    def __repr__(self):
-        return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор отзыва
-        :rtype: int
-        """
-        return self.data.get('id')
-
-    @property
-    def date(self):
-        """
-
-        :return: Дата написания
-        :rtype: str
-        """
-        return self.data.get('date')
-
-    @property
-    def vote(self):
-        """
-
-        :return: Мнение текущего пользователя об отзыве
-        :rtype: bool or None
-        """
-        return self.data.get('vote')
-
-    @property
-    def grade(self):
-        """
-
-        :return: Оценка
-        :rtype: int
-        """
-        return self.data.get('grade')
-
-    @property
-    def rejectReason(self):
-        """
-
-        :return: Причина отклонения отзыва
-        :rtype: str or None
-        """
-        return self.data.get('rejectReason')
-
-    @property
-    def state(self):
-        """
-
-        :return: Статус отзыва
-        :rtype: str or None
-        """
-        return self.data.get('state')
-
-    @property
-    def agreeCount(self):
-        """
-
-        :return: Количество согласных с оценкой
-        :rtype: int
-        """
-        return self.data.get('agreeCount')
-
-    @property
-    def disagreeCount(self):
-        """
-
-        :return: Количество несоглазных с оценкой
-        :rtype: int
-        """
-        return self.data.get('disagreeCount')
-
-    @property
-    def text(self):
-        """
-
-        :return: Текст отзыва
-        :rtype: str or None
-        """
-        return self.data.get('text')
-
-    @property
-    def pros(self):
-        """
-
-        :return: Описание достоинств
-        :rtype: str or None
-        """
-        return self.data.get('pros')
-
-    @property
-    def cons(self):
-        """
-
-        :return: Описание недостатков
-        :rtype: str or None
-        """
-        return self.data.get('cons')
-
-    @property
-    def author(self):
-        """
-
-        :return: Информация об авторе
-        :rtype: YMOpinionAuthor
-        """
-        return YMOpinionAuthor(self.data.get('author'))
-
-    @property
-    def comments(self):
-        """
-
-        :return: Комментарии
-        :rtype: list[YMOpinionComment]
-        """
-        return [YMOpinionComment(comment) for comment in self.data.get('comments', [])]
-
-    @property
-    def region(self):
-        """
-
-        :return: Регион
-        :rtype: YMRegion
-        """
-        return YMRegion(self.data.get('region'))
-
-
-class YMModelOpinion(YMOpinion):
-
-    @property
-    def usageTime(self):
-        """
-
-        :return: Время использования модели
-        :rtype: str
-        """
-        return self.data.get('usageTime')
-
-    @property
-    def verifiedBuyer(self):
-        """
-
-        :return: Признак проверенного покупателя
-        :rtype: bool
-        """
-        return self.data.get('verifiedBuyer')
-
-    @property
-    def model(self):
-        """
+class YMOrganization(YMBase):
+    __slots__ = ()
 
-        :return: Модель
-        :rtype: YMModelOpinionModel
-        """
-        return YMModelOpinionModel(self.data.get('model'))
+    FIELDS = (
+        Field('name', 'str', 'Юридическое название'),
+        Field('ogrn', 'str', 'Основной государственный номер регистрации'),
+        Field('address', 'str', 'Юридический адрес'),
+        Field('postalAddress', 'str', 'Фактический адрес'),
+        Field('type', 'str', 'Тип организации'),
+        Field('contactUrl', 'str', 'Ссылка на страницу с контактной информацией'),
+    )
 
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('name'))
 
-class YMShopOpinion(YMOpinion):
 
-    @property
-    def shopOrderId(self):
-        """
+class YMShop(YMBase):
+    __slots__ = ()
+
+    FIELDS = (
+        Field('id', 'int', 'Идентификатор магазина'),
+        Field('name', 'str', 'Наименование магазина'),
+        Field('domain', 'str', 'URL, содержащий контактную информацию магазина'),
+        Field('registered', 'str', 'Дата регистрации на Маркете'),
+        Field('opinionUrl', 'str', 'Ссылка на отзывы о магазине'),
+        Field('region', 'YMRegion', 'Домашний регион'),
+        Field('rating', 'YMRating', 'Информация о рейтинге магазина'),
+        Field('organizations', 'list[YMOrganization]', 'Информация об организации'),
+    )
 
-        :return: Идентификатор заказа, относящегося к отзыву
-        :rtype: str or None
-        """
-        return self.data.get('shopOrderId')
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
 
-    @property
-    def delivery(self):
-        """
 
-        :return: Способ покупки
-        :rtype: str
-        """
-        return self.data.get('delivery')
+class YMPhone(YMBase):
+    __slots__ = ()
 
-    @property
-    def problem(self):
-        """
+    FIELDS = (
+        Field('number', 'str', 'Значение номера телефона в произвольном формате'),
+        Field('sanitized', 'str', 'Значение номера телефона в числовом формате'),
+        Field('call', 'str or None', 'Ссылка для получения номера телефона'),
+    )
 
-        :return: Статус решения проблемы пользователя
-        :rtype: str or None
-        """
-        return self.data.get('problem')
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('number'))
 
-    @property
-    def shop(self):
-        """
 
-        :return: Магазин
-        :rtype: YMModelOpinionShop
-        """
-        return YMModelOpinionShop(self.data.get('model'))
+class YMDeliveryOptionService(YMBase):
+    __slots__ = ()
 
+    FIELDS = (
+        Field('id', 'int', 'Идентификатор службы доставки'),
+        Field('name', 'str', 'Наименование службы доставки'),
+    )
 
-class YMAddress(YMBase):
     def __repr__(self):
         return '<{}>'.format(self.__class__.__name__)
 
-    @property
-    def regionId(self):
-        """
-
-        :return: Идентификатор региона, к которому относится данный адрес
-        :rtype: int
-        """
-        return self.data.get('regionId')
-
-    @property
-    def type(self):
-        """
-
-        :return: Тип региона, к которому относится данный адрес
-        :rtype: str or None
-        """
-        return self.data.get('type')
-
-    @property
-    def country(self):
-        """
-
-        :return: Наименование страны
-        :rtype: str or None
-        """
-        return self.data.get('country')
-
-    @property
-    def region(self):
-        """
 
-        :return: Наименование региона
-        :rtype: str or None
-        """
-        return self.data.get('region')
+class YMDeliveryOptionConditions(YMBase):
+    __slots__ = ()
 
-    @property
-    def subRegion(self):
-        """
+    FIELDS = (
+        Field('price', 'YMShopPrice', 'Стоимость доставки в основной валюте'),
+        Field('alternatePrice', 'YMShopPrice', 'Стоимость доставки в альтернативной валюте'),
+        Field('daysFrom', 'int', 'Определяет начало периода (день недели), в котором возможна доставка'),
+        Field('daysTo', 'int', 'Определяет окончание периода (день недели), в котором возможна доставка'),
+        Field('orderBefore', 'int', 'Время, до которого нужно сделать заказ в часовом поясе пользователя. Возможные значения - от 0 до 23. Отсутствие параметра - заказ можно делать в любое время'),
+        Field('deliveryIncluded', 'bool', 'Признак, что стоимость доставки включена в стоимость товарного предложения. Отсутствие свойства в ввыдаче равнозначно значению false.'),
+    )
 
-        :return: Район внутри области
-        :rtype: str or None
-        """
-        return self.data.get('subRegion')
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-    @property
-    def locality(self):
-        """
 
-        :return: Наименование города, поселка, деревни и тд
-        :rtype: str
-        """
-        return self.data.get('locality')
+class YMDeliveryOption(YMBase):
+    __slots__ = ()
 
-    @property
-    def subLocality(self):
-        """
+    FIELDS = (
+        Field('brief', 'str', 'Краткое описание условий доставки'),
+        Field('service', 'YMDeliveryOptionService', 'Информация о службе доставки'),
+        Field('conditions', 'YMDeliveryOptionConditions', 'Информация об условиях доставки'),
+    )
 
-        :return: Наименование района
-        :rtype: str or None
-        """
-        return self.data.get('subLocality')
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-    @property
-    def thoroughfare(self):
-        """
 
-        :return: Улица, проспект, км шоссе и тд
-        :rtype: str
-        """
-        return self.data.get('thoroughfare')
+class YMDeliveryPickupOption(YMBase):
+    __slots__ = ()
 
-    @property
-    def premiseNumber(self):
-        """
+    FIELDS = (
+        Field('brief', 'str', 'Краткое описание условий доставки'),
+        Field('outletCount', 'int', 'Количество пунктов выдачи и торговых залов, в которых можно забрать заказ'),
+        Field('service', 'YMDeliveryOptionService', 'Информация о службе доставки'),
+        Field('conditions', 'YMDeliveryOptionConditions', 'Информация об условиях доставки'),
+    )
 
-        :return: Номер дома, строение, участка и тд
-        :rtype: str or None
-        """
-        return self.data.get('premiseNumber')
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-    @property
-    def fullAddress(self):
-        """
 
-        :return: Полный адрес
-        :rtype: str
-        """
-        return self.data.get('fullAddress')
+class YMDelivery(YMBase):
+    __slots__ = ()
+
+    FIELDS = (
+        Field('free', 'bool', 'Признак бесплатной доставки'),
+        Field('deliveryIncluded', 'bool', 'Признак, что цена доставки включена в стоимость товара'),
+        Field('carried', 'bool', 'Признак наличия доставки'),
+        Field('pickup', 'bool', 'Признак возможности самовывоза заказа'),
+        Field('downloadable', 'bool', 'Признак, что товар можно скачать'),
+        Field('localStore', 'bool', 'Признак наличия торгового зала в регионе пользователя'),
+        Field('localDelivery', 'bool', 'Признак локальной доставки'),
+        Field('brief', 'str', 'Краткое описание условий доставки'),
+        Field('inStock', 'bool', 'Признак наличия товара'),
+        Field('is_global', 'bool', 'Признак трансграничной доставки', path='global'),
+        Field('price', 'YMShopPrice', 'Стоимость доставки в валюте заказа'),
+        Field('alternatePrice', 'YMShopPrice', 'Стоимость доставки в альтернативной или неденоминированной валюте'),
+        Field('shopRegion', 'YMRegion', 'Свой регион магазина'),
+        Field('userRegion', 'YMRegion', 'Регион пользователя'),
+        Field('description', 'str or None', 'Описание условий доставки'),
+        Field('options', 'list[YMDeliveryOption]', 'Информация о службах доставки, с которыми сотрудничает магазин'),
+        Field('pickupOptions', 'list[YMDeliveryPickupOption]', 'Информация об условиях самовывоза'),
+    )
 
-    @property
-    def block(self):
-        """
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-        :return: Корпус
-        :rtype: str or None
-        """
-        return self.data.get('block')
 
-    @property
-    def wing(self):
-        """
+class YMPaymentOption(YMBase):
+    __slots__ = ()
 
-        :return: Строение
-        :rtype: str or None
-        """
-        return self.data.get('wing')
+    FIELDS = (
+        Field('canPayByCard', 'bool', 'Оплата картой на Маркете'),
+    )
 
-    @property
-    def estate(self):
-        """
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-        :return: Владение
-        :rtype: str or None
-        """
-        return self.data.get('estate')
 
-    @property
-    def entrance(self):
-        """
+class YMOffer(YMBase):
+    __slots__ = ()
+
+    FIELDS = (
+        Field('id', 'str', 'Идентификатор предложения'),
+        Field('wareMd5', 'str', 'MD5 хеш-код предложения'),
+        Field('name', 'str', 'Название предложения'),
+        Field('promocode', 'bool or None', 'Признак, что товар можно купить с промокодом'),
+        Field('cpa', 'bool or None', 'Признак, что товар можно заказать на Яндекс.Маркете (в рамках программы «Заказ на Маркете»)'),
+        Field('url', 'str', 'URL товара на сайте магазина'),
+        Field('cpaUrl', 'str or None', 'URL карточки модели на Яндекс.Маркете'),
+        Field('outletUrl', 'str or None', 'URL карты со списком точек выдачи товара'),
+        Field('adult', 'bool or None', 'Признак, что предложение относится к интим-категории (18+)'),
+        Field('age', 'str or None', 'Возрастные ограничения для предложения'),
+        Field('onStock', 'bool or None', 'Признак наличия товара'),
+        Field('outletCount', 'int', 'Количество точек выдачи'),
+        Field('pickupCount', 'int', 'Количество точек самовывоза'),
+        Field('localStoreCount', 'int', 'Количество торговых залов в регионе пользователя'),
+        Field('warranty', 'bool', 'Признак наличия гарантии производителя'),
+        Field('recommended', 'bool', 'Признак наличия рекомендации производителя'),
+        Field('link', 'str or None', 'URL предложения на Яндекс.Маркете'),
+        Field('cartLink', 'str or None', 'URL для добавления предложения в корзину на Яндекс.Маркете'),
+        Field('offersLink', 'str or None', 'URL предложений на модификации модели в указанном магазине'),
+        Field('variationCount', 'int or None', 'Количество других предложений на указанный товар в магазине'),
+        Field('description', 'str', 'Описание предложения'),
+        Field('price', 'YMShopPrice', 'Информация о цене'),
+        Field('alternatePrice', 'YMShopPrice', 'Информация о цене в альтернативной валюте'),
+        Field('shop', 'YMShop', 'Информация о магазине, который разместил предложение'),
+        Field('model', 'int or None', 'Идентификатор модели', path='model.id'),
+        Field('phone', 'YMPhone', 'Номер телефона магазина'),
+        Field('photos', 'list[YMModelPhoto]', 'Изображения товара'),
+        Field('photo', 'YMModelPhoto', 'Основное изображение товара'),
+        Field('previewPhotos', 'list[YMModelPhoto]', 'Уменьшенные изображения товара'),
+        Field('activeFilters', 'list[YMFilter]', 'Параметры модели, по которым можно отфильтровать предложения на нее в поиске Яндекс.Маркета'),
+        Field('delivery', 'YMDelivery', 'Информация о доставке'),
+        Field('category', 'YMCategory', 'Информация о категории предложения'),
+        Field('vendor', 'YMVendor', 'Информация о производителе'),
+        Field('warning', 'str or None', 'Предупреждение, связанное с предложением'),
+        Field('warnings', 'list[YMModelWarning]', 'Код предупреждения, связанного с предложением'),
+        Field('paymentOptions', 'YMPaymentOption', 'Способы оплаты товара'),
+    )
 
-        :return: Подъезд
-        :rtype: str or None
-        """
-        return self.data.get('entrance')
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
 
-    @property
-    def floor(self):
-        """
 
-        :return: Этаж
-        :rtype: str or None
-        """
-        return self.data.get('floor')
+class YMStatisticsRegion(YMBase):
+    __slots__ = ()
 
-    @property
-    def room(self):
-        """
+    FIELDS = (
+        Field('id', 'int', 'Идентификатор региона'),
+        Field('offerCount', 'int', 'Количество товарных предложений модели в регионе'),
+        Field('price_max', 'str', 'Максимальная цена', path='price.price_max'),
+        Field('price_min', 'str', 'Минимальная цена', path='price.price_min'),
+        Field('price_median', 'str', 'Медиана по ценам', path='price.price_median'),
+    )
 
-        :return: Комната, офис
-        :rtype: str or None
-        """
-        return self.data.get('room')
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-    @property
-    def note(self):
-        """
 
-        :return: Примечание
-        :rtype: str or None
-        """
-        return self.data.get('note')
+class YMStatistics(YMBase):
+    __slots__ = ()
 
-    @property
-    def distance(self):
-        """
+    FIELDS = (
+        Field('regions', 'list[YMStatisticsRegion]', 'Список статистик по регионам'),
+    )
 
-        :return: Расстояние
-        :rtype: float or None
-        """
-        return self.data.get('geoPoint').get('distance')
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-    @property
-    def latitude(self):
-        """
 
-        :return: Широта
-        :rtype: float
-        """
-        return self.data.get('geoPoint', {}).get('coordinates', {}).get('latitude')
+class YMOpinionAuthorSocial(YMBase):
+    __slots__ = ()
 
-    @property
-    def longitude(self):
-        """
+    FIELDS = (
+        Field('type', 'str', 'Тип профиля'),
+        Field('url', 'str', 'Ссылка на профиль'),
+    )
 
-        :return: Долгота
-        :rtype: float
-        """
-        return self.data.get('geoPoint', {}).get('coordinates', {}).get('longitude')
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-    @property
-    def postcode(self):
-        """
 
-        :return: Почтовый индекс
-        :rtype: str or None
-        """
-        return self.data.get('postcode')
+class YMOpinionAuthor(YMBase):
+    __slots__ = ()
 
+    FIELDS = (
+        Field('name', 'str or None', 'Имя автора'),
+        Field('avatarUrl', 'str or None', 'Ссылка на аватар'),
+        Field('grades', 'int or None', 'Количество оценок'),
+        Field('visibility', 'str', 'Вариант отображения отзыва'),
+        Field('social', 'list[YMOpinionAuthorSocial]', 'Оиформация о профилях автора в социальных сетях'),
+    )
 
-class YMSchedule(YMBase):
     def __repr__(self):
         return '<{}>'.format(self.__class__.__name__)
 
-    @property
-    def daysFrom(self):
-        """
 
-        :return: День недели, определяет начало периода работы в рамках недели
-        :rtype: str
-        """
-        return self.data.get('daysFrom')
+class YMModelOpinionUser(YMBase):
+    __slots__ = ()
 
-    @property
-    def daysTill(self):
-        """
+    FIELDS = (
+        Field('id', 'int', 'Идентификатор автора комментария'),
+        Field('name', 'str', 'Имя автора комментария'),
+    )
 
-        :return: День недели, определяет окончание периода работы в рамках недели
-        :rtype: str
-        """
-        return self.data.get('daysTill')
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
 
-    @property
-    def timeFrom(self):
-        """
 
-        :return: Время суток, определяет начало периода работы в рамках дня
-        :rtype: str
-        """
-        return self.data.get('from')
+class YMOpinionComment(YMBase):
+    __slots__ = ()
+
+    FIELDS = (
+        Field('id', 'str', 'Идентификатор комментария'),
+        Field('rootId', 'str', 'Идентификатор корневого объекта, к которому относится комментарий'),
+        Field('parentId', 'str', 'Идентификатор родительского комментария или корневого объекта в дереве комментариев'),
+        Field('title', 'str', 'Заголовок комментария'),
+        Field('updateTimestamp', 'int', 'Timestamp времени последнего обновления комментария'),
+        Field('valid', 'bool', 'Комментарий действителен'),
+        Field('deleted', 'bool', 'Признак удаленного комментария'),
+        Field('blocked', 'bool', 'Комментарий заблокирован'),
+        Field('sticky', 'bool', 'Признак прикрепленного комментария'),
+        Field('body', 'str', 'Текст комментария'),
+        Field('user', 'YMModelOpinionUser', 'Информация об авторе комментария'),
+        Field('children', 'list[YMOpinionComment]', 'Список дочерних комментариев к данному в дереве комментариев'),
+    )
 
-    @property
-    def timeTill(self):
-        """
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.data.get('id'))
 
-        :return: Время суток, определяет окончание периода работы в рамках дня
-        :rtype: str
-        """
-        return self.data.get('till')
 
+class YMModelOpinionModel(YMBase):
+    __slots__ = ()
+
+    FIELDS = (
+        Field('id', 'int', 'Идентификатор модели'),
+        Field('name', 'str or None', 'Наименование модели'),
+    )
 
-class YMOutlet(YMBase):
     def __repr__(self):
         return '<{}>'.format(self.__class__.__name__)
 
-    @property
-    def id(self):
-        """
-
-        :return: Идентификатор торговой точки / пункта выдачи товара
-        :rtype: str
-        """
-        return self.data.get('id')
 
-    @property
-    def name(self):
-        """
+class YMModelOpinionShop(YMBase):
+    __slots__ = ()
 
-        :return: Наименование торговой точки / пункта выдачи товара
-        :rtype: str
-        """
-        return self.data.get('name')
+    FIELDS = (
+        Field('id', 'int', 'Идентификатор магазина'),
+        Field('name', 'str', 'Наименование магазина'),
+    )
 
-    @property
-    def type(self):
-        """
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-        :return: Тип торговой точки / пункта выдачи товара
-        :rtype: str
-        """
-        return self.data.get('type')
 
-    @property
-    def shop(self):
-        """
+class YMOpinion(YMBase):
+    __slots__ = ()
+
+    FIELDS = (
+        Field('id', 'int', 'Идентификатор отзыва'),
+        Field('date', 'str', 'Дата написания'),
+        Field('vote', 'bool or None', 'Мнение текущего пользователя об отзыве'),
+        Field('grade', 'int', 'Оценка'),
+        Field('rejectReason', 'str or None', 'Причина отклонения отзыва'),
+        Field('state', 'str or None', 'Статус отзыва'),
+        Field('agreeCount', 'int', 'Количество согласных с оценкой'),
+        Field('disagreeCount', 'int', 'Количество несоглазных с оценкой'),
+        Field('text', 'str or None', 'Текст отзыва'),
+        Field('pros', 'str or None', 'Описание достоинств'),
+        Field('cons', 'str or None', 'Описание недостатков'),
+        Field('author', 'YMOpinionAuthor', 'Информация об авторе'),
+        Field('comments', 'list[YMOpinionComment]', 'Комментарии'),
+        Field('region', 'YMRegion', 'Регион'),
+    )
 
-        :return: Информация о магазине, осуществляющем выдачу товара в данной торговой точке
-        :rtype: YMShop
-        """
-        return YMShop(self.data.get('shop'))
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-    @property
-    def phones(self):
-        """
 
-        :return: Список телефонов торговой точки / пункта выдачи товара
-        :rtype: list[YMPhone]
-        """
-        return [YMPhone(phone) for phone in self.data.get('phones', [])]
+class YMModelOpinion(YMOpinion):
+    __slots__ = ()
 
-    @property
-    def address(self):
-        """
+    FIELDS = (
+        Field('usageTime', 'str', 'Время использования модели'),
+        Field('verifiedBuyer', 'bool', 'Признак проверенного покупателя'),
+        Field('model', 'YMModelOpinionModel', 'Модель'),
+    )
 
-        :return: Адрес торговой точки / пункта выдачи товара
-        :rtype: YMAddress
-        """
-        return YMAddress(self.data.get('address'))
 
-    @property
-    def schedule(self):
-        """
+class YMShopOpinion(YMOpinion):
+    __slots__ = ()
 
-        :return: Расписание работы торговой точки / пункта выдачи товара
-        :rtype: list[YMSchedule]
-        """
-        return [YMSchedule(s) for s in self.data.get('schedule', [])]
+    FIELDS = (
+        Field('shopOrderId', 'str or None', 'Идентификатор заказа, относящегося к отзыву'),
+        Field('delivery', 'str', 'Способ покупки'),
+        Field('problem', 'str or None', 'Статус решения проблемы пользователя'),
+        Field('shop', 'YMModelOpinionShop', 'Магазин', path='model'),
+    )
 
-    @property
-    def distance(self):
-        """
 
-        :return: Расстояние
-        :rtype: float or None
-        """
-        return self.data.get('geoPoint', {}).get('distance')
+class YMAddress(YMBase):
+    __slots__ = ()
+
+    FIELDS = (
+        Field('regionId', 'int', 'Идентификатор региона, к которому относится данный адрес'),
+        Field('type', 'str or None', 'Тип региона, к которому относится данный адрес'),
+        Field('country', 'str or None', 'Наименование страны'),
+        Field('region', 'str or None', 'Наименование региона'),
+        Field('subRegion', 'str or None', 'Район внутри области'),
+        Field('locality', 'str', 'Наименование города, поселка, деревни и тд'),
+        Field('subLocality', 'str or None', 'Наименование района'),
+        Field('thoroughfare', 'str', 'Улица, проспект, км шоссе и тд'),
+        Field('premiseNumber', 'str or None', 'Номер дома, строение, участка и тд'),
+        Field('fullAddress', 'str', 'Полный адрес'),
+        Field('block', 'str or None', 'Корпус'),
+        Field('wing', 'str or None', 'Строение'),
+        Field('estate', 'str or None', 'Владение'),
+        Field('entrance', 'str or None', 'Подъезд'),
+        Field('floor', 'str or None', 'Этаж'),
+        Field('room', 'str or None', 'Комната, офис'),
+        Field('note', 'str or None', 'Примечание'),
+        Field('distance', 'float or None', 'Расстояние', path='geoPoint.distance'),
+        Field('latitude', 'float', 'Широта', path='geoPoint.coordinates.latitude'),
+        Field('longitude', 'float', 'Долгота', path='geoPoint.coordinates.longitude'),
+        Field('postcode', 'str or None', 'Почтовый индекс'),
+    )
 
-    @property
-    def latitude(self):
-        """
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-        :return: Широта
-        :rtype: float or None
-        """
-        return self.data.get('geoPoint', {}).get('coordinates', {}).get('latitude')
 
-    @property
-    def longitude(self):
-        """
+class YMSchedule(YMBase):
+    __slots__ = ()
 
-        :return: Долгота
-        :rtype: float or None
-        """
-        return self.data.get('geoPoint', {}).get('coordinates', {}).get('longitude')
+    FIELDS = (
+        Field('daysFrom', 'str', 'День недели, определяет начало периода работы в рамках недели'),
+        Field('daysTill', 'str', 'День недели, определяет окончание периода работы в рамках недели'),
+        Field('timeFrom', 'str', 'Время суток, определяет начало периода работы в рамках дня', path='from'),
+        Field('timeTill', 'str', 'Время суток, определяет окончание периода работы в рамках дня', path='till'),
+    )
 
-    @property
-    def offer(self):
-        """
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
-        :return: Товарное предложение в контексте запроса
-        :rtype: YMOffer
-        """
-        return YMOffer(self.data.get('offer'))
 
+class YMOutlet(YMBase):
+    __slots__ = ()
+
+    FIELDS = (
+        Field('id', 'str', 'Идентификатор торговой точки / пункта выдачи товара'),
+        Field('name', 'str', 'Наименование торговой точки / пункта выдачи товара'),
+        Field('type', 'str', 'Тип торговой точки / пункта выдачи товара'),
+        Field('shop', 'YMShop', 'Информация о магазине, осуществляющем выдачу товара в данной торговой точке'),
+        Field('phones', 'list[YMPhone]', 'Список телефонов торговой точки / пункта выдачи товара'),
+        Field('address', 'YMAddress', 'Адрес торговой точки / пункта выдачи товара'),
+        Field('schedule', 'list[YMSchedule]', 'Расписание работы торговой точки / пункта выдачи товара'),
+        Field('distance', 'float or None', 'Расстояние', path='geoPoint.distance'),
+        Field('latitude', 'float or None', 'Широта', path='geoPoint.coordinates.latitude'),
+        Field('longitude', 'float or None', 'Долгота', path='geoPoint.coordinates.longitude'),
+        Field('offer', 'YMOffer', 'Товарное предложение в контексте запроса'),
+    )
 
-class YMRedirect(YMBase):
     def __repr__(self):
         return '<{}>'.format(self.__class__.__name__)
 
-    @property
-    def type(self):
-        """
-
-        :return: Тип редиректа
-        :rtype: str
-        """
-        return self.data.get('type')
-
-    @property
-    def queryText(self):
-        """
 
-        :return: Текст оригинального запроса на редирект
-        :rtype: str
-        """
-        return self.data.get('queryText')
+class YMRedirect(YMBase):
+    __slots__ = ()
 
-    @property
-    def link(self):
-        """
+    FIELDS = (
+        Field('type', 'str', 'Тип редиректа'),
+        Field('queryText', 'str', 'Текст оригинального запроса на редирект'),
+        Field('link', 'str', 'Ссылка на данный редирект, направляющая на Яндекс.Маркет'),
+    )
 
-        :return: Ссылка на данный редирект, направляющая на Яндекс.Маркет
-        :rtype: str
-        """
-        return self.data.get('link')
+    def __repr__(self):
+        return '<{}>'.format(self.__class__.__name__)
 
 
 class YMRedirectModel(YMRedirect):
+    __slots__ = ()
 
-    @property
-    def model(self):
-        """
-
-        :return: Информация о модели
-        :rtype: YMModel
-        """
-        return YMModel(self.data.get('content').get('model'))
-
-    @property
-    def model_id(self):
-        """
-
-        :return: Идентификатор модели
-        :rtype: int
-        """
-        return self.data.get('model',{}).get('id')
+    FIELDS = (
+        Field('model', 'YMModel', 'Информация о модели', path='content.model'),
+        Field('model_id', 'int', 'Идентификатор модели', path='model.id'),
+    )
 
 
 class YMRedirectCatalog(YMRedirect):
+    __slots__ = ()
 
-    @property
+    FIELDS = (
+        Field('categories', 'list[YMSearchCategory]', 'Список категорий'),
+        Field('filters', 'list[YMFilter]', 'Фильтры'),
+        Field('sorts', 'list[YMSort]', 'Сортировки'),
+        Field('navigationNode', 'YMNavigationNode', 'Краткая информация об узле навигационного дерева'),
+        Field('criteria', 'list[YMDatasourceCriteria]', 'Список условий фильтрации, уточняющих поиск'),
+    )
+
+    @cached_property
     def items(self):
         """
 
@@ -3777,74 +1387,24 @@ class YMRedirectCatalog(YMRedirect):
         return [YMModel(item) if 'model' in item.keys() else YMOffer(item) for item in
                 self.data['content'].get('items', [])]
 
-    @property
-    def categories(self):
-        """
-
-        :return: Список категорий
-        :rtype: list[YMSearchCategory]
-        """
-        return [YMSearchCategory(category) for category in self.data.get('categories', [])]
-
-    @property
-    def filters(self):
-        """
-
-        :return: Фильтры
-        :rtype: list[YMFilter]
-        """
-        return [YMFilter(f) for f in self.data.get('filters', [])]
-
-    @property
-    def sorts(self):
-        """
-
-        :return: Сортировки
-        :rtype: list[YMSort]
-        """
-        return [YMSort(sort) for sort in self.data.get('sorts', [])]
-
-    @property
-    def navigationNode(self):
-        """
-
-        :return: Краткая информация об узле навигационного дерева
-        :rtype: YMNavigationNode
-        """
-        return YMNavigationNode(self.data.get('navigationNode'))
-
-    @property
-    def criteria(self):
-        """
-
-        :return: Список условий фильтрации, уточняющих поиск
-        :rtype: list[YMDatasourceCriteria]
-        """
-        return [YMDatasourceCriteria(c) for c in self.data.get('criteria', [])]
-
 
 class YMRedirectVendor(YMRedirect):
+    __slots__ = ()
 
-    @property
-    def vendor(self):
-        """
-
-        :return: Производитель
-        :rtype: YMVendor
-        """
-        return YMVendor(self.data.get('content').get('vendor'))
-
-    @property
-    def vendor_id(self):
-        """
-
-        :return: Идентификатор производителя
-        :rtype: int
-        """
-        return self.data.get('vendor',{}).get('id')
+    FIELDS = (
+        Field('vendor', 'YMVendor', 'Производитель', path='content.vendor'),
+        Field('vendor_id', 'int', 'Идентификатор производителя', path='vendor.id'),
+    )
 
 
 class YMRedirectSearch(YMRedirect):
+    __slots__ = ()
+
+    FIELDS = (
+        Field('filters', 'list[YMFilter]', 'Фильтры'),
+        Field('sorts', 'list[YMSort]', 'Сортировки'),
+        Field('criteria', 'list[YMDatasourceCriteria]', 'Список условий фильтрации, уточняющих поиск'),
+    )
 
     # @property
     # def items(self):
@@ -3856,75 +1416,26 @@ class YMRedirectSearch(YMRedirect):
     #     return [YMModel(item) if 'model' in item.keys() else YMOffer(item) for item in
     #             self.data['content'].get('items', [])]
 
-    @property
-    def filters(self):
-        """
-
-        :return: Фильтры
-        :rtype: list[YMFilter]
-        """
-        return [YMFilter(f) for f in self.data.get('filters', [])]
-
-    @property
-    def sorts(self):
-        """
-
-        :return: Сортировки
-        :rtype: list[YMSort]
-        """
-        return [YMSort(sort) for sort in self.data.get('sorts', [])]
-
-    @property
-    def criteria(self):
-        """
 
-        :return: Список условий фильтрации, уточняющих поиск
-        :rtype: list[YMDatasourceCriteria]
-        """
-        return [YMDatasourceCriteria(c) for c in self.data.get('criteria', [])]
+class YMSuggestion(YMBase):
+    __slots__ = ()
 
+    FIELDS = (
+        Field('value', 'str', 'Значение поисковой подсказки'),
+        Field('url', 'str or None', 'Ссылка на страницу соответствующую поисковой посдказке'),
+    )
 
-class YMSuggestion(YMBase):
     def __repr__(self):
         return '<{}>'.format(self.__class__.__name__)
 
-    @property
-    def value(self):
-        """
-
-        :return: Значение поисковой подсказки
-        :rtype: str
-        """
-        return self.data.get('value')
-
-    @property
-    def url(self):
-        """
 
-        :return: Ссылка на страницу соответствующую поисковой посдказке
-        :rtype: str or None
-        """
-        return self.data.get('url')
+class YMSuggestionCompletion(YMBase):
+    __slots__ = ()
 
+    FIELDS = (
+        Field('completion', 'str', 'Завершение фразы'),
+        Field('value', 'str', 'Фраза целиком после завершения'),
+    )
 
-class YMSuggestionCompletion(YMBase):
     def __repr__(self):
         return '<{}>'.format(self.__class__.__name__)
-
-    @property
-    def completion(self):
-        """
-
-        :return: Завершение фразы
-        :rtype: str
-        """
-        return self.data.get('completion')
-
-    @property
-    def value(self):
-        """
-
-        :return: Фраза целиком после завершения
-        :rtype: str
-        """
-        return self.data.get('value')
@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from collections import OrderedDict
+from email.utils import parsedate_tz, mktime_tz
+
+from YMContent.exceptions import NotAuthorized
+
+logger = logging.getLogger('YMContent')
+
+GLOBAL = 'Global'
+DAILY = 'Daily'
+METHOD = 'Method'
+FIELDS_ALL = 'Fields-All'
+
+
+def parse_http_date(value):
+    """
+    Разбор даты из заголовка HTTP
+
+    :param value: Дата, например 'Mon, 01 Jan 2018 00:00:00 GMT'
+    :type value: str
+
+    :return: Время в секундах от начала эпохи
+    :rtype: float or None
+    """
+    parsed = parsedate_tz(value) if value else None
+    return float(mktime_tz(parsed)) if parsed else None
+
+
+def is_fields_all(params):
+    """
+    Проверка, что запрос выполняется с fields=ALL
+
+    :rtype: bool
+    """
+    fields = (params or {}).get('fields')
+    if isinstance(fields, str):
+        fields = fields.split(',')
+    return any(field.strip() == 'ALL' for field in fields or [])
+
+
+class Bucket(object):
+    """
+    Квота одного ограничения: количество оставшихся запросов до момента обновления
+
+    Время обновления хранится в шкале часов ограничителя (:attr:`RateLimiter.clock`).
+    """
+
+    def __init__(self):
+        self.limit = None
+        self.remaining = None
+        self.until = 0.0
+
+    def delay(self, now):
+        if self.remaining is not None and self.remaining <= 0:
+            if now < self.until:
+                return self.until - now
+            self.remaining = self.limit
+        return 0.0
+
+    def take(self):
+        if self.remaining is not None:
+            self.remaining -= 1
+
+    def update(self, limit, remaining, until):
+        if until > self.until + 0.5 or self.remaining is None:
+            # новое окно ограничения
+            self.until = until
+            self.remaining = remaining
+        else:
+            self.until = max(self.until, until)
+            self.remaining = min(self.remaining, remaining)
+        self.limit = limit
+
+
+class RateLimiter(object):
+    """
+    Потокобезопасный ограничитель запросов по заголовкам X-RateLimit-*
+
+    Запрос ожидает до отправки, пока во всех подходящих квотах (глобальной, суточной, ресурсной и,
+    для fields=ALL, квоте запросов всех полей) не останется свободных запросов.
+    """
+
+    clock = staticmethod(time.monotonic)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def _keys(self, resource, fields_all):
+        keys = [(GLOBAL, None), (DAILY, None), (METHOD, resource)]
+        if fields_all:
+            keys.append((FIELDS_ALL, resource))
+        return keys
+
+    def _locked(self):
+        return self._lock
+
+    def _load(self, key):
+        return self._buckets.setdefault(key, Bucket())
+
+    def _save(self, key, bucket):
+        pass
+
+    def reserve(self, resource, fields_all=False):
+        """
+        Попытка занять место в квотах для запроса
+
+        :return: 0, если запрос можно отправлять, иначе время ожидания в секундах
+        :rtype: float
+        """
+        with self._locked():
+            now = self.clock()
+            keys = self._keys(resource, fields_all)
+            buckets = [self._load(key) for key in keys]
+            delay = max(bucket.delay(now) for bucket in buckets)
+            if delay <= 0:
+                for bucket in buckets:
+                    bucket.take()
+            for (key, bucket) in zip(keys, buckets):
+                self._save(key, bucket)
+            return delay
+
+    def rank(self, resource, fields_all=False):
+        """
+        Оценка доступности квот для запроса, не занимая места в них
+
+        :return: Кортеж (время ожидания, -оставшиеся суточные запросы, -оставшиеся запросы к ресурсу),
+            меньшее значение соответствует большему запасу
+        :rtype: tuple
+        """
+        with self._locked():
+            now = self.clock()
+            buckets = dict((key[0], self._load(key)) for key in self._keys(resource, fields_all))
+            delay = max(bucket.delay(now) for bucket in buckets.values())
+            return tuple([delay] + [-buckets[kind].remaining if buckets[kind].remaining is not None else -float('inf')
+                                    for kind in (DAILY, METHOD)])
+
+    def acquire(self, resource, fields_all=False):
+        """
+        Ожидание свободного места в квотах перед отправкой запроса
+        """
+        while True:
+            delay = self.reserve(resource, fields_all)
+            if delay <= 0:
+                return
+            logger.debug('Rate limit reached, sleeping %.3fs', delay)
+            time.sleep(delay)
+
+    def update(self, resource, headers, fields_all=False):
+        """
+        Обновление квот по заголовкам ответа
+        """
+        now = self.clock()
+        server_now = parse_http_date(headers.get('Date'))
+        with self._locked():
+            for key in self._keys(resource, fields_all):
+                kind = key[0]
+                try:
+                    limit = int(headers['X-RateLimit-{}-Limit'.format(kind)])
+                    remaining = int(headers['X-RateLimit-{}-Remaining'.format(kind)])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                until = parse_http_date(headers.get('X-RateLimit-{}-Until'.format(kind)))
+                if until is None:
+                    continue
+                # время обновления считается относительно часов сервера
+                until = now + until - (server_now if server_now is not None else time.time())
+                bucket = self._load(key)
+                bucket.update(limit, remaining, until)
+                self._save(key, bucket)
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    Ограничитель запросов, общий для всех процессов на одном хосте
+
+    Квоты хранятся в отображаемом в память файле и защищены блокировкой fcntl.flock, поэтому все
+    экземпляры YMAPI, использующие один и тот же файл, расходуют общую квоту. Доступен только на POSIX.
+
+    Ограничитель можно создать до fork (gunicorn --preload, celery prefork): унаследованный дескриптор
+    не дает взаимного исключения с родителем, поэтому в новом процессе файл открывается заново.
+
+    :param path: Путь к файлу квот, например '/tmp/ymcontent.quota'
+    :type path: str
+
+    :param slots: Количество квот в файле, должно быть больше количества используемых ресурсов
+    :type slots: int
+    """
+
+    clock = staticmethod(time.time)
+
+    _slot = struct.Struct('<Iqqd')
+
+    def __init__(self, path, slots=256):
+        import fcntl
+        super(SharedRateLimiter, self).__init__()
+        self._flock = fcntl.flock
+        self._lock_ex = fcntl.LOCK_EX
+        self._lock_un = fcntl.LOCK_UN
+        self.path = path
+        self.slots = slots
+        self._open()
+
+    def _open(self):
+        size = self._slot.size * self.slots
+        self._pid = os.getpid()
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._flock(self._fd, self._lock_ex)
+        try:
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+        finally:
+            self._flock(self._fd, self._lock_un)
+        self._mmap = mmap.mmap(self._fd, size)
+
+    def _reopen(self):
+        # блокировка потоков могла быть захвачена в родителе в момент fork
+        self._lock = threading.Lock()
+        self._mmap.close()
+        os.close(self._fd)
+        self._open()
+
+    @contextmanager
+    def _locked(self):
+        if self._pid != os.getpid():
+            self._reopen()
+        with self._lock:
+            self._flock(self._fd, self._lock_ex)
+            try:
+                yield
+            finally:
+                self._flock(self._fd, self._lock_un)
+
+    def _find(self, key):
+        name = '{}:{}'.format(*key).encode('utf-8')
+        tag = zlib.crc32(name) or 1
+        start = tag % self.slots
+        for i in range(self.slots):
+            offset = ((start + i) % self.slots) * self._slot.size
+            (slot_tag, limit, remaining, until) = self._slot.unpack_from(self._mmap, offset)
+            if slot_tag in (0, tag):
+                return offset, slot_tag, limit, remaining, until
+        raise RuntimeError('No free slots in "{}"'.format(self.path))
+
+    def _load(self, key):
+        (offset, tag, limit, remaining, until) = self._find(key)
+        bucket = Bucket()
+        if tag:
+            bucket.limit = None if limit < 0 else limit
+            bucket.remaining = None if remaining < 0 else remaining
+            bucket.until = until
+        return bucket
+
+    def _save(self, key, bucket):
+        offset = self._find(key)[0]
+        name = '{}:{}'.format(*key).encode('utf-8')
+        self._slot.pack_into(self._mmap, offset, zlib.crc32(name) or 1,
+                             -1 if bucket.limit is None else bucket.limit,
+                             -1 if bucket.remaining is None else max(bucket.remaining, 0),
+                             bucket.until)
+
+    def close(self):
+        self._mmap.close()
+        os.close(self._fd)
+
+
+class KeyPool(object):
+    """
+    Пул авторизационных ключей
+
+    Каждый запрос отправляется с ключом, у которого больше всего оставшихся суточных запросов и запросов
+    к ресурсу. Ключи с исчерпанной квотой не используются до времени ее обновления.
+
+    :param keys: Авторизационный ключ или список ключей
+    :type keys: str or list[str]
+
+    :param rate_limiter: Ограничитель запросов (только для одного ключа) или фабрика ограничителей,
+        которая принимает ключ. По умолчанию для каждого ключа создается :class:`RateLimiter`
+    :type rate_limiter: RateLimiter or callable
+    """
+
+    def __init__(self, keys, rate_limiter=None):
+        keys = [key for key in ([keys] if isinstance(keys, str) else keys or []) if key]
+        if not keys:
+            raise NotAuthorized(
+                "You must provide authorization key to access Yandex.Market API!")
+        if isinstance(rate_limiter, RateLimiter):
+            if len(keys) > 1:
+                raise ValueError('Each authorization key needs its own rate limiter, pass a factory instead')
+            limiter = rate_limiter
+            rate_limiter = lambda key: limiter
+        factory = rate_limiter or (lambda key: RateLimiter())
+        self.limiters = OrderedDict((key, factory(key)) for key in keys)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.limiters)
+
+    def __iter__(self):
+        return iter(self.limiters)
+
+    def reserve(self, resource, fields_all=False):
+        """
+        Выбор ключа для запроса и попытка занять место в его квотах
+
+        :return: Кортеж (ключ, время ожидания), время ожидания 0, если запрос можно отправлять
+        :rtype: tuple
+        """
+        with self._lock:
+            if len(self.limiters) == 1:
+                (key, limiter) = next(iter(self.limiters.items()))
+            else:
+                (key, limiter) = min(self.limiters.items(), key=lambda item: item[1].rank(resource, fields_all))
+            return key, limiter.reserve(resource, fields_all)
+
+    def remaining(self, resource, fields_all=False):
+        """
+
+        :return: Наибольший среди ключей остаток запросов к ресурсу или None, если он неизвестен
+        :rtype: int or None
+        """
+        with self._lock:
+            best = max(-limiter.rank(resource, fields_all)[2] for limiter in self.limiters.values())
+        return None if best == float('inf') else best
+
+    def acquire(self, resource, fields_all=False):
+        """
+        Ожидание ключа со свободным местом в квотах
+
+        :return: Ключ для запроса
+        :rtype: str
+        """
+        while True:
+            (key, delay) = self.reserve(resource, fields_all)
+            if delay <= 0:
+                return key
+            logger.debug('Rate limit reached for all keys, sleeping %.3fs', delay)
+            time.sleep(delay)
+
+    def update(self, key, resource, headers, fields_all=False):
+        """
+        Обновление квот ключа по заголовкам ответа
+        """
+        self.limiters[key].update(resource, headers, fields_all)
@@ -1,18 +1,17 @@
 # -*- coding: utf-8 -*-
 from YMContent.objects import *
 from datetime import datetime
-from time import sleep
 import logging
 
 logger = logging.getLogger('YMContent')
 
 
 class Base(object):
+    __slots__ = ('curl_command', 'headers', 'status_code', 'resp', '_cache')
+
     def __init__(self, data):
         (self.curl_command, self.headers, self.status_code, self.resp) = data
-        while datetime.utcnow() < self.next_request:
-            logger.debug('sleep')
-            sleep(1)
+        self._cache = None
 
     def json(self):
         """
@@ -28,7 +27,7 @@ class Base(object):
         :return: Эквивалент команды curl
         :rtype: str
         """
-        return self.curl_command
+        return str(self.curl_command)
 
     def is_ok(self):
         """
@@ -229,7 +228,7 @@ class Base(object):
         """
         return self.resp.get('context', {}).get('marketUrl')
 
-    @property
+    @cached_property
     def region(self):
         """
 
@@ -277,6 +276,19 @@ class Base(object):
 
 
 class Page(Base):
+    __slots__ = ()
+
+    _items = None
+
+    @property
+    def page_items(self):
+        """
+
+        :return: Элементы текущей страницы
+        :rtype: list
+        """
+        return getattr(self, self._items) if self._items else []
+
     @property
     def page_number(self):
         """
@@ -302,7 +314,7 @@ class Page(Base):
         :return: Количество страниц в результате
         :rtype: int
         """
-        return int(self.resp.get('context', {}).get('page', {}).get('count', 0))
+        return int(self.resp.get('context', {}).get('page', {}).get('total', 0))
 
     @property
     def page_last(self):
@@ -311,11 +323,20 @@ class Page(Base):
         :return: Признак последней страницы
         :rtype: bool
         """
-        return True if self.page_total == 0 else self.page_number == self.page_count
+        page = self.resp.get('context', {}).get('page', {})
+        if 'last' in page:
+            return bool(page['last'])
+        if not page.get('total'):
+            return True
+        return int(page.get('number', 1)) >= int(page['total'])
 
 
 class Categories(Page):
-    @property
+    __slots__ = ()
+
+    _items = 'categories'
+
+    @cached_property
     def categories(self):
         """
 
@@ -328,7 +349,9 @@ class Categories(Page):
 class Category(Base):
     """Категория"""
 
-    @property
+    __slots__ = ()
+
+    @cached_property
     def category(self):
         """
 
@@ -341,7 +364,9 @@ class Category(Base):
 class Filters(Base):
     """Фильтры"""
 
-    @property
+    __slots__ = ()
+
+    @cached_property
     def sorts(self):
         """
 
@@ -350,7 +375,7 @@ class Filters(Base):
         """
         return [YMSort(sort) for sort in self.resp.get('sorts')]
 
-    @property
+    @cached_property
     def filters(self):
         """
 
@@ -363,7 +388,9 @@ class Filters(Base):
 class Model(Base):
     """Модель"""
 
-    @property
+    __slots__ = ()
+
+    @cached_property
     def model(self):
         """
 
@@ -374,7 +401,11 @@ class Model(Base):
 
 
 class ModelReview(Page):
-    @property
+    __slots__ = ()
+
+    _items = 'reviews'
+
+    @cached_property
     def reviews(self):
         """
 
@@ -385,8 +416,9 @@ class ModelReview(Page):
 
 
 class Models(Base):
+    __slots__ = ()
 
-    @property
+    @cached_property
     def models(self):
         """
 
@@ -397,8 +429,11 @@ class Models(Base):
 
 
 class ModelOffers(Page):
+    __slots__ = ()
 
-    @property
+    _items = 'offers'
+
+    @cached_property
     def sorts(self):
         """
 
@@ -407,7 +442,7 @@ class ModelOffers(Page):
         """
         return [YMSort(sort) for sort in self.resp.get('sorts', [])]
 
-    @property
+    @cached_property
     def filters(self):
         """
 
@@ -416,7 +451,7 @@ class ModelOffers(Page):
         """
         return [YMFilter(f) for f in self.resp.get('filters', [])]
 
-    @property
+    @cached_property
     def offers(self):
         """
 
@@ -427,8 +462,9 @@ class ModelOffers(Page):
 
 
 class ModelOffersDefault(Base):
+    __slots__ = ()
 
-    @property
+    @cached_property
     def offer(self):
         """
 
@@ -439,8 +475,9 @@ class ModelOffersDefault(Base):
 
 
 class ModelOffersStat(Base):
+    __slots__ = ()
 
-    @property
+    @cached_property
     def statistics(self):
         """
 
@@ -451,8 +488,9 @@ class ModelOffersStat(Base):
 
 
 class Offer(Base):
+    __slots__ = ()
 
-    @property
+    @cached_property
     def offer(self):
         """
 
@@ -463,8 +501,11 @@ class Offer(Base):
 
 
 class ModelOpinions(Page):
+    __slots__ = ()
 
-    @property
+    _items = 'opinions'
+
+    @cached_property
     def opinions(self):
         """
 
@@ -475,8 +516,11 @@ class ModelOpinions(Page):
 
 
 class ShopOpinions(Page):
+    __slots__ = ()
 
-    @property
+    _items = 'opinions'
+
+    @cached_property
     def opinions(self):
         """
 
@@ -487,8 +531,9 @@ class ShopOpinions(Page):
 
 
 class Shop(Base):
+    __slots__ = ()
 
-    @property
+    @cached_property
     def shop(self):
         """
 
@@ -499,8 +544,9 @@ class Shop(Base):
 
 
 class Shops(Base):
+    __slots__ = ()
 
-    @property
+    @cached_property
     def shops(self):
         """
 
@@ -511,6 +557,7 @@ class Shops(Base):
 
 
 class ShopsSummary(Base):
+    __slots__ = ()
 
     @property
     def homeCount(self):
@@ -541,8 +588,11 @@ class ShopsSummary(Base):
 
 
 class Outlets(Page):
+    __slots__ = ()
 
-    @property
+    _items = 'outlets'
+
+    @cached_property
     def outlets(self):
         """
 
@@ -553,8 +603,11 @@ class Outlets(Page):
 
 
 class Regions(Page):
+    __slots__ = ()
 
-    @property
+    _items = 'regions'
+
+    @cached_property
     def regions(self):
         """
 
@@ -565,8 +618,9 @@ class Regions(Page):
 
 
 class Region(Base):
+    __slots__ = ()
 
-    @property
+    @cached_property
     def region(self):
         """
 
@@ -577,8 +631,11 @@ class Region(Base):
 
 
 class Suggests(Page):
+    __slots__ = ()
 
-    @property
+    _items = 'suggests'
+
+    @cached_property
     def suggests(self):
         """
 
@@ -589,8 +646,11 @@ class Suggests(Page):
 
 
 class Vendors(Page):
+    __slots__ = ()
 
-    @property
+    _items = 'vendors'
+
+    @cached_property
     def vendors(self):
         """
 
@@ -601,8 +661,9 @@ class Vendors(Page):
 
 
 class Vendor(Base):
+    __slots__ = ()
 
-    @property
+    @cached_property
     def vendor(self):
         """
 
@@ -613,8 +674,11 @@ class Vendor(Base):
 
 
 class Search(Page):
+    __slots__ = ()
 
-    @property
+    _items = 'items'
+
+    @cached_property
     def items(self):
         """
 
@@ -623,7 +687,7 @@ class Search(Page):
         """
         return [YMModel(item) if item['__type'] == 'model' else YMOffer(item) for item in self.resp.get('items', [])]
 
-    @property
+    @cached_property
     def categories(self):
         """
 
@@ -632,7 +696,7 @@ class Search(Page):
         """
         return [YMSearchCategory(category) for category in self.resp.get('categories', [])]
 
-    @property
+    @cached_property
     def sorts(self):
         """
 
@@ -643,8 +707,9 @@ class Search(Page):
 
 
 class Redirect(Page):
+    __slots__ = ()
 
-    @property
+    @cached_property
     def redirect(self):
         """
 
@@ -662,8 +727,9 @@ class Redirect(Page):
 
 
 class Suggestions(Base):
+    __slots__ = ()
 
-    @property
+    @cached_property
     def input(self):
         """
 
@@ -672,7 +738,7 @@ class Suggestions(Base):
         """
         return YMSuggestion(self.resp.get('suggestions', {}).get('input'))
 
-    @property
+    @cached_property
     def completions(self):
         """
 
@@ -681,7 +747,7 @@ class Suggestions(Base):
         """
         return [YMSuggestionCompletion(c) for c in self.resp.get('suggestions', {}).get('completions', [])]
 
-    @property
+    @cached_property
     def pages(self):
         """
 
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+import random
+import threading
+import time
+
+from YMContent.ratelimit import parse_http_date
+
+RETRY_STATUSES = (420, 429, 500, 502, 503, 504)
+
+THROTTLE_STATUSES = (420, 429)
+
+
+def reset_delay(headers):
+    """
+    Время до обновления исчерпанных квот по заголовкам X-RateLimit-*-Until
+
+    :return: Время ожидания в секундах или None, если ни одна квота не исчерпана
+    :rtype: float or None
+    """
+    server_now = parse_http_date(headers.get('Date')) or time.time()
+    delays = []
+    for kind in ('Global', 'Method', 'Fields-All', 'Daily'):
+        if headers.get('X-RateLimit-{}-Remaining'.format(kind)) == '0':
+            until = parse_http_date(headers.get('X-RateLimit-{}-Until'.format(kind)))
+            if until is not None:
+                delays.append(max(until - server_now, 0.0))
+    return max(delays) if delays else None
+
+
+class RetryBudget(object):
+    """
+    Общий бюджет повторных запросов
+
+    Каждый успешный запрос пополняет бюджет на ratio, каждый повтор расходует единицу. Бюджет не
+    превышает maximum, поэтому во время сбоя повторы прекращаются, а не умножают нагрузку.
+
+    :param ratio: Доля повторов относительно успешных запросов
+    :type ratio: float
+
+    :param minimum: Начальный запас повторов
+    :type minimum: float
+
+    :param maximum: Максимальный запас повторов
+    :type maximum: float
+    """
+
+    def __init__(self, ratio=0.2, minimum=10, maximum=100):
+        self.ratio = ratio
+        self.maximum = maximum
+        self.tokens = float(minimum)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self.tokens = min(float(self.maximum), self.tokens + self.ratio)
+
+    def withdraw(self):
+        """
+        :return: Разрешен ли повтор
+        :rtype: bool
+        """
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class RetryPolicy(object):
+    """
+    Политика повторных запросов
+
+    Повторяются сетевые ошибки и ответы с кодами из statuses. Задержка растет экспоненциально со
+    случайным разбросом, а при ответах 420 и 429 запрос ждет времени обновления исчерпанной квоты, если
+    оно не больше max_wait. Иначе, например при исчерпании суточной квоты, запрос не повторяется.
+
+    :param retries: Максимальное количество повторов
+    :type retries: int
+
+    :param backoff: Базовая задержка в секундах
+    :type backoff: float
+
+    :param max_backoff: Максимальная задержка в секундах
+    :type max_backoff: float
+
+    :param max_wait: Максимальное ожидание обновления квоты при ответах 420 и 429 в секундах, по умолчанию
+        max_backoff
+    :type max_wait: float or None
+
+    :param jitter: Случайный разброс задержки
+    :type jitter: bool
+
+    :param statuses: HTTP коды ответов, при которых запрос повторяется
+    :type statuses: tuple[int]
+
+    :param budget: Бюджет повторов, общий для всех ресурсов. False — без ограничения
+    :type budget: RetryBudget or bool
+
+    :param overrides: Политики для отдельных ресурсов, например {'models/{}/outlets': RetryPolicy(retries=0)}
+    :type overrides: dict
+    """
+
+    def __init__(self, retries=3, backoff=0.5, max_backoff=30, jitter=True, statuses=RETRY_STATUSES,
+                 budget=None, overrides=None, max_wait=None):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_wait = max_backoff if max_wait is None else max_wait
+        self.jitter = jitter
+        self.statuses = statuses
+        self.budget = RetryBudget() if budget is None else budget
+        self.overrides = overrides or {}
+        for policy in self.overrides.values():
+            policy.budget = self.budget
+
+    def for_resource(self, resource):
+        """
+
+        :return: Политика для ресурса
+        :rtype: RetryPolicy
+        """
+        return self.overrides.get(resource, self)
+
+    def delay(self, attempt, status_code=None, headers=None):
+        """
+        Задержка перед повтором
+
+        :param attempt: Номер неудачной попытки, начиная с 0
+        :type attempt: int
+
+        :param status_code: HTTP код ответа или None при сетевой ошибке
+        :type status_code: int
+
+        :param headers: Заголовки ответа
+        :type headers: dict
+
+        :return: Время ожидания в секундах или None, если запрос не нужно повторять
+        :rtype: float or None
+        """
+        if status_code is not None and status_code not in self.statuses:
+            return None
+        if attempt >= self.retries:
+            return None
+
+        reset = None
+        if status_code in THROTTLE_STATUSES and headers is not None:
+            reset = reset_delay(headers)
+            if reset is not None and reset > self.max_wait:
+                return None
+
+        if self.budget and not self.budget.withdraw():
+            return None
+        if reset is not None:
+            return reset
+
+        delay = min(float(self.max_backoff), self.backoff * 2 ** attempt)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def success(self):
+        """
+        Учет успешного запроса в бюджете повторов
+        """
+        if self.budget:
+            self.budget.deposit()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Время разбора JSON по ресурсам для установленных декодеров
+
+Запись ответов API (нужен токен в переменной окружения TOKEN)::
+
+    python benchmarks/decode.py --record benchmarks/payloads
+
+Замер на записанных ответах::
+
+    python benchmarks/decode.py benchmarks/payloads
+
+Без записанных ответов замер выполняется на синтетических ответах search и model_offers.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from YMContent import YMAPI
+from YMContent.decoding import available, get_decoder
+
+CATEGORY = 91491
+MODEL = 1732210983
+
+CALLS = (
+    ('categories', lambda api: api.categories(geo_id=213, fields='ALL')),
+    ('category', lambda api: api.category(CATEGORY, geo_id=213, fields='ALL')),
+    ('categories_filters', lambda api: api.categories_filters(CATEGORY, geo_id=213, fields='ALL')),
+    ('model', lambda api: api.model(MODEL, geo_id=213, fields='ALL')),
+    ('model_offers', lambda api: api.model_offers(MODEL, fields='ALL')),
+    ('model_opinions', lambda api: api.model_opinions(MODEL)),
+    ('geo_regions', lambda api: api.geo_regions(fields='ALL')),
+    ('vendors', lambda api: api.vendors(fields='ALL')),
+    ('search', lambda api: api.search('iphone', geo_id=213, fields='ALL')),
+)
+
+
+def record(directory):
+    os.makedirs(directory, exist_ok=True)
+    current = {}
+
+    def recorder(body):
+        with open(os.path.join(directory, current['name'] + '.json'), 'wb') as f:
+            f.write(body)
+        return json.loads(body)
+
+    api = YMAPI(os.environ['TOKEN'], decoder=recorder)
+    for (name, call) in CALLS:
+        current['name'] = name
+        call(api)
+        print('recorded', name)
+
+
+def synthetic():
+    offer = {
+        'id': 'yDpJekrrgZEW3cBdVxwvSA', 'wareMd5': 'yDpJekrrgZEW3cBdVxwvSA', 'name': 'Смартфон Apple iPhone X 64GB',
+        'description': 'Смартфон, iOS 11, экран 5.8", разрешение 2436x1125, камера 12 МП, память 64 Гб' * 3,
+        'price': {'value': '64990', 'discount': '10', 'base': '72210'},
+        'shopInfo': {'id': 1925, 'name': 'Shop', 'shopName': 'Shop', 'url': 'shop.ru', 'status': 'actual',
+                     'rating': 5, 'gradeTotal': 12345, 'regionId': 213, 'createdAt': '2009-06-10'},
+        'delivery': {'price': {'value': '0'}, 'free': True, 'deliveryIncluded': False, 'carried': True,
+                     'pickup': True, 'available': True, 'store': False, 'delivery': True, 'downloadable': False,
+                     'localStore': False, 'localDelivery': True, 'shopRegion': {'id': 213, 'name': 'Москва'},
+                     'userRegion': {'id': 213, 'name': 'Москва'},
+                     'options': [{'service': {'id': 99, 'name': 'Собственная служба'},
+                                  'conditions': {'price': {'value': '0'}, 'daysFrom': 1, 'daysTo': 2}}] * 3},
+        'photos': [{'width': 700, 'height': 700, 'url': 'https://avatars.mds.yandex.net/get-mpic/{}/orig'.format(i)}
+                   for i in range(5)],
+        'warranty': True, 'recommended': False, 'link': 'https://market.yandex.ru/offer/yDpJekrrgZEW3cBdVxwvSA',
+    }
+    context = {'region': {'id': 213, 'name': 'Москва'}, 'currency': {'id': 'RUR', 'name': 'руб.'},
+               'page': {'number': 1, 'count': 30, 'total': 10}, 'id': '1518018931013/3a8e6bd2', 'time': 'now'}
+    offers = [dict(offer, id=str(i)) for i in range(30)]
+    return {
+        'model_offers': json.dumps({'status': 'OK', 'context': context, 'offers': offers}).encode(),
+        'search': json.dumps({'status': 'OK', 'context': context,
+                              'items': [dict(item, __type='offer') for item in offers]}).encode(),
+    }
+
+
+def payloads(directory):
+    paths = sorted(glob.glob(os.path.join(directory, '*.json'))) if directory else []
+    if not paths:
+        print('no recorded payloads, using synthetic ones')
+        return synthetic()
+    result = {}
+    for path in paths:
+        with open(path, 'rb') as f:
+            result[os.path.splitext(os.path.basename(path))[0]] = f.read()
+    return result
+
+
+def bench(directory, number):
+    bodies = payloads(directory)
+    decoders = available()
+    print('{:<24}{:>10}'.format('resource', 'KB') + ''.join('{:>12}'.format(name + ' us') for name in decoders))
+    for (name, body) in sorted(bodies.items()):
+        row = '{:<24}{:>10.1f}'.format(name, len(body) / 1024.0)
+        for decoder in decoders:
+            loads = get_decoder(decoder)
+            row += '{:>12.1f}'.format(min(timeit.repeat(lambda: loads(body), number=number, repeat=5)) /
+                                      number * 1e6)
+        print(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('directory', nargs='?', help='Каталог с записанными ответами')
+    parser.add_argument('--record', metavar='DIRECTORY', help='Записать ответы API в каталог')
+    parser.add_argument('--number', type=int, default=200, help='Количество разборов в одном замере')
+    args = parser.parse_args()
+    if args.record:
+        record(args.record)
+    else:
+        bench(args.directory, args.number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Время импорта YMContent по данным ``python -X importtime``
+
+    python benchmarks/importtime.py [--runs 10] [--budget 8]
+
+Импорт выполняется в отдельных процессах после компиляции пакета в байт-код. Выводятся медианы общего
+времени импорта, времени модулей самого пакета (без requests и стандартной библиотеки) и самых медленных
+модулей пакета. Скрипт завершается с кодом 1, если время модулей пакета больше бюджета в миллисекундах
+или если при импорте загрузились модули, которые должны загружаться при первом обращении.
+"""
+import argparse
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = 'YMContent'
+LAZY = ('YMContent.objects', 'YMContent.response', 'YMContent.aio', 'YMContent.index', 'asyncio')
+
+
+def measure():
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + PACKAGE],
+                            cwd=ROOT, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        (own, cumulative, name) = line[len('import time:'):].split('|')
+        modules[name.strip()] = (int(own), int(cumulative))
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10, help='Количество запусков')
+    parser.add_argument('--budget', type=float, default=8.0,
+                        help='Допустимое время модулей пакета в миллисекундах')
+    parser.add_argument('--top', type=int, default=5, help='Количество самых медленных модулей в выводе')
+    args = parser.parse_args()
+
+    compileall.compile_dir(os.path.join(ROOT, PACKAGE), quiet=1)
+    runs = [measure() for i in range(args.runs)]
+
+    total = statistics.median(run[PACKAGE][1] for run in runs) / 1000.0
+    package = statistics.median(sum(own for (name, (own, cumulative)) in run.items()
+                                    if name.split('.')[0] == PACKAGE) for run in runs) / 1000.0
+    names = set(name for run in runs for name in run if name.split('.')[0] == PACKAGE)
+    slowest = sorted(((statistics.median(run.get(name, (0, 0))[0] for run in runs) / 1000.0, name)
+                      for name in names), reverse=True)[:args.top]
+    loaded = sorted(name for name in LAZY if any(name in run for run in runs))
+
+    print('runs               {}'.format(args.runs))
+    print('import YMContent   {:.1f} ms'.format(total))
+    print('package modules    {:.1f} ms (budget {:.1f} ms)'.format(package, args.budget))
+    for (elapsed, name) in slowest:
+        print('  {:<24}{:.1f} ms'.format(name, elapsed))
+    if loaded:
+        print('loaded eagerly     {}'.format(', '.join(loaded)))
+
+    if package > args.budget or loaded:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Память и время обхода предложений с обращением к вложенным объектам
+
+    python benchmarks/objects.py [--offers 100000] [--accesses 2]
+
+Для каждого предложения создается YMOffer и accesses раз читаются .shop.name и .price.value, как в
+типичном цикле обработки выдачи. Время измеряется без сохранения объектов, память — с сохранением
+всех YMOffer вместе с созданными вложенными объектами и отдельно для YMOffer без обращений к ним.
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from YMContent.objects import YMOffer
+
+
+def offer(i):
+    return {
+        'id': str(i),
+        'name': 'Offer {}'.format(i),
+        'price': {'value': str(1000 + i), 'discount': '5', 'base': str(1100 + i)},
+        'shop': {'id': i % 1000, 'name': 'Shop {}'.format(i % 1000), 'rating': 5},
+        'delivery': {'free': True},
+    }
+
+
+def walk(offers, accesses, objects=None):
+    total = 0
+    for data in offers:
+        item = YMOffer(data)
+        for i in range(accesses):
+            total += len(item.shop.name) + len(item.price.value)
+        if objects is not None:
+            objects.append(item)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--offers', type=int, default=100000, help='Количество предложений')
+    parser.add_argument('--accesses', type=int, default=2, help='Количество обращений к вложенным объектам')
+    args = parser.parse_args()
+
+    offers = [offer(i) for i in range(args.offers)]
+
+    started = time.perf_counter()
+    walk(offers, args.accesses)
+    elapsed = time.perf_counter() - started
+
+    objects = []
+    tracemalloc.start()
+    walk(offers, args.accesses, objects)
+    (current, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    bare = [YMOffer(data) for data in offers]
+    (empty, _) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del bare
+
+    print('offers             {}'.format(args.offers))
+    print('time               {:.3f} s'.format(elapsed))
+    print('retained objects   {:.1f} MB'.format(current / 1024.0 / 1024.0))
+    print('peak               {:.1f} MB'.format(peak / 1024.0 / 1024.0))
+    print('per offer          {:.0f} B'.format(current / float(args.offers)))
+    print('per bare offer     {:.0f} B'.format(empty / float(args.offers)))
+
+
+if __name__ == '__main__':
+    main()
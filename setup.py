@@ -6,6 +6,8 @@ setup(name='YMContent',
       description="Yandex.Market Content API SDK",
       long_description="""Yandex.Market Content API SDK""",
       classifiers=['Development Status :: 4 - Beta', 'Programming Language :: Python',
+                   'Programming Language :: Python :: 3', 'Programming Language :: Python :: 3 :: Only',
+                   'Programming Language :: Python :: 3.7', 'Programming Language :: Python :: 3.8',
                    'Topic :: Software Development :: Libraries'],
       # Get strings from http://pypi.python.org/pypi?%3Aaction=list_classifiers
       keywords='yandex market',
@@ -16,5 +18,7 @@ setup(name='YMContent',
       packages=['YMContent'],
       include_package_data=True,
       zip_safe=False,
+      python_requires='>=3.7',
       install_requires=['requests'],
+      extras_require={'async': ['aiohttp'], 'speedups': ['orjson']},
       )
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Общие средства тестов: локальный HTTP-сервер вместо API и ограничитель запросов с заданным ожиданием
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase
+
+import YMContent
+from YMContent.ratelimit import RateLimiter
+
+
+class JSONHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик запросов локального сервера, ответ формирует :meth:`respond` наследника
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def respond(self):
+        """
+
+        :return: HTTP код, JSON ответа (None — пустое тело) и заголовки ответа
+        :rtype: tuple
+        """
+        raise NotImplementedError
+
+    def do_GET(self):
+        (status, data, headers) = self.respond()
+        body = b'' if data is None else json.dumps(data).encode()
+        self.send_response(status)
+        for (name, value) in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ServerTestCase(TestCase):
+    """
+    Тесты с локальным сервером: на время теста YMContent.PROTOCOL и YMContent.DOMAIN указывают на него
+    """
+
+    handler = None
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self.handler)
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.addCleanup(setattr, YMContent, 'DOMAIN', YMContent.DOMAIN)
+        self.addCleanup(setattr, YMContent, 'PROTOCOL', YMContent.PROTOCOL)
+        YMContent.PROTOCOL, YMContent.DOMAIN = 'http', '127.0.0.1:{}'.format(self.server.server_port)
+
+
+class WaitingLimiter(RateLimiter):
+    """
+    Ограничитель, который перед первым запросом требует подождать wait секунд
+    """
+
+    def __init__(self, wait):
+        super().__init__()
+        self.wait = wait
+
+    def reserve(self, resource, fields_all=False):
+        (wait, self.wait) = (self.wait, 0)
+        return wait
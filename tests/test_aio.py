@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import gc
+import json
+import socket
+import threading
+import time
+from unittest import TestCase
+
+import YMContent
+from YMContent import AsyncYMAPI, response, BaseAPIError, CountParamError, NetworkAPIError
+from YMContent.aio import AiohttpTransport, AsyncTransport
+from YMContent.breaker import CircuitBreaker
+from YMContent.cache import CacheEntry, MemoryCache
+from YMContent.coalesce import request_key
+from YMContent.diagnostics import RequestRecorder
+from YMContent.hedging import HedgingPolicy
+from YMContent.retry import RetryPolicy
+from tests.helpers import WaitingLimiter
+
+HEADERS = {
+    'Date': 'Mon, 01 Jan 2018 00:00:00 GMT',
+    'X-RateLimit-Daily-Limit': '10000',
+    'X-RateLimit-Daily-Remaining': '9999',
+    'X-RateLimit-Daily-Until': 'Tue, 02 Jan 2018 00:00:00 GMT',
+    'X-RateLimit-Global-Limit': '10',
+    'X-RateLimit-Global-Remaining': '9',
+    'X-RateLimit-Global-Until': 'Mon, 01 Jan 2018 00:00:01 GMT',
+    'X-RateLimit-Method-Limit': '10',
+    'X-RateLimit-Method-Remaining': '9',
+    'X-RateLimit-Method-Until': 'Mon, 01 Jan 2018 00:00:01 GMT',
+}
+
+
+class StubTransport(AsyncTransport):
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+        self.delays = []
+
+    async def get(self, url, params, headers):
+        self.calls.append((url, params, headers))
+        if self.delays:
+            await asyncio.sleep(self.delays.pop(0))
+        path = url.split('/v2/', 1)[1]
+        route = self.routes[path]
+        (status_code, body) = route(params) if callable(route) else route
+        return status_code, HEADERS, json.dumps(body), url
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestAsyncYMAPI(TestCase):
+
+    def setUp(self):
+        self.transport = StubTransport({
+            'categories': (200, {'status': 'OK', 'context': {'page': {'number': 1, 'count': 30}},
+                                 'categories': [{'id': 90402, 'name': 'Авто'}]}),
+            'vendors': lambda params: (200, {
+                'status': 'OK', 'context': {'page': {'number': params['page'], 'count': params['count'], 'total': 3}},
+                'vendors': [{'id': params['page'] * 100 + i} for i in range(params['count'])]}),
+            'models/1': (404, {'status': 'ERROR', 'errors': [{'message': 'Model not found'}]}),
+        })
+        self.api = AsyncYMAPI('token', transport=self.transport)
+
+    def test_response_class(self):
+        result = run(self.api.categories(geo_id=213))
+        self.assertIsInstance(result, response.Categories)
+        self.assertEqual(result.categories[0].id, 90402)
+        (url, params, headers) = self.transport.calls[0]
+        self.assertEqual(params['geo_id'], 213)
+        self.assertEqual(headers['Authorization'], 'token')
+
+    def test_no_sync_transport(self):
+        api = AsyncYMAPI('token', transport=self.transport, hedging=HedgingPolicy(delay=0.01), cache=MemoryCache())
+        self.assertFalse(hasattr(api, 'session'))
+        self.assertIsNone(api._hedge_executor)
+        self.assertIsNone(api._refresh_executor)
+
+    def test_validation_before_request(self):
+        with self.assertRaises(CountParamError):
+            self.api.categories(geo_id=213, count=31)
+        self.assertEqual(self.transport.calls, [])
+
+    def test_api_error(self):
+        with self.assertRaises(BaseAPIError):
+            run(self.api.model(1, geo_id=213))
+
+    def test_map(self):
+        results = run(self.api.map('categories', [{'geo_id': 213}, {'geo_id': 213, 'count': 31}]))
+        self.assertIsInstance(results[0], response.Categories)
+        self.assertIsInstance(results[1], CountParamError)
+
+    def test_map_api_error(self):
+        results = run(self.api.map('model', [(1, 'CATEGORY', None, 213)]))
+        self.assertIsInstance(results[0], BaseAPIError)
+
+    def test_iter_items(self):
+        async def collect():
+            return [vendor.id async for vendor in self.api.iter_vendors(prefetch=True)]
+
+        ids = run(collect())
+        self.assertEqual(len(ids), 90)
+        self.assertEqual(ids[0], 100)
+        self.assertEqual(ids[-1], 329)
+        self.assertEqual([params['page'] for (url, params, headers) in self.transport.calls], [1, 2, 3])
+
+    def test_iter_pages_parallel(self):
+        async def collect():
+            return [page.page_number async for page in self.api.iter_pages('vendors', parallel=True)]
+
+        self.assertEqual(run(collect()), [1, 2, 3])
+
+    def test_adaptive_concurrency(self):
+        api = AsyncYMAPI('token', transport=self.transport, max_workers=4, concurrency=True)
+        results = run(api.map('categories', [{'geo_id': 213}] * 8))
+        self.assertEqual(len(results), 8)
+        metrics = api.concurrency.metrics()
+        self.assertEqual(metrics['in_flight'], 0)
+        self.assertEqual(metrics['successes'], 8)
+        self.assertGreater(metrics['limit'], 1)
+
+    def test_retry(self):
+        responses = [(503, {}), (200, {'status': 'OK', 'category': {'id': 1}})]
+        self.transport.routes['categories/1'] = lambda params: responses.pop(0)
+        api = AsyncYMAPI('token', transport=self.transport, retry=RetryPolicy(backoff=0))
+        self.assertEqual(run(api.category(1, geo_id=213)).category.id, 1)
+        self.assertEqual(len(self.transport.calls), 2)
+
+    def test_hedging(self):
+        self.transport.routes['suggestions'] = (200, {'status': 'OK', 'suggestions': {'input': {'value': 'a'}}})
+        self.transport.delays = [10, 0]
+        hedging = HedgingPolicy(delay=0.01)
+        api = AsyncYMAPI('token', transport=self.transport, hedging=hedging)
+        run(api.suggestions('a', geo_id=213))
+        self.assertEqual(len(self.transport.calls), 2)
+        self.assertEqual(hedging.metrics(), {'sent': 1, 'won': 1})
+
+    def test_cancelled_probe(self):
+        self.transport.routes['categories/1'] = (200, {'status': 'OK', 'category': {'id': 1}})
+        breaker = CircuitBreaker(failures=1, reset_timeout=0.01)
+        api = AsyncYMAPI('token', transport=self.transport, breaker=breaker, coalesce=False)
+        breaker.failure('categories/{}')
+        time.sleep(0.02)
+        self.transport.delays = [10]
+
+        async def scenario():
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(api.category(1, geo_id=213), 0.01)
+            return await api.category(1, geo_id=213)
+
+        self.assertEqual(run(scenario()).category.id, 1)
+        self.assertEqual(breaker.state('categories/{}'), 'closed')
+
+    def test_coalesce(self):
+        self.transport.delays = [0.01]
+        results = run(self.api.map('categories', [{'geo_id': 213}, {'geo_id': 213}, {'geo_id': 2}]))
+        self.assertIs(results[0].json(), results[1].json())
+        self.assertEqual(len(self.transport.calls), 2)
+        self.assertEqual(self.api.coalesce.shared, 1)
+
+    def test_stale_while_revalidate(self):
+        self.transport.routes['models/2/offers/stat'] = (200, {'status': 'OK', 'statistics': {'offersCount': 2}})
+        cache = MemoryCache()
+        api = AsyncYMAPI('token', transport=self.transport, cache=cache)
+
+        async def scenario():
+            key = request_key('models/{}/offers/stat', 2, {'geo_id': 213})
+            cache.set(key, CacheEntry(('curl', HEADERS, 200, {'statistics': {'offersCount': 1}}), 0))
+            cache.get(key).expires = time.time() - 1
+            stale = await api.model_offers_stat(2, geo_id=213)
+            await asyncio.sleep(0.01)
+            fresh = await api.model_offers_stat(2, geo_id=213)
+            return stale.json(), fresh.json()
+
+        (stale, fresh) = run(scenario())
+        self.assertEqual(stale['statistics']['offersCount'], 1)
+        self.assertEqual(fresh['statistics']['offersCount'], 2)
+        self.assertEqual(len(self.transport.calls), 1)
+
+    def test_refresh_tasks(self):
+        self.transport.routes['models/2/offers/stat'] = (200, {'status': 'OK', 'statistics': {'offersCount': 2}})
+        cache = MemoryCache()
+        api = AsyncYMAPI('token', transport=self.transport, cache=cache)
+        key = request_key('models/{}/offers/stat', 2, {'geo_id': 213})
+
+        async def scenario():
+            cache.set(key, CacheEntry(('curl', HEADERS, 200, {'statistics': {'offersCount': 1}}), 0))
+            cache.get(key).expires = time.time() - 1
+            self.transport.delays = [10]
+            await api.model_offers_stat(2, geo_id=213)
+            (task,) = api._refresh_tasks
+            gc.collect()
+            await asyncio.sleep(0.01)
+            self.assertFalse(task.done())
+            await api.close()
+            return task
+
+        task = run(scenario())
+        self.assertTrue(task.cancelled())
+        self.assertEqual(api._refresh_tasks, set())
+        self.assertTrue(cache.begin_refresh(key))
+
+    def test_recorder(self):
+        self.transport.routes['models/2/offers/stat'] = (200, {'status': 'OK', 'statistics': {'offersCount': 2}})
+        recorder = RequestRecorder(max_payload=8)
+        api = AsyncYMAPI('token', transport=self.transport, recorder=recorder, rate_limiter=WaitingLimiter(0.3))
+        result = run(api.model_offers_stat(2, geo_id=213))
+        self.assertIn('/v2/models/2/offers/stat', result.curl())
+        (entry,) = recorder.entries()
+        self.assertEqual((entry['resource'], entry['status_code'], len(entry['payload'])),
+                         ('models/{}/offers/stat', 200, 8))
+        self.assertLess(entry['elapsed'], 0.3)
+
+
+class TestAiohttpTransport(TestCase):
+
+    def setUp(self):
+        self.accepted = 0
+        self.server = socket.socket()
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(5)
+        threading.Thread(target=self.drop, daemon=True).start()
+        self.protocol, self.domain = YMContent.PROTOCOL, YMContent.DOMAIN
+        YMContent.PROTOCOL, YMContent.DOMAIN = 'http', '127.0.0.1:{}'.format(self.server.getsockname()[1])
+
+    def tearDown(self):
+        YMContent.PROTOCOL, YMContent.DOMAIN = self.protocol, self.domain
+        self.server.close()
+
+    def drop(self):
+        while True:
+            try:
+                (connection, address) = self.server.accept()
+            except OSError:
+                return
+            self.accepted += 1
+            connection.recv(65536)
+            connection.close()
+
+    def test_server_disconnected(self):
+        breaker = CircuitBreaker(failures=2)
+        transport = AiohttpTransport(timeout=5)
+        recorder = RequestRecorder()
+        api = AsyncYMAPI('token', transport=transport, retry=RetryPolicy(retries=1, backoff=0), breaker=breaker,
+                         recorder=recorder)
+
+        async def scenario():
+            try:
+                await api.category(1, geo_id=213)
+            finally:
+                await transport.close()
+
+        with self.assertRaises(NetworkAPIError):
+            run(scenario())
+        self.assertEqual([entry['status_code'] for entry in recorder.entries()], [None, None])
+        self.assertGreaterEqual(self.accepted, 2)
+        self.assertEqual(breaker.state('categories/{}'), 'open')
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from urllib.parse import urlparse
+
+from YMContent import YMAPI, BaseAPIError, FieldsParamError
+from YMContent.response import Category
+from tests.helpers import JSONHandler, ServerTestCase
+
+
+class CategoryHandler(JSONHandler):
+    delay = 0
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def respond(self):
+        category_id = int(urlparse(self.path).path.rsplit('/', 1)[1])
+        with self.lock:
+            CategoryHandler.in_flight += 1
+            CategoryHandler.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            CategoryHandler.in_flight -= 1
+        if category_id == 404:
+            return 404, {'status': 'ERROR', 'errors': [{'message': 'Category not found'}]}, {}
+        return 200, {'status': 'OK', 'category': {'id': category_id}}, {}
+
+
+class TestBatch(ServerTestCase):
+    handler = CategoryHandler
+
+    def setUp(self):
+        super(TestBatch, self).setUp()
+        CategoryHandler.delay = 0
+        CategoryHandler.max_in_flight = 0
+        self.api = YMAPI('token', max_workers=4)
+
+    def test_batch(self):
+        futures = self.api.batch([('category', (1,), {'geo_id': 213}),
+                                  (self.api.category, (2,), {'geo_id': 213})])
+        self.assertEqual([f.result().category.id for f in futures], [1, 2])
+        self.assertIsInstance(futures[0].result(), Category)
+
+    def test_map(self):
+        CategoryHandler.delay = 0.1
+        results = self.api.map('category', [{'category_id': i, 'geo_id': 213} for i in range(1, 9)])
+        self.assertEqual([result.category.id for result in results], list(range(1, 9)))
+        self.assertEqual(CategoryHandler.max_in_flight, 4)
+
+    def test_map_errors(self):
+        args = [(1, None, 213), (404, None, 213), {'category_id': 2, 'fields': 'X', 'geo_id': 213}]
+        results = self.api.map('category', args)
+        self.assertEqual(results[0].category.id, 1)
+        self.assertIsInstance(results[1], BaseAPIError)
+        self.assertEqual(str(results[1]), 'Category not found')
+        self.assertIsInstance(results[2], FieldsParamError)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import time
+from unittest import TestCase
+
+from YMContent import YMAPI, CircuitOpenError, NetworkAPIError
+from YMContent.retry import RetryPolicy
+from YMContent.breaker import CircuitBreaker
+from tests.helpers import JSONHandler, ServerTestCase, WaitingLimiter
+
+
+class TestCircuitBreaker(TestCase):
+
+    def test_opens_after_failures(self):
+        breaker = CircuitBreaker(failures=2)
+        breaker.before('models/{}/outlets')
+        breaker.failure('models/{}/outlets')
+        breaker.before('models/{}/outlets')
+        breaker.failure('models/{}/outlets')
+        self.assertEqual(breaker.state('models/{}/outlets'), 'open')
+        with self.assertRaises(CircuitOpenError):
+            breaker.before('models/{}/outlets')
+        breaker.before('models/{}')
+
+    def test_is_network_error(self):
+        self.assertTrue(issubclass(CircuitOpenError, NetworkAPIError))
+
+    def test_success_resets_failures(self):
+        breaker = CircuitBreaker(failures=2)
+        breaker.failure('models/{}')
+        breaker.success('models/{}')
+        breaker.failure('models/{}')
+        self.assertEqual(breaker.state('models/{}'), 'closed')
+
+    def test_latency(self):
+        breaker = CircuitBreaker(failures=1, latency=1)
+        breaker.success('models/{}', 0.5)
+        self.assertEqual(breaker.state('models/{}'), 'closed')
+        breaker.success('models/{}', 2)
+        self.assertEqual(breaker.state('models/{}'), 'open')
+
+    def test_half_open(self):
+        breaker = CircuitBreaker(failures=1, reset_timeout=0.01)
+        breaker.failure('models/{}')
+        time.sleep(0.02)
+        breaker.before('models/{}')
+        self.assertEqual(breaker.state('models/{}'), 'half-open')
+        with self.assertRaises(CircuitOpenError):
+            breaker.before('models/{}')
+        breaker.failure('models/{}')
+        self.assertEqual(breaker.state('models/{}'), 'open')
+        time.sleep(0.02)
+        breaker.before('models/{}')
+        breaker.success('models/{}')
+        self.assertEqual(breaker.state('models/{}'), 'closed')
+
+    def test_abort_releases_probe(self):
+        breaker = CircuitBreaker(failures=1, reset_timeout=0.01)
+        breaker.failure('models/{}')
+        time.sleep(0.02)
+        breaker.before('models/{}')
+        breaker.abort('models/{}')
+        self.assertEqual(breaker.state('models/{}'), 'half-open')
+        breaker.before('models/{}')
+        breaker.success('models/{}')
+        self.assertEqual(breaker.state('models/{}'), 'closed')
+        breaker.abort('models/{}')
+        self.assertEqual(breaker.state('models/{}'), 'closed')
+
+
+class CategoryHandler(JSONHandler):
+    status = 200
+    requests = 0
+
+    def respond(self):
+        CategoryHandler.requests += 1
+        return self.status, {'status': 'OK', 'category': {'id': 1, 'name': 'Авто'}}, {}
+
+
+class TestBreakerIntegration(ServerTestCase):
+    handler = CategoryHandler
+
+    def setUp(self):
+        super(TestBreakerIntegration, self).setUp()
+        CategoryHandler.status = 200
+        CategoryHandler.requests = 0
+
+    def test_latency_excludes_rate_limit_wait(self):
+        breaker = CircuitBreaker(failures=1, latency=0.2)
+        api = YMAPI('token', rate_limiter=WaitingLimiter(0.3), breaker=breaker)
+        self.assertEqual(api.category(1, geo_id=213).category.name, 'Авто')
+        self.assertEqual(breaker.state('categories/{}'), 'closed')
+
+    def test_opens_on_server_errors(self):
+        CategoryHandler.status = 503
+        breaker = CircuitBreaker(failures=2, reset_timeout=60)
+        api = YMAPI('token', retry=RetryPolicy(retries=1, backoff=0), breaker=breaker)
+        api.category(1, geo_id=213)
+        self.assertEqual(CategoryHandler.requests, 2)
+        self.assertEqual(breaker.state('categories/{}'), 'open')
+        with self.assertRaises(CircuitOpenError):
+            api.category(2, geo_id=213)
+        self.assertEqual(CategoryHandler.requests, 2)
+        CategoryHandler.status = 200
+        self.assertEqual(api.categories(geo_id=213).status_code, 200)
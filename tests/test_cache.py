@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import tempfile
+import time
+from unittest import TestCase, skipUnless
+
+from YMContent import YMAPI, BaseAPIError
+from YMContent.cache import CacheEntry, MemoryCache, SQLiteCache
+from YMContent.constants import CACHE_NEGATIVE_TTL, CACHE_TTL, RESOURCES
+from YMContent.coalesce import request_key
+from YMContent.diagnostics import CurlCommand
+from tests.helpers import JSONHandler, ServerTestCase
+
+
+def value(data=None, status_code=200):
+    return ('curl', {}, status_code, data or {'status': 'OK'})
+
+
+class TestMemoryCache(TestCase):
+
+    def test_ttl_policy(self):
+        cache = MemoryCache(ttl={'categories/{}': 60}, negative={})
+        key = request_key('categories/{}', 1, {'geo_id': 213})
+        self.assertEqual(cache.lookup(key, 'categories/{}'), (None, False))
+        cache.store(key, 'categories/{}', value())
+        self.assertEqual(cache.lookup(key, 'categories/{}')[0].value, value())
+        cache.store(key, 'models/{}', value())
+        self.assertEqual(cache.lookup(request_key('models/{}', 1, {}), 'models/{}'), (None, False))
+        self.assertEqual(cache.stats(), {'hits': 1, 'stale_hits': 0, 'negative_hits': 0, 'misses': 1,
+                                         'revalidations': 0, 'evictions': 0})
+
+    def test_expired(self):
+        cache = MemoryCache()
+        cache.set('key', CacheEntry(value(), 0))
+        self.assertEqual(cache.lookup('key', 'categories'), (None, False))
+
+    def test_stale_while_revalidate(self):
+        cache = MemoryCache(ttl={'models/{}/offers/default': 60}, stale={'models/{}/offers/default': 60})
+        cache.set('stale', CacheEntry(value(), time.time() - 30))
+        cache.set('expired', CacheEntry(value(), time.time() - 90))
+        (entry, refresh) = cache.lookup('stale', 'models/{}/offers/default')
+        self.assertEqual((entry.value, refresh), (value(), True))
+        self.assertEqual(cache.lookup('expired', 'models/{}/offers/default'), (None, False))
+        self.assertTrue(cache.begin_refresh('stale'))
+        self.assertFalse(cache.begin_refresh('stale'))
+        cache.end_refresh('stale')
+        self.assertTrue(cache.begin_refresh('stale'))
+
+    def test_errors_not_stored(self):
+        cache = MemoryCache()
+        cache.store('key', 'categories', value(status_code=503))
+        self.assertIsNone(cache.get('key'))
+
+    def test_negative(self):
+        cache = MemoryCache(ttl={}, negative={'models/{}': 60})
+        dead = request_key('models/{}', 1, {})
+        cache.store(dead, 'models/{}', value({'errors': [{'message': 'Model not found'}]}, 404))
+        cache.store(request_key('models/{}', 2, {}), 'models/{}', value())
+        self.assertEqual(cache.lookup(dead, 'models/{}')[0].value[2], 404)
+        self.assertEqual(cache.lookup(dead, 'models/{}')[0].value[2], 404)
+        self.assertEqual(cache.lookup(request_key('models/{}', 2, {}), 'models/{}'), (None, False))
+        self.assertEqual(cache.stats()['negative_hits'], 2)
+        self.assertEqual(cache.negative_stats('models/{}'), [(dead, 2)])
+        self.assertEqual(cache.negative_stats('offers/{}'), [])
+
+    def test_negative_ttl_shorter(self):
+        for (resource, ttl) in CACHE_NEGATIVE_TTL.items():
+            self.assertIn(resource, RESOURCES)
+            self.assertLess(ttl, CACHE_TTL.get(resource, 0), resource)
+
+    def test_lru_entries(self):
+        cache = MemoryCache(max_entries=2)
+        for key in ('a', 'b'):
+            cache.store(key, 'categories', value())
+        cache.get('a')
+        cache.store('c', 'categories', value())
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_lru_bytes(self):
+        cache = MemoryCache(max_bytes=100)
+        cache.store('a', 'categories', value({'text': 'x' * 60}), body=b'x' * 60)
+        cache.store('b', 'categories', value({'text': 'y' * 60}), body=b'y' * 60)
+        self.assertEqual(len(cache), 1)
+        self.assertLessEqual(cache.bytes, 100)
+
+    def test_request_key(self):
+        self.assertEqual(request_key('models/{}', 1, {'fields': ['A', 'B'], 'geo_id': 213}),
+                         request_key('models/{}', '1', {'geo_id': '213', 'fields': 'A,B'}))
+
+
+class TestSQLiteCache(TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'cache.sqlite')
+
+    def test_survives_restart(self):
+        key = request_key('categories/{}', 1, {'geo_id': 213})
+        SQLiteCache(self.path).store(key, 'categories/{}', value({'category': {'name': 'Авто'}}))
+        (entry, refresh) = SQLiteCache(self.path).lookup(key, 'categories/{}')
+        self.assertEqual(entry.value[3], {'category': {'name': 'Авто'}})
+        self.assertEqual(entry.value[1], {})
+
+    def test_raw_body(self):
+        body = b'{"category": {"name": "\xd0\x90\xd0\xb2\xd1\x82\xd0\xbe"}, "status": "OK"}'
+        cache = SQLiteCache(self.path)
+        cache.store('key', 'categories', value(json.loads(body.decode('utf-8'))), body=body)
+        self.assertEqual(cache._connection().execute('SELECT body, size FROM responses').fetchone(),
+                         (body, len(body)))
+        self.assertEqual(cache.size(), len(body))
+        self.assertEqual(SQLiteCache(self.path).get('key').value[3], {'category': {'name': 'Авто'}, 'status': 'OK'})
+
+    def test_authorization_not_stored(self):
+        command = CurlCommand({'Authorization': 'secret-key', 'Accept': '*/*'}, None, 'https://example.com')
+        cache = SQLiteCache(self.path)
+        cache.store('key', 'categories', (command, {}, 200, {'status': 'OK'}))
+        directory = os.path.dirname(self.path)
+        for name in os.listdir(directory):
+            with open(os.path.join(directory, name), 'rb') as f:
+                self.assertFalse(b'secret-key' in f.read(), name)
+        self.assertIn("'Authorization: ***'", SQLiteCache(self.path).get('key').value[0])
+
+    @skipUnless(hasattr(os, 'fork'), 'fork is required')
+    def test_reconnect_after_fork(self):
+        cache = SQLiteCache(self.path)
+        parent = cache._connection()
+        (read, write) = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                reconnected = cache._connection() is not parent
+                cache.store('child', 'categories', value({'pid': os.getpid()}))
+                os.write(write, b'1' if reconnected else b'0')
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+        self.assertEqual(os.read(read, 1), b'1')
+        self.assertIs(cache._connection(), parent)
+        self.assertIsNotNone(cache.get('child'))
+
+    def test_vacuum(self):
+        cache = SQLiteCache(self.path, max_bytes=100)
+        cache.set('expired', CacheEntry(value(), 0))
+        cache.store('a', 'categories', value({'text': 'x' * 60}))
+        cache.store('b', 'categories', value({'text': 'y' * 60}))
+        cache.vacuum()
+        self.assertIsNone(cache.get('expired'))
+        self.assertIsNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('b'))
+
+    def test_warm(self):
+        key = request_key('vendors', None, {'page': 1})
+        SQLiteCache(self.path).store(key, 'vendors', value())
+        SQLiteCache(self.path).store(request_key('categories', None, {}), 'categories', value())
+        cache = SQLiteCache(self.path)
+        self.assertEqual(cache.warm(['vendors']), 1)
+        self.assertIsNotNone(cache.memory.get(key))
+
+
+class ValidatorHandler(JSONHandler):
+    etag = '"v1"'
+    requests = []
+
+    def respond(self):
+        self.requests.append(dict(self.headers))
+        if self.headers.get('If-None-Match') == self.etag:
+            return 304, None, {'ETag': self.etag}
+        return 200, self.data(), {'ETag': self.etag, 'Last-Modified': 'Mon, 01 Jan 2018 00:00:00 GMT'}
+
+    @classmethod
+    def data(cls):
+        return {'status': 'OK', 'category': {'id': 1, 'name': cls.etag}}
+
+
+class TestConditionalRequests(ServerTestCase):
+    handler = ValidatorHandler
+
+    def setUp(self):
+        super(TestConditionalRequests, self).setUp()
+        ValidatorHandler.etag = '"v1"'
+        ValidatorHandler.requests = []
+        self.cache = MemoryCache(ttl={'categories/{}': 60}, stale={})
+        self.api = YMAPI('token', cache=self.cache)
+        self.key = request_key('categories/{}', 1, {'geo_id': 213})
+
+    def expire(self):
+        self.cache.get(self.key).expires = time.time() - 1
+
+    def test_not_modified(self):
+        self.assertEqual(self.api.category(1, geo_id=213).category.name, '"v1"')
+        self.expire()
+        self.assertEqual(self.api.category(1, geo_id=213).category.name, '"v1"')
+        self.assertEqual(ValidatorHandler.requests[1]['If-None-Match'], '"v1"')
+        self.assertEqual(ValidatorHandler.requests[1]['If-Modified-Since'], 'Mon, 01 Jan 2018 00:00:00 GMT')
+        self.assertTrue(self.cache.get(self.key).fresh())
+        self.assertEqual(self.cache.get(self.key).size, len(json.dumps(ValidatorHandler.data())))
+        self.assertEqual(self.cache.stats()['revalidations'], 1)
+
+    def test_negative(self):
+        self.api.category(1, geo_id=213)
+        self.cache.set(self.key, CacheEntry(('curl', {}, 404, {'errors': [{'message': 'Category not found'}]}),
+                                            time.time() + 60))
+        for i in range(2):
+            with self.assertRaises(BaseAPIError) as context:
+                self.api.category(1, geo_id=213)
+            self.assertEqual(str(context.exception), 'Category not found')
+        self.assertEqual(len(ValidatorHandler.requests), 1)
+        self.assertEqual(self.cache.negative_stats(), [(self.key, 2)])
+
+    def test_modified(self):
+        self.api.category(1, geo_id=213)
+        self.expire()
+        ValidatorHandler.etag = '"v2"'
+        self.assertEqual(self.api.category(1, geo_id=213).category.name, '"v2"')
+        self.assertEqual(self.cache.get(self.key).validators()['If-None-Match'], '"v2"')
+        self.assertEqual(self.cache.stats()['revalidations'], 0)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from unittest import TestCase
+
+from YMContent import YMAPI, NetworkAPIError
+from YMContent.cache import MemoryCache
+from YMContent.coalesce import SingleFlight
+from tests.helpers import JSONHandler, ServerTestCase
+
+
+class SlowHandler(JSONHandler):
+    requests = 0
+
+    def respond(self):
+        SlowHandler.requests += 1
+        time.sleep(0.2)
+        return 200, {'status': 'OK', 'category': {'id': 1, 'name': 'Авто'}}, {}
+
+
+class CountingCache(MemoryCache):
+    stores = 0
+
+    def store(self, *args, **kwargs):
+        self.stores += 1
+        return super(CountingCache, self).store(*args, **kwargs)
+
+
+class TestSingleFlight(TestCase):
+
+    def run_concurrently(self, flight, fn, count=4):
+        results = [None] * count
+
+        def call(i):
+            try:
+                results[i] = flight.do('key', fn)
+            except BaseException as e:
+                results[i] = e
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        return results
+
+    def test_shared_result(self):
+        flight = SingleFlight()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            time.sleep(0.1)
+            return object()
+
+        results = self.run_concurrently(flight, fn)
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(flight.shared, 3)
+        self.assertIsNot(flight.do('key', fn), results[0])
+
+    def test_shared_exception(self):
+        flight = SingleFlight()
+
+        def fn():
+            time.sleep(0.1)
+            raise NetworkAPIError()
+
+        results = self.run_concurrently(flight, fn)
+        self.assertTrue(all(isinstance(result, NetworkAPIError) for result in results))
+        self.assertEqual(flight.shared, 3)
+
+
+class TestCoalesceRequests(ServerTestCase):
+    handler = SlowHandler
+
+    def setUp(self):
+        super(TestCoalesceRequests, self).setUp()
+        SlowHandler.requests = 0
+
+    def test_map(self):
+        api = YMAPI('token')
+        results = api.map('category', [{'category_id': 1, 'geo_id': 213}, {'geo_id': 213, 'category_id': '1'},
+                                       {'category_id': 1, 'geo_id': 213}])
+        self.assertEqual(SlowHandler.requests, 1)
+        self.assertEqual(api.coalesce.shared, 2)
+        self.assertTrue(all(result.json() is results[0].json() for result in results))
+
+    def test_disabled(self):
+        api = YMAPI('token', coalesce=False)
+        api.map('category', [{'category_id': 1, 'geo_id': 213}] * 2)
+        self.assertEqual(SlowHandler.requests, 2)
+
+    def test_stored_once(self):
+        cache = CountingCache(ttl={'categories/{}': 60})
+        api = YMAPI('token', cache=cache)
+        results = api.map('category', [{'category_id': 1, 'geo_id': 213}] * 3)
+        self.assertEqual(SlowHandler.requests, 1)
+        self.assertEqual(api.coalesce.shared, 2)
+        self.assertEqual(cache.stores, 1)
+        self.assertEqual([result.category.id for result in results], [1, 1, 1])
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+import threading
+from unittest import TestCase
+
+from YMContent import NetworkAPIError
+from YMContent.concurrency import AIMDController
+
+
+class Result(object):
+
+    def __init__(self, remaining, limit=100):
+        self.global_remaining = remaining
+        self.global_limit = limit
+
+
+class TestAIMDController(TestCase):
+
+    def test_additive_increase(self):
+        controller = AIMDController(maximum=3)
+        for i in range(4):
+            controller.acquire()
+            controller.release(Result(90))
+        self.assertEqual(controller.limit, 3)
+        self.assertEqual(controller.metrics()['successes'], 4)
+
+    def test_multiplicative_decrease(self):
+        controller = AIMDController(maximum=10, initial=8)
+        controller.acquire()
+        controller.release(Result(10))
+        self.assertEqual(controller.limit, 4)
+        controller.acquire()
+        controller.release(error=NetworkAPIError())
+        self.assertEqual(controller.limit, 2)
+        for i in range(3):
+            controller.acquire()
+            controller.release(error=NetworkAPIError())
+        self.assertEqual(controller.limit, 1)
+        self.assertEqual(controller.metrics()['errors'], 4)
+
+    def test_unknown_result(self):
+        controller = AIMDController(initial=2)
+        controller.acquire()
+        controller.release()
+        controller.acquire()
+        controller.release(object())
+        self.assertEqual(controller.limit, 2.5)
+
+    def test_limit(self):
+        controller = AIMDController(initial=2)
+        self.assertTrue(controller.try_acquire())
+        self.assertTrue(controller.try_acquire())
+        self.assertFalse(controller.try_acquire())
+        acquired = threading.Event()
+
+        def acquire():
+            controller.acquire()
+            acquired.set()
+
+        threading.Thread(target=acquire, daemon=True).start()
+        self.assertFalse(acquired.wait(0.05))
+        controller.release()
+        self.assertTrue(acquired.wait(1))
+        self.assertEqual(controller.in_flight, 2)
+
+    def test_wrap(self):
+        controller = AIMDController(maximum=5, initial=4)
+
+        def fail():
+            raise NetworkAPIError()
+
+        with self.assertRaises(NetworkAPIError):
+            controller.wrap(fail)()
+        self.assertEqual(controller.limit, 2)
+        result = Result(50)
+        self.assertIs(controller.wrap(lambda: result)(), result)
+        self.assertEqual(controller.limit, 2.5)
+        self.assertEqual(controller.in_flight, 0)
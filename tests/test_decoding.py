@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+import json
+from unittest import TestCase
+
+from YMContent import YMAPI
+from YMContent.decoding import available, get_decoder
+
+BODY = '{"status": "OK", "model": {"id": 1, "name": "Модель"}}'.encode('utf-8')
+
+
+class TestDecoding(TestCase):
+
+    def test_available(self):
+        self.assertEqual(available()[-1], 'json')
+
+    def test_decoders(self):
+        for name in available():
+            self.assertEqual(get_decoder(name)(BODY), json.loads(BODY))
+
+    def test_default(self):
+        self.assertIs(get_decoder(json.loads), json.loads)
+        self.assertEqual(get_decoder()(BODY), json.loads(BODY))
+        with self.assertRaises(ValueError):
+            get_decoder('yaml')
+
+    def test_client(self):
+        self.assertIs(YMAPI('token', decoder='json').decode, json.loads)
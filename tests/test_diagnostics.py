@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import json
+import logging
+import os
+import tempfile
+from unittest import TestCase
+
+from YMContent import YMAPI
+from YMContent.diagnostics import CurlCommand, RequestRecorder
+
+
+class Headers(dict):
+    """Заголовки, которые считают обращения к items"""
+
+    rendered = 0
+
+    def items(self):
+        Headers.rendered += 1
+        return super(Headers, self).items()
+
+
+class TestCurlCommand(TestCase):
+
+    def test_lazy(self):
+        Headers.rendered = 0
+        command = CurlCommand(Headers({'Host': 'api.content.market.yandex.ru', 'Authorization': 'token'}), None,
+                              'https://api.content.market.yandex.ru/v2/models/1')
+        logger = logging.getLogger('YMContent')
+        self.addCleanup(logger.setLevel, logger.level)
+        logger.setLevel(logging.INFO)
+        YMAPI._process(command, {}, 200, {'status': 'OK'})
+        self.assertEqual(Headers.rendered, 0)
+        self.assertEqual(str(command), "curl -H 'Authorization: token' -H 'Host: api.content.market.yandex.ru' "
+                                       "-d '' 'https://api.content.market.yandex.ru/v2/models/1'")
+        str(command)
+        self.assertEqual(Headers.rendered, 1)
+
+
+class TestRequestRecorder(TestCase):
+
+    def test_capped(self):
+        recorder = RequestRecorder(max_entries=2, max_payload=10)
+        for i in range(3):
+            recorder.record('models/{}', 'curl {}'.format(i), 200, {'Date': 'now'}, b'{"status": "OK"}', 0.1)
+        recorder.record('offers/{}', 'https://host/v2/offers/1', None, None, None, 0.2)
+        entries = recorder.entries()
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(entries[0]['payload'], '{"status":')
+        self.assertTrue(entries[0]['truncated'])
+        self.assertEqual(entries[0]['size'], 16)
+        self.assertIsNone(entries[1]['status_code'])
+        self.assertEqual(recorder.entries('offers/{}')[0]['command'], 'https://host/v2/offers/1')
+
+    def test_dump(self):
+        recorder = RequestRecorder()
+        recorder.record('models/{}', CurlCommand({}, None, 'uri'), 404, {}, b'{}', 0.1)
+        path = os.path.join(tempfile.mkdtemp(), 'requests.jsonl')
+        recorder.dump(path)
+        with open(path) as f:
+            self.assertEqual(json.loads(f.readline())['command'], "curl -H  -d '' 'uri'")
+
+    def test_authorization_hidden(self):
+        recorder = RequestRecorder()
+        recorder.record('models/{}', CurlCommand({'Authorization': 'secret-key'}, None, 'uri'), 200, {}, b'{}', 0.1)
+        path = os.path.join(tempfile.mkdtemp(), 'requests.jsonl')
+        recorder.dump(path)
+        with open(path) as f:
+            dumped = f.read()
+        self.assertNotIn('secret-key', dumped)
+        self.assertIn("'Authorization: ***'", dumped)
+        self.assertNotIn('secret-key', recorder.entries()[0]['command'])
+        self.assertIn('secret-key', recorder.entries(authorization=True)[0]['command'])
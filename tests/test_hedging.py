@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+import time
+
+from YMContent import YMAPI
+from YMContent.hedging import HedgingPolicy
+from tests.helpers import JSONHandler, ServerTestCase, WaitingLimiter
+
+
+class SuggestionsHandler(JSONHandler):
+    delays = []
+    requests = 0
+
+    def respond(self):
+        SuggestionsHandler.requests += 1
+        if self.delays:
+            time.sleep(self.delays.pop(0))
+        return 200, {'status': 'OK', 'suggestions': {'input': {'value': 'a'}}}, {}
+
+
+class TestHedging(ServerTestCase):
+    handler = SuggestionsHandler
+
+    def setUp(self):
+        super(TestHedging, self).setUp()
+        SuggestionsHandler.delays = []
+        SuggestionsHandler.requests = 0
+
+    def test_hedge(self):
+        SuggestionsHandler.delays = [0.5, 0]
+        hedging = HedgingPolicy(delay=0.05)
+        api = YMAPI('token', hedging=hedging)
+        started = time.monotonic()
+        api.suggestions('a', geo_id=213)
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(SuggestionsHandler.requests, 2)
+        self.assertEqual(hedging.metrics(), {'sent': 1, 'won': 1})
+
+    def test_latency_excludes_rate_limit_wait(self):
+        hedging = HedgingPolicy(min_samples=1)
+        api = YMAPI('token', rate_limiter=WaitingLimiter(0.3), hedging=hedging)
+        api.suggestions('a', geo_id=213)
+        self.assertIsNotNone(hedging.hedge_delay('suggestions'))
+        self.assertLess(hedging.hedge_delay('suggestions'), 0.3)
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+import YMContent
+from YMContent import response, objects
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestLazyImport(TestCase):
+
+    def test_import(self):
+        code = ('import sys, YMContent; '
+                'print(",".join(m for m in ("YMContent.objects", "YMContent.response", "YMContent.aio", '
+                '"YMContent.index", "asyncio") if m in sys.modules))')
+        out = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT, universal_newlines=True)
+        self.assertEqual(out.strip(), '')
+
+    def test_attributes(self):
+        self.assertIs(YMContent.YMOffer, objects.YMOffer)
+        self.assertIs(YMContent.Categories, response.Categories)
+        from YMContent import Search, AsyncYMAPI, VendorIndex
+        self.assertIs(Search, response.Search)
+        self.assertEqual(AsyncYMAPI.__module__, 'YMContent.aio')
+        self.assertEqual(VendorIndex.__module__, 'YMContent.index')
+        with self.assertRaises(AttributeError):
+            YMContent.YMNothing
+
+    def test_star(self):
+        names = {}
+        exec('from YMContent import *', names)
+        for name in ('YMAPI', 'YMOffer', 'Models', 'BaseAPIError', 'RESOURCES', 'AsyncYMAPI', 'CategoryTree'):
+            self.assertIn(name, names)
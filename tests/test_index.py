@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+from unittest import TestCase
+
+from YMContent import CategoryTree, RegionIndex, VendorIndex, BaseAPIError, response
+from YMContent.objects import YMCategory, YMRegion, YMVendor
+
+
+def category(category_id, child_count=0, model_count=10):
+    return {'id': category_id, 'name': 'Category {}'.format(category_id), 'childCount': child_count,
+            'modelCount': model_count}
+
+
+def region(region_id, name, region_type, child_count=0, genitive=None):
+    return {'id': region_id, 'name': name, 'type': region_type, 'childCount': child_count,
+            'nameGenitive': genitive or name}
+
+
+class StubAPI(object):
+    """Клиент с деревьями категорий и регионов в памяти"""
+
+    max_workers = 4
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.calls = []
+
+    def iter_categories(self, **kwargs):
+        return self.iter_categories_children(None, **kwargs)
+
+    def iter_categories_children(self, category_id, **kwargs):
+        self.calls.append(category_id)
+        return [YMCategory(data) for data in self.tree[category_id]]
+
+    def iter_geo_regions(self, **kwargs):
+        return self.iter_geo_regions_children(None, **kwargs)
+
+    def iter_geo_regions_children(self, region_id, **kwargs):
+        self.calls.append(region_id)
+        return [YMRegion(dict(data)) for data in self.tree[region_id]]
+
+
+class TestCategoryTree(TestCase):
+
+    def setUp(self):
+        self.api = StubAPI({
+            None: [category(1, 2, 30), category(2)],
+            1: [category(11, 1, 20), category(12)],
+            11: [category(111, 0, 20)],
+        })
+
+    def test_lookups(self):
+        tree = CategoryTree(self.api)
+        self.assertEqual(len(tree), 5)
+        self.assertEqual(tree.category(111).name, 'Category 111')
+        self.assertIsNone(tree.category(999))
+        self.assertEqual(tree.depth(111), 2)
+        self.assertEqual([c.id for c in tree.roots()], [1, 2])
+        self.assertEqual([c.id for c in tree.children(1)], [11, 12])
+        self.assertEqual([c.id for c in tree.ancestors(111)], [11, 1])
+        self.assertEqual([c.id for c in tree.descendants(1)], [11, 111, 12])
+        self.assertEqual(tree.parent(11).id, 1)
+        self.assertEqual(sorted(self.api.calls, key=str), [1, 11, None])
+        tree.children(11)
+        self.assertEqual(len(self.api.calls), 3)
+
+    def test_persisted(self):
+        path = os.path.join(tempfile.mkdtemp(), 'categories.json')
+        CategoryTree(self.api, path=path).category(1)
+        tree = CategoryTree(StubAPI({}), path=path)
+        self.assertEqual([c.id for c in tree.ancestors(111)], [11, 1])
+        self.assertEqual(tree.depth(12), 1)
+
+    def test_refresh(self):
+        tree = CategoryTree(self.api)
+        tree.category(1)
+        self.api.calls = []
+        self.api.tree[None] = [category(1, 2, 31), category(2)]
+        self.api.tree[1] = [category(11, 1, 20), category(13)]
+        self.assertEqual(tree.refresh(), {1, 13})
+        self.assertEqual(self.api.calls, [None, 1])
+        self.assertEqual([c.id for c in tree.children(1)], [11, 13])
+        self.assertIsNone(tree.category(12))
+        self.assertEqual(tree.category(111).id, 111)
+
+
+class TestRegionIndex(TestCase):
+
+    def setUp(self):
+        self.api = StubAPI({
+            None: [region(225, 'Россия', 'COUNTRY', 2)],
+            225: [region(1, 'Москва и Московская область', 'SUBJECT_FEDERATION', 2),
+                  region(10, 'Нижегородская область', 'SUBJECT_FEDERATION', 1)],
+            1: [region(213, 'Москва', 'CITY', 1, 'Москвы'), region(214, 'Долгопрудный', 'CITY')],
+            10: [region(47, 'Нижний Новгород', 'CITY', 0, 'Нижнего Новгорода')],
+            213: [region(20279, 'Центральный административный округ', 'CITY_DISTRICT')],
+        })
+        self.index = RegionIndex(self.api)
+
+    def test_suggest(self):
+        self.assertEqual([r.id for r in self.index.suggest('моск')], [213, 1])
+        self.assertEqual([r.id for r in self.index.suggest('Москва')], [213, 1])
+        self.assertEqual([r.id for r in self.index.suggest('новг')], [47])
+        self.assertEqual([r.id for r in self.index.suggest('москвы')], [213])
+        self.assertEqual([r.id for r in self.index.suggest('моск', types='SUBJECT_FEDERATION')], [1])
+        self.assertEqual([r.id for r in self.index.suggest('моск', count=1)], [213])
+        self.assertEqual(self.index.suggest('лондон'), [])
+
+    def test_parent_chain(self):
+        moscow = self.index.suggest('Москва')[0]
+        self.assertEqual(moscow.parent.id, 1)
+        self.assertEqual(moscow.country.id, 225)
+        self.assertEqual([r.id for r in self.index.ancestors(20279)], [213, 1, 225])
+
+    def test_persisted(self):
+        path = os.path.join(tempfile.mkdtemp(), 'regions.json')
+        RegionIndex(self.api, path=path).region(213)
+        index = RegionIndex(StubAPI({}), path=path)
+        self.assertEqual(index.region(20279).parent.parent.name, 'Москва и Московская область')
+        self.assertEqual([r.id for r in index.suggest('долг')], [214])
+
+
+class VendorAPI(object):
+    """Клиент со списком производителей в памяти"""
+
+    def __init__(self, vendors):
+        self.vendors = vendors
+        self.matched = []
+
+    def iter_vendors(self, **kwargs):
+        return [YMVendor(data) for data in self.vendors]
+
+    def vendors_match(self, name, fields=None):
+        self.matched.append(name)
+        if name == 'unknown':
+            raise BaseAPIError('Vendor not found')
+        return response.Vendor(('curl', {}, 200, {'vendor': {'id': 0, 'name': name}}))
+
+
+class TestVendorIndex(TestCase):
+
+    def setUp(self):
+        self.api = VendorAPI([
+            {'id': 152826, 'name': 'Samsung', 'site': 'http://www.samsung.com'},
+            {'id': 153043, 'name': 'Hewlett-Packard'},
+            {'id': 153061, 'name': 'Apple'},
+            {'id': 152863, 'name': 'Sony'},
+        ])
+        self.index = VendorIndex(self.api)
+
+    def test_exact(self):
+        self.assertEqual(self.index.match('SAMSUNG ').id, 152826)
+        self.assertEqual(self.index.match('Hewlett Packard').id, 153043)
+        self.assertEqual(self.index.match('packard hewlett').id, 153043)
+        self.assertEqual(self.index.stats(), {'local': 3, 'remote': 0})
+
+    def test_fuzzy(self):
+        (vendor, score) = self.index.candidates('Samsng')[0]
+        self.assertEqual(vendor.id, 152826)
+        self.assertLess(score, 1)
+        self.assertEqual(self.index.match('Hewlet-Packard Inc').id, 153043)
+
+    def test_fallback(self):
+        self.assertEqual(self.index.match('Xiaomi').name, 'Xiaomi')
+        self.assertIsNone(self.index.match('unknown'))
+        self.assertIsNone(VendorIndex(self.api, fallback=False).match('Xiaomi'))
+        self.assertEqual(self.api.matched, ['Xiaomi', 'unknown'])
+
+    def test_persisted(self):
+        path = os.path.join(tempfile.mkdtemp(), 'vendors.json.gz')
+        VendorIndex(self.api, path=path).match('Sony')
+        index = VendorIndex(VendorAPI([]), path=path)
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index.match('apple').id, 153061)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+import inspect
+from unittest import TestCase
+
+from YMContent import objects, response
+from YMContent.objects import Field, YMBase, YMCategory, YMOffer, YMOutlet, YMRegion, YMSearchCategory, YMShop
+
+OUTLET = {
+    'id': '1', 'name': 'Пункт выдачи', 'type': 'PICKUP',
+    'geoPoint': {'distance': 1.5, 'coordinates': {'latitude': 55.7, 'longitude': 37.6}},
+    'shop': {'id': 1, 'name': 'Магазин'},
+    'phones': [{'number': '1'}, {'number': '2'}],
+}
+
+
+class TestSchema(TestCase):
+
+    def test_accessors(self):
+        outlet = YMOutlet(OUTLET)
+        self.assertEqual(outlet.name, 'Пункт выдачи')
+        self.assertEqual(outlet.latitude, 55.7)
+        self.assertEqual(outlet.distance, 1.5)
+        self.assertIsNone(YMOutlet({}).latitude)
+        self.assertIsNone(YMOutlet({'geoPoint': {'coordinates': None}}).longitude)
+        self.assertIs(YMCategory({}).adult, False)
+
+    def test_nested(self):
+        outlet = YMOutlet(OUTLET)
+        self.assertIsInstance(outlet.shop, YMShop)
+        self.assertIs(outlet.shop, outlet.shop)
+        self.assertEqual([phone.json() for phone in outlet.phones], OUTLET['phones'])
+        self.assertEqual(outlet.schedule, [])
+
+    def test_docs(self):
+        self.assertIsInstance(YMRegion.country, property)
+        self.assertEqual(inspect.getdoc(YMRegion.country),
+                         ':return: Страна, к которой относится регион\n:rtype: YMRegion or None')
+        doc = inspect.getdoc(YMRegion.id)
+        self.assertEqual(doc, ':return: Идентификатор региона\n:rtype: int\n\n225')
+        self.assertIn('* **CITY** — город', inspect.getdoc(YMRegion.type))
+
+    def test_schema(self):
+        names = [field.name for field in YMSearchCategory.schema()]
+        self.assertEqual(names[:2], ['id', 'name'])
+        self.assertEqual(names[-1], 'findCount')
+        self.assertEqual(YMBase.schema(), [])
+        field = Field('photos', 'list[YMModelPhoto]', 'Изображения')
+        self.assertEqual((field.nested, field.many), ('YMModelPhoto', True))
+
+    def test_validate(self):
+        region = {'id': 213, 'name': 'Москва', 'type': 'CITY', 'childCount': 14}
+        self.assertEqual(YMRegion(region).validate(), [])
+        problems = YMRegion(dict(region, id='213', type='TOWN', childCount=None,
+                                 country={'id': 225, 'name': 'Россия', 'type': 'COUNTRY'})).validate()
+        self.assertEqual(problems, ['YMRegion.id: expected int, got str',
+                                    "YMRegion.type: unexpected value 'TOWN'",
+                                    'YMRegion.childCount: missing',
+                                    'YMRegion.country.childCount: missing'])
+        self.assertIn('YMOutlet.phones[0]: expected object, got int', YMOutlet(dict(OUTLET, phones=[1])).validate())
+        problems = YMOffer({'promocode': None, 'cpa': 1, 'adult': True}).validate()
+        self.assertIn('YMOffer.cpa: expected bool or None, got int', problems)
+        self.assertFalse([p for p in problems if p.startswith(('YMOffer.promocode', 'YMOffer.adult'))])
+        self.assertIn('YMCategory.childCount: expected int, got bool', YMCategory({'childCount': True}).validate())
+
+    def test_columns(self):
+        offers = [{'id': '1', 'shop': {'name': 'A'}, 'price': {'value': '10'}},
+                  {'id': '2', 'price': {'value': '20'}}]
+        columns = YMOffer.columns([YMOffer(offers[0]), offers[1]], ['id', 'shop.name', 'price.value'])
+        self.assertEqual(columns, {'id': ['1', '2'], 'shop.name': ['A', None], 'price.value': ['10', '20']})
+        self.assertEqual(list(YMOutlet.columns([OUTLET])), ['id', 'name', 'type', 'distance', 'latitude', 'longitude'])
+        for name in ('phones', 'shop', 'shop.nothing', 'name.value'):
+            with self.assertRaises(ValueError):
+                YMOutlet.columns([OUTLET], [name])
+
+
+class TestCompact(TestCase):
+
+    def test_no_dict(self):
+        classes = [cls for module in (objects, response) for cls in vars(module).values()
+                   if isinstance(cls, type) and issubclass(cls, (YMBase, response.Base))]
+        self.assertGreater(len(classes), 50)
+        for cls in classes:
+            instance = cls(('curl', {}, 200, {})) if issubclass(cls, response.Base) else cls({})
+            self.assertFalse(hasattr(instance, '__dict__'), cls.__name__)
+
+    def test_memoized(self):
+        offer = YMOffer({'shop': {'id': 1, 'name': 'A'}})
+        self.assertIs(offer.shop, offer.shop)
+        categories = response.Categories(('curl', {}, 200, {'categories': [{'id': 1}]}))
+        self.assertIs(categories.categories, categories.categories)
+
+    def test_not_shared(self):
+        first = YMOffer({'shop': {'id': 1, 'name': 'A'}})
+        second = YMOffer({'shop': {'id': 2, 'name': 'B'}})
+        self.assertEqual((first.shop.name, second.shop.name), ('A', 'B'))
+        self.assertIsNot(first.shop, second.shop)
+        self.assertIsNot(YMOffer(first.data).shop, first.shop)
+        self.assertIs(YMOffer(first.data).shop.data, first.shop.data)
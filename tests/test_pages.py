@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+from YMContent import YMAPI
+from YMContent.response import Vendors
+from tests.helpers import JSONHandler, ServerTestCase
+
+
+class VendorsHandler(JSONHandler):
+    total = 3
+    pages = []
+    delay = 0
+    headers_sent = {}
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def respond(self):
+        query = parse_qs(urlparse(self.path).query)
+        (page, count) = (int(query['page'][0]), int(query['count'][0]))
+        with self.lock:
+            self.pages.append(page)
+            VendorsHandler.in_flight += 1
+            VendorsHandler.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay if page > 1 else 0)
+        with self.lock:
+            VendorsHandler.in_flight -= 1
+        return 200, {'status': 'OK', 'context': {'page': {'number': page, 'count': count, 'total': self.total}},
+                     'vendors': [{'id': page * 100 + i} for i in range(count)]}, self.headers_sent
+
+
+class TestPages(ServerTestCase):
+    handler = VendorsHandler
+
+    def setUp(self):
+        super(TestPages, self).setUp()
+        VendorsHandler.pages = []
+        VendorsHandler.total = 3
+        VendorsHandler.delay = 0
+        VendorsHandler.headers_sent = {}
+        VendorsHandler.max_in_flight = 0
+        self.api = YMAPI('token')
+
+    def test_page_last(self):
+        def page(**context):
+            return Vendors(('curl', {}, 200, {'context': {'page': context}}))
+
+        self.assertFalse(page(number=1, count=30, total=3).page_last)
+        self.assertTrue(page(number=3, count=30, total=3).page_last)
+        self.assertTrue(page(number=1, count=30, last=True).page_last)
+        self.assertTrue(page(count=30).page_last)
+        self.assertEqual(page(number=1, count=30, total=3).page_total, 3)
+
+    def test_iter_items(self):
+        ids = [vendor.id for vendor in self.api.iter_vendors()]
+        self.assertEqual(len(ids), 90)
+        self.assertEqual((ids[0], ids[-1]), (100, 329))
+        self.assertEqual(VendorsHandler.pages, [1, 2, 3])
+
+    def test_prefetch(self):
+        pages = self.api.iter_pages('vendors', prefetch=True)
+        self.assertEqual(next(pages).page_number, 1)
+        deadline = time.monotonic() + 5
+        while len(VendorsHandler.pages) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(VendorsHandler.pages, [1, 2])
+        self.assertEqual([page.page_number for page in pages], [2, 3])
+        self.assertEqual(VendorsHandler.pages, [1, 2, 3])
+
+    def test_parallel(self):
+        VendorsHandler.total = 5
+        VendorsHandler.delay = 0.1
+        pages = [page.page_number for page in self.api.iter_pages('vendors', parallel=True)]
+        self.assertEqual(pages, [1, 2, 3, 4, 5])
+        self.assertEqual(sorted(VendorsHandler.pages), [1, 2, 3, 4, 5])
+        self.assertEqual(VendorsHandler.max_in_flight, 4)
+
+    def test_parallel_workers(self):
+        VendorsHandler.total = 5
+        VendorsHandler.delay = 0.1
+        VendorsHandler.headers_sent = {'X-RateLimit-Method-Remaining': '2'}
+        pages = [page.page_number for page in self.api.iter_pages('vendors', parallel=True, max_workers=3)]
+        self.assertEqual(pages, [1, 2, 3, 4, 5])
+        self.assertEqual(VendorsHandler.max_in_flight, 2)
+
+    def test_parallel_stop(self):
+        VendorsHandler.total = 20
+        VendorsHandler.delay = 0.05
+        pages = self.api.iter_pages('vendors', parallel=True, max_workers=2)
+        self.assertEqual([next(pages).page_number for i in range(3)], [1, 2, 3])
+        pages.close()
+        time.sleep(0.2)
+        self.assertLessEqual(len(VendorsHandler.pages), 5)
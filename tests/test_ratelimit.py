@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+import multiprocessing
+import os
+import struct
+import tempfile
+import time
+from unittest import TestCase, skipUnless
+
+from YMContent import YMAPI, NotAuthorized
+from YMContent.ratelimit import KeyPool, RateLimiter, SharedRateLimiter, is_fields_all, parse_http_date
+
+
+def headers(remaining, until='Mon, 01 Jan 2018 00:00:02 GMT', kind='Global'):
+    return {
+        'Date': 'Mon, 01 Jan 2018 00:00:00 GMT',
+        'X-RateLimit-{}-Limit'.format(kind): '10',
+        'X-RateLimit-{}-Remaining'.format(kind): str(remaining),
+        'X-RateLimit-{}-Until'.format(kind): until,
+    }
+
+
+class TestRateLimiter(TestCase):
+
+    def test_parse_http_date(self):
+        self.assertEqual(parse_http_date('Thu, 01 Jan 1970 00:00:01 GMT'), 1.0)
+        self.assertIsNone(parse_http_date(None))
+
+    def test_is_fields_all(self):
+        self.assertTrue(is_fields_all({'fields': 'PHOTO, ALL'}))
+        self.assertTrue(is_fields_all({'fields': ['ALL']}))
+        self.assertFalse(is_fields_all({'fields': 'OFFER_ALL'}))
+        self.assertFalse(is_fields_all({}))
+
+    def test_unknown_quota(self):
+        limiter = RateLimiter()
+        self.assertEqual(limiter.reserve('models/{}'), 0)
+
+    def test_shared_quota(self):
+        limiter = RateLimiter()
+        limiter.update('models/{}', headers(2))
+        self.assertEqual(limiter.reserve('models/{}'), 0)
+        self.assertEqual(limiter.reserve('offers/{}'), 0)
+        delay = limiter.reserve('models/{}')
+        self.assertGreater(delay, 1.5)
+        self.assertLessEqual(delay, 2)
+
+    def test_method_quota(self):
+        limiter = RateLimiter()
+        limiter.update('models/{}', headers(0, kind='Method'))
+        self.assertGreater(limiter.reserve('models/{}'), 0)
+        self.assertEqual(limiter.reserve('offers/{}'), 0)
+
+    def test_fields_all_quota(self):
+        limiter = RateLimiter()
+        limiter.update('models/{}', headers(0, kind='Fields-All'), fields_all=True)
+        self.assertEqual(limiter.reserve('models/{}'), 0)
+        self.assertGreater(limiter.reserve('models/{}', fields_all=True), 0)
+
+    def test_stale_headers(self):
+        limiter = RateLimiter()
+        limiter.update('models/{}', headers(1))
+        limiter.update('models/{}', headers(5))
+        self.assertEqual(limiter.reserve('models/{}'), 0)
+        self.assertGreater(limiter.reserve('models/{}'), 0)
+
+
+class TestKeyPool(TestCase):
+
+    def test_no_keys(self):
+        with self.assertRaises(NotAuthorized):
+            KeyPool([])
+        for keys in ('', None, ['', None]):
+            with self.assertRaises(NotAuthorized):
+                KeyPool(keys)
+        with self.assertRaises(NotAuthorized):
+            YMAPI('')
+
+    def test_most_headroom(self):
+        pool = KeyPool(['first', 'second'])
+        pool.update('first', 'models/{}', headers(100, kind='Daily'))
+        pool.update('second', 'models/{}', headers(200, kind='Daily'))
+        self.assertEqual(pool.reserve('models/{}'), ('second', 0))
+
+    def test_exhausted_key(self):
+        pool = KeyPool(['first', 'second'])
+        pool.update('first', 'models/{}', headers(0, kind='Method'))
+        self.assertEqual([pool.reserve('models/{}')[0] for i in range(3)], ['second'] * 3)
+        self.assertEqual(pool.reserve('offers/{}')[0], 'first')
+
+    def test_shared_limiter_needs_factory(self):
+        with self.assertRaises(ValueError):
+            KeyPool(['first', 'second'], RateLimiter())
+
+
+class TestSharedRateLimiter(TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'quota')
+
+    def test_shared_between_instances(self):
+        first = SharedRateLimiter(self.path)
+        second = SharedRateLimiter(self.path)
+        first.update('models/{}', headers(2))
+        self.assertEqual(second.reserve('models/{}'), 0)
+        self.assertEqual(first.reserve('models/{}'), 0)
+        self.assertGreater(second.reserve('models/{}'), 0)
+        first.close()
+        second.close()
+
+    def test_shared_between_processes(self):
+        limiter = SharedRateLimiter(self.path)
+        limiter.update('models/{}', headers(3))
+        pool = multiprocessing.Pool(4)
+        delays = pool.map(reserve, [self.path] * 4)
+        pool.close()
+        self.assertEqual(sorted(delay > 0 for delay in delays), [False, False, False, True])
+        limiter.close()
+
+    @skipUnless(hasattr(os, 'fork'), 'fork is required')
+    def test_exclusion_after_fork(self):
+        import fcntl
+        limiter = SharedRateLimiter(self.path)
+        (read, write) = os.pipe()
+        # родитель держит блокировку файла, ребенок наследует дескриптор через fork
+        fcntl.flock(limiter._fd, fcntl.LOCK_EX)
+        pid = os.fork()
+        if pid == 0:
+            try:
+                limiter.reserve('models/{}')
+                os.write(write, struct.pack('d', time.time()))
+            finally:
+                os._exit(0)
+        time.sleep(0.3)
+        released = time.time()
+        fcntl.flock(limiter._fd, fcntl.LOCK_UN)
+        os.waitpid(pid, 0)
+        acquired = struct.unpack('d', os.read(read, 8))[0]
+        self.assertGreaterEqual(acquired, released)
+        limiter.close()
+
+
+def reserve(path):
+    limiter = SharedRateLimiter(path)
+    try:
+        return limiter.reserve('models/{}')
+    finally:
+        limiter.close()
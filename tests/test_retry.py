@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+from unittest import TestCase
+
+from YMContent.retry import RetryBudget, RetryPolicy, reset_delay
+
+
+class TestRetryPolicy(TestCase):
+
+    def test_backoff(self):
+        policy = RetryPolicy(retries=3, backoff=1, max_backoff=3, jitter=False)
+        self.assertEqual([policy.delay(attempt) for attempt in range(4)], [1, 2, 3, None])
+
+    def test_jitter(self):
+        policy = RetryPolicy(backoff=1, budget=False)
+        for i in range(20):
+            self.assertLessEqual(policy.delay(2), 4)
+
+    def test_statuses(self):
+        policy = RetryPolicy(jitter=False)
+        self.assertIsNone(policy.delay(0, 404))
+        self.assertEqual(policy.delay(0, 503), 0.5)
+
+    def test_throttle_waits_for_reset(self):
+        headers = {
+            'Date': 'Mon, 01 Jan 2018 00:00:00 GMT',
+            'X-RateLimit-Method-Remaining': '0',
+            'X-RateLimit-Method-Until': 'Mon, 01 Jan 2018 00:00:03 GMT',
+            'X-RateLimit-Global-Remaining': '5',
+            'X-RateLimit-Global-Until': 'Mon, 01 Jan 2018 00:00:09 GMT',
+        }
+        self.assertEqual(reset_delay(headers), 3)
+        self.assertEqual(RetryPolicy().delay(0, 420, headers), 3)
+
+    def test_throttle_gives_up_after_max_wait(self):
+        headers = {
+            'Date': 'Mon, 01 Jan 2018 00:00:00 GMT',
+            'X-RateLimit-Daily-Remaining': '0',
+            'X-RateLimit-Daily-Until': 'Tue, 02 Jan 2018 00:00:00 GMT',
+        }
+        budget = RetryBudget(minimum=1)
+        self.assertIsNone(RetryPolicy(budget=budget).delay(0, 429, headers))
+        self.assertEqual(budget.tokens, 1)
+        self.assertEqual(RetryPolicy(max_wait=24 * 3600).delay(0, 429, headers), 24 * 3600)
+
+    def test_overrides(self):
+        outlets = RetryPolicy(retries=0)
+        policy = RetryPolicy(overrides={'models/{}/outlets': outlets})
+        self.assertIs(policy.for_resource('models/{}/outlets'), outlets)
+        self.assertIs(policy.for_resource('models/{}'), policy)
+        self.assertIs(outlets.budget, policy.budget)
+        self.assertIsNone(outlets.delay(0))
+
+    def test_budget(self):
+        policy = RetryPolicy(retries=100, budget=RetryBudget(ratio=0.5, minimum=2))
+        self.assertIsNotNone(policy.delay(0))
+        self.assertIsNotNone(policy.delay(0))
+        self.assertIsNone(policy.delay(0))
+        policy.success()
+        policy.success()
+        self.assertIsNotNone(policy.delay(0))